@@ -0,0 +1,65 @@
+"""
+Compare the rendering latency of the xml serializer and the string
+serializer on the defxmlschema fixtures.
+
+Usage: python -m tests.benchmarks.serializers [rounds]
+"""
+import importlib
+import sys
+import timeit
+from typing import Any
+from typing import List
+from typing import Tuple
+
+from tests.benchmarks.slots import fixtures
+from tests.benchmarks.slots import samples
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers import XmlStringSerializer
+
+
+def documents() -> List[Tuple[str, Any]]:
+    """Parse the fixtures samples with the committed models."""
+    parser = XmlParser()
+    result = []
+    for schema, name in samples():
+        try:
+            module = importlib.import_module(
+                f"tests.fixtures.defxmlschema.{schema.stem}"
+            )
+        except ModuleNotFoundError:
+            continue
+
+        clazz = getattr(module, name)
+        result.append(
+            (schema.stem, parser.from_path(schema.with_suffix(".xml"), clazz))
+        )
+
+    return result
+
+
+def main(rounds: int):
+    serializers = {
+        "lxml": XmlSerializer(pretty_print=True),
+        "string": XmlStringSerializer(pretty_print=True),
+    }
+    totals = dict.fromkeys(serializers, 0.0)
+    print(f"Fixtures: {fixtures}")
+    for stem, obj in documents():
+        outputs = {key: value.render(obj) for key, value in serializers.items()}
+        if outputs["lxml"] != outputs["string"]:
+            raise AssertionError(f"{stem} renders differently.")
+
+        timings = []
+        for key, serializer in serializers.items():
+            seconds = timeit.timeit(lambda: serializer.render(obj), number=rounds)
+            totals[key] += seconds
+            timings.append(f"{key} {seconds / rounds * 1e6:7.1f}us")
+
+        print(f"{stem:>10}: {' '.join(timings)}")
+
+    print(f"   speedup: {totals['lxml'] / totals['string']:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,107 @@
+"""
+Compare the memory footprint of the plain and the slotted generated
+dataclasses on the defxmlschema fixtures.
+
+Usage: python -m tests.benchmarks.slots [copies]
+"""
+import gc
+import importlib
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from tests.conftest import read_root_name
+from xsdata.codegen.transformer import SchemaTransformer
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.logger import logger
+
+fixtures = Path(__file__).parent.parent.joinpath("fixtures", "defxmlschema")
+outputs = {"pydata": "plain", "pydata-slots": "slotted"}
+
+
+def samples() -> List[Tuple[Path, str]]:
+    """Return the schema paths and root class names of the fixtures with
+    a sample document."""
+    result = []
+    for schema in sorted(fixtures.glob("*.xsd")):
+        sample = schema.with_suffix(".xml")
+        name = read_root_name(sample) if sample.exists() else ""
+        if name:
+            result.append((schema, name))
+
+    return result
+
+
+def generate(schemas: List[Path], output: str, package: str):
+    """Generate the models of the given schemas in the current directory."""
+    for schema in schemas:
+        transformer = SchemaTransformer(output=output, print=False)
+        transformer.process([schema.as_uri()], package)
+
+
+def measure(package: str, copies: int) -> Tuple[int, Dict[str, str]]:
+    """Parse every sample the given times and return the allocated memory of
+    the object trees and the serialized samples."""
+    parser = XmlParser()
+    serializer = XmlSerializer(pretty_print=True)
+    documents = []
+    for schema, name in samples():
+        module = importlib.import_module(f"{package}.{schema.stem}")
+        documents.append((schema, getattr(module, name)))
+
+    rendered = {}
+    for schema, clazz in documents:
+        obj = parser.from_path(schema.with_suffix(".xml"), clazz)
+        rendered[schema.stem] = serializer.render(obj)
+
+    gc.collect()
+    tracemalloc.start()
+    objects = [
+        parser.from_path(schema.with_suffix(".xml"), clazz)
+        for _ in range(copies)
+        for schema, clazz in documents
+    ]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del objects
+    return size, rendered
+
+
+def main(copies: int):
+    logger.setLevel("ERROR")
+    schemas = [schema for schema, _ in samples()]
+    results = {}
+    cwd = os.getcwd()
+
+    with TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        sys.path.insert(0, tmp)
+        try:
+            for output, package in outputs.items():
+                generate(schemas, output, package)
+                results[package] = measure(package, copies)
+        finally:
+            sys.path.remove(tmp)
+            os.chdir(cwd)
+
+    plain, slotted = results["plain"], results["slotted"]
+    if plain[1] != slotted[1]:
+        raise AssertionError("The slotted models serialize differently.")
+
+    print(f"Documents: {len(schemas)} x {copies}")
+    for package, (size, _) in results.items():
+        print(f"{package:>8}: {size / 1024 / 1024:.2f} MiB")
+
+    print(f"   saved: {1 - slotted[0] / plain[0]:.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
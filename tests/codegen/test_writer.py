@@ -47,9 +47,11 @@ class CodeWriterTests(FactoryTestCase):
         writer.generators.pop(self.FAKE_NAME, False)
 
     def test_formats(self):
-        expected = ["pydata", "plantuml"]
+        expected = ["pydata", "pydata-slots", "plantuml"]
         self.assertEqual(expected, writer.formats)
         self.assertIsInstance(writer.get_format("pydata"), DataclassGenerator)
+        self.assertFalse(writer.get_format("pydata").slots)
+        self.assertTrue(writer.get_format("pydata-slots").slots)
 
     def test_register_generator(self):
         writer.register_format(self.FAKE_NAME, FakeGenerator())
@@ -1,4 +1,5 @@
 import importlib
+import io
 from pathlib import Path
 from typing import Type
 
@@ -7,8 +8,13 @@ from lxml import etree
 from xsdata.formats.dataclass.filters import class_name
 from xsdata.formats.dataclass.parsers import JsonParser
 from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.handlers import LxmlSaxHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlSaxHandler
 from xsdata.formats.dataclass.serializers import JsonSerializer
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers import XmlStringSerializer
+from xsdata.formats.dataclass.serializers.backends import EtreeBackend
 
 
 def load_class(output, clazz_name):
@@ -42,6 +48,10 @@ def validate_bindings(schema: Path, clazz: Type):
     __tracebackhide__ = True
 
     obj = XmlParser().from_path(schema.with_suffix(".xml"), clazz)
+    for handler in (LxmlSaxHandler(), XmlSaxHandler()):
+        parser = XmlParser(config=ParserConfig(handler=handler))
+        assert obj == parser.from_path(schema.with_suffix(".xml"), clazz)
+
     actual = JsonSerializer(indent=4).render(obj)
 
     expected = schema.with_suffix(".json")
@@ -52,6 +62,12 @@ def validate_bindings(schema: Path, clazz: Type):
         expected.write_text(actual)
 
     xml = XmlSerializer(pretty_print=True).render(obj)
+    assert xml == XmlSerializer(pretty_print=True, backend=EtreeBackend()).render(obj)
+    assert xml == XmlStringSerializer(pretty_print=True).render(obj)
+
+    target = io.BytesIO()
+    XmlSerializer(pretty_print=True).write(obj, target)
+    assert xml == target.getvalue().decode()
 
     validator = etree.XMLSchema(etree.parse(str(schema)))
     assert validator.validate(etree.fromstring(xml.encode())), validator.error_log
@@ -62,6 +62,12 @@ class DefaultImportsTests(TestCase):
         expected = "from typing import Dict, Optional, Union"
         self.assertIn(expected, default_imports(output))
 
+    def test_default_imports_with_slotted(self):
+        output = " @slotted "
+
+        expected = "from xsdata.formats.dataclass.slots import slotted"
+        self.assertIn(expected, default_imports(output))
+
     def test_default_imports_combo(self):
         output = """@dataclass
 class Foo:
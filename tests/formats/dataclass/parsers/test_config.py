@@ -0,0 +1,50 @@
+from unittest.case import TestCase
+
+from lxml.etree import QName
+
+from xsdata.formats.dataclass.models.elements import XmlElement
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
+
+
+class ProjectionTests(TestCase):
+    def test_create_with_paths(self):
+        actual = Projection.create(["a.b.c", "a.d", "a.b", "e"])
+        expected = Projection(
+            fields={"a": Projection(fields={"b": None, "d": None}), "e": None}
+        )
+
+        self.assertEqual(expected, actual)
+        self.assertIs(actual, Projection.create(actual))
+
+    def test_create_with_predicate(self):
+        actual = Projection.create(callable)
+        self.assertEqual(Projection(predicate=callable), actual)
+
+    def test_add_raises_exception_on_empty_names(self):
+        with self.assertRaises(ValueError) as cm:
+            Projection.create(["a..b"])
+
+        self.assertEqual("Invalid projection path: `a..b`", str(cm.exception))
+
+    def test_includes_and_subset(self):
+        a = XmlElement(name="a", qname=QName("a"))
+        b = XmlElement(name="b", qname=QName("b"))
+        projection = Projection.create(["a.b"])
+
+        self.assertTrue(projection.includes(a))
+        self.assertFalse(projection.includes(b))
+        self.assertEqual(Projection(fields={"b": None}), projection.subset(a))
+
+        projection = Projection.create(lambda x: x.name == "a")
+        self.assertTrue(projection.includes(a))
+        self.assertFalse(projection.includes(b))
+        self.assertIs(projection, projection.subset(a))
+
+
+class ParserConfigTests(TestCase):
+    def test_post_init(self):
+        self.assertIsNone(ParserConfig().projection)
+
+        config = ParserConfig(projection={"a"})
+        self.assertEqual(Projection(fields={"a": None}), config.projection)
@@ -0,0 +1,218 @@
+import io
+from unittest.case import TestCase
+
+from lxml.etree import Element
+from lxml.etree import SubElement
+
+from xsdata.exceptions import ParserError
+from xsdata.formats.dataclass.parsers.handlers import ExpatPushParser
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlPushParser
+from xsdata.formats.dataclass.parsers.handlers import LxmlSaxHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlTargetPushParser
+from xsdata.formats.dataclass.parsers.handlers import read_events
+from xsdata.formats.dataclass.parsers.handlers import SaxElement
+from xsdata.formats.dataclass.parsers.handlers import SaxTarget
+from xsdata.formats.dataclass.parsers.handlers import split_documents
+from xsdata.formats.dataclass.parsers.handlers import split_parts
+from xsdata.formats.dataclass.parsers.handlers import XmlSaxHandler
+from xsdata.models.enums import EventType
+
+
+def summarize(events):
+    result = []
+    for event, element in events:
+        if event == EventType.START_NS:
+            result.append((event, element))
+        elif event == EventType.START:
+            result.append((event, element.tag, dict(element.attrib), element.nsmap))
+        else:
+            result.append((event, element.tag, element.text, element.tail))
+    return result
+
+
+class LxmlEventHandlerTests(TestCase):
+    def test_release(self):
+        root = Element("root")
+        for tag in "abcd":
+            SubElement(root, tag)
+
+        handler = LxmlEventHandler()
+        handler.release(root)
+        self.assertEqual(4, len(root))
+
+        handler.release(root[2])
+        self.assertEqual(["d"], [child.tag for child in root])
+
+
+class LxmlSaxHandlerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.xml = (
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<a xmlns="urn:a" xmlns:b="urn:b" b:c="1">txt<!-- comment -->'
+            b"<b:d>value</b:d>tail"
+            b'<e xmlns:f="urn:f" f:g="2"/>'
+            b"</a>"
+        )
+
+    def test_events_match_lxml_event_handler(self):
+        expected = summarize(LxmlEventHandler().events(io.BytesIO(self.xml)))
+
+        for chunk_size in (1, 7, 64 * 1024):
+            handler = LxmlSaxHandler(chunk_size=chunk_size)
+            actual = summarize(handler.events(io.BytesIO(self.xml)))
+            self.assertEqual(expected, actual)
+
+    def test_events_with_empty_source(self):
+        handler = LxmlSaxHandler()
+        self.assertEqual([], list(handler.events(io.BytesIO(b""))))
+
+
+class XmlSaxHandlerTests(TestCase):
+    def test_events_match_lxml_event_handler(self):
+        xml = (
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<a xmlns="urn:a" xmlns:b="urn:b" b:c="1" d="2">txt<!-- comment -->'
+            b"<b:d>value</b:d>tail"
+            b'<e xmlns:f="urn:f" f:g="2" xml:lang="en"/>'
+            b"</a>"
+        )
+        expected = summarize(LxmlEventHandler().events(io.BytesIO(xml)))
+
+        for chunk_size in (1, 7, 64 * 1024):
+            handler = XmlSaxHandler(chunk_size=chunk_size)
+            actual = summarize(handler.events(io.BytesIO(xml)))
+            self.assertEqual(expected, actual)
+
+    def test_events_with_malformed_source(self):
+        handler = XmlSaxHandler()
+        with self.assertRaises(ParserError):
+            list(handler.events(io.BytesIO(b"<a><b></a>")))
+
+
+class PushParserTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.xml = (
+            b'<a xmlns="urn:a" xmlns:b="urn:b" b:c="1">txt<!-- comment -->'
+            b"<b:d>value</b:d>tail"
+            b'<e xmlns:f="urn:f" f:g="2"/>'
+            b"</a>"
+        )
+
+    def test_read_events(self):
+        expected = summarize(LxmlEventHandler().events(io.BytesIO(self.xml)))
+
+        for clazz in (LxmlPushParser, LxmlTargetPushParser, ExpatPushParser):
+            for chunk_size in (1, 7, 1024):
+                events = read_events(io.BytesIO(self.xml), clazz(), chunk_size)
+                self.assertEqual(expected, summarize(events))
+
+    def test_feed_holds_back_end_events_until_the_tail_is_complete(self):
+        for clazz in (LxmlPushParser, LxmlTargetPushParser, ExpatPushParser):
+            parser = clazz()
+            events = parser.feed(b"<a><b>value</b>ta")
+            self.assertEqual([EventType.START, EventType.START], [x[0] for x in events])
+
+            events = parser.feed(b"il</a>")
+            self.assertEqual(EventType.END, events[0][0])
+            self.assertEqual("tail", events[0][1].tail)
+            self.assertEqual([], parser.feed(b""))
+
+            events = parser.close()
+            self.assertEqual([(EventType.END, "a")], [(x[0], x[1].tag) for x in events])
+
+    def test_close_with_empty_input(self):
+        self.assertEqual([], LxmlPushParser().close())
+        self.assertEqual([], LxmlTargetPushParser().close())
+
+        with self.assertRaises(ParserError):
+            ExpatPushParser().close()
+
+    def test_handler_push_parser(self):
+        self.assertIsInstance(LxmlEventHandler().push_parser(), LxmlPushParser)
+        self.assertIsInstance(LxmlSaxHandler().push_parser(), LxmlTargetPushParser)
+        self.assertIsInstance(XmlSaxHandler().push_parser(), ExpatPushParser)
+
+
+class SaxTargetTests(TestCase):
+    def test_text_and_tail(self):
+        target = SaxTarget()
+        target.start("a", {})
+        target.data("foo")
+        target.data("bar")
+        target.start("b", {})
+        target.end("b")
+        target.data("tail")
+        self.assertEqual(2, len(target.events))
+
+        target.end("a")
+        target.close()
+
+        a = target.events[0][1]
+        b = target.events[1][1]
+        self.assertEqual("foobar", a.text)
+        self.assertEqual("tail", b.tail)
+        self.assertEqual(
+            [EventType.START, EventType.START, EventType.END, EventType.END],
+            [event for event, _ in target.events],
+        )
+
+
+class SplitDocumentsTests(TestCase):
+    def test_split_documents(self):
+        docs = [
+            b"<?xml version='1.0'?>\n<a><b>x</b></a>\n",
+            b"<?xml version='1.0'?><a/><!-- c --><?pi x?>",
+            b"<a x='>'/>\n  ",
+        ]
+        source = b"".join(docs)
+
+        for chunk_size in (1, 3, 7, 1024):
+            result = split_documents(io.BytesIO(source), chunk_size)
+            self.assertEqual(docs, [b"".join(parts) for parts in result])
+
+    def test_split_documents_ignores_empty_input(self):
+        self.assertEqual([], list(split_documents(io.BytesIO(b""), 4)))
+        self.assertEqual([], list(split_documents(io.BytesIO(b" <!-- -->"), 4)))
+
+    def test_split_documents_with_malformed_source(self):
+        for source in (b"<a/><b", b"<a></b>"):
+            with self.assertRaises(ParserError):
+                list(split_documents(io.BytesIO(source), 4))
+
+    def test_split_parts(self):
+        parts = [b"abc", b"de", b"f"]
+
+        self.assertEqual(([b"ab"], [b"c", b"de", b"f"]), split_parts(parts, 2))
+        self.assertEqual(([b"abc"], [b"de", b"f"]), split_parts(parts, 3))
+        self.assertEqual(([b"abc", b"d"], [b"e", b"f"]), split_parts(parts, 4))
+        self.assertEqual((parts, []), split_parts(parts, 6))
+
+
+class SaxElementTests(TestCase):
+    def test_nsmap(self):
+        root = SaxElement("a", {}, {"": "urn:a", "b": "urn:b"}, None)
+        child = SaxElement("c", {}, None, root)
+        grand = SaxElement("d", {}, {"b": "urn:c"}, child)
+
+        self.assertEqual({None: "urn:a", "b": "urn:b"}, root.nsmap)
+        self.assertIs(root.scoped_nsmap(), child.scoped_nsmap())
+        self.assertEqual({None: "urn:a", "b": "urn:c"}, grand.nsmap)
+        self.assertIsNot(root.nsmap, root.nsmap)
+
+    def test_getparent_and_clear(self):
+        root = SaxElement("a", {}, None, None)
+        child = SaxElement("b", {"c": "d"}, None, root)
+        child.text = "foo"
+        child.tail = "bar"
+
+        self.assertIsNone(root.getparent())
+        self.assertIs(root, child.getparent())
+
+        child.clear()
+        self.assertEqual({}, child.attrib)
+        self.assertIsNone(child.text)
+        self.assertIsNone(child.tail)
+        self.assertIsNone(child.sourceline)
@@ -1,12 +1,17 @@
+import io
 import json
+import pickle
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from typing import Optional
 from unittest.case import TestCase
 
-from lxml.etree import QName
-
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
-from xsdata.formats.dataclass.models.elements import XmlElement
-from xsdata.formats.dataclass.models.elements import XmlText
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
 from xsdata.formats.dataclass.parsers.json import JsonParser
 
 
@@ -67,14 +72,110 @@ class JsonParserTests(TestCase):
             books.book[1],
         )
 
-    def test_get_value(self):
-        data = dict(foo="bar", bar="foo")
+    def test_parser_with_projection(self):
+        config = ParserConfig(projection={"book.title"})
+        parser = JsonParser(config=config)
+        books = parser.from_string(json.dumps(self.data), Books)
+
+        self.assertEqual(
+            Books(
+                book=[
+                    BookForm(title="The First Book", id="bk001"),
+                    BookForm(title="Becoming Somebody", id="bk002"),
+                ]
+            ),
+            books,
+        )
+
+        config.projection = Projection.create(lambda var: var.name != "book")
+        self.assertEqual(Books(), parser.from_string(json.dumps(self.data), Books))
+
+    def test_parse_lines(self):
+        source = io.BytesIO(b'{"id": "bk001", "title": "First"}\n\n  \n{"id": "bk002"}')
+        result = JsonParser().parse_lines(source, BookForm)
+
+        self.assertEqual(BookForm(id="bk001", title="First"), next(result))
+        self.assertEqual(b'\n  \n{"id": "bk002"}', source.read())
 
-        foo_field = XmlText(name="foo", qname=QName("foo"), types=[str])
-        bar_field = XmlElement(
-            name="bar", qname=QName("bar"), types=[str], default=list
+        source.seek(0)
+        self.assertEqual(
+            [BookForm(id="bk001", title="First"), BookForm(id="bk002")],
+            list(JsonParser().parse_lines(source, BookForm)),
         )
 
-        self.assertEqual("bar", JsonParser.get_value(data, foo_field))
-        self.assertEqual(["foo"], JsonParser.get_value(data, bar_field))
-        self.assertIsNone(JsonParser.get_value({}, bar_field))
+    def test_parse_with_deeply_nested_data(self):
+        depth = sys.getrecursionlimit() * 2
+        data: dict = {}
+        for _ in range(depth):
+            data = {"node": data}
+
+        result = JsonParser().parse_context(data, Node)
+
+        while depth:
+            result = result.node
+            depth -= 1
+
+        self.assertEqual(Node(), result)
+
+    def test_plan(self):
+        parser = JsonParser()
+        plan = parser.plan(Aliased)
+
+        self.assertEqual(["First", "values", "first"], list(plan))
+        self.assertIs(plan, parser.plan(Aliased))
+        self.assertIsNone(plan["First"].local_name)
+        self.assertEqual("First", plan["first"].local_name)
+        self.assertIsNone(plan["First"].decode)
+        self.assertIsNotNone(plan["values"].decode)
+        self.assertTrue(plan["values"].is_list)
+
+    def test_bind_values(self):
+        parser = JsonParser()
+
+        result = parser.parse_context({"first": "a", "values": ["1", "2"]}, Aliased)
+        self.assertEqual(Aliased(first="a", values=[1, 2]), result)
+
+        result = parser.parse_context({"first": "a", "First": "b"}, Aliased)
+        self.assertEqual(Aliased(first="b"), result)
+
+        result = parser.parse_context({"first": "a", "unknown": "b"}, Aliased)
+        self.assertEqual(Aliased(first="a"), result)
+
+    def test_bind_values_with_shared_keys(self):
+        parser = JsonParser()
+        plan = parser.plan(Crossed)
+
+        self.assertEqual("x", plan["y"].name)
+        self.assertEqual("y", plan["y"].shared.name)
+        self.assertIsNone(plan["y"].shared.shared)
+
+        result = parser.parse_context({"y": "a"}, Crossed)
+        self.assertEqual(Crossed(x="a", y="a"), result)
+
+        result = parser.parse_context({"y": "a", "z": "b"}, Crossed)
+        self.assertEqual(Crossed(x="a", y="b"), result)
+
+    def test_pickle_resets_plans(self):
+        parser = JsonParser()
+        parser.plan(Aliased)
+
+        clone = pickle.loads(pickle.dumps(parser))
+        self.assertEqual({}, clone.plans)
+        self.assertEqual(1, len(parser.plans))
+
+
+@dataclass
+class Node:
+    node: Optional["Node"] = field(default=None, metadata=dict(type="Element"))
+
+
+@dataclass
+class Aliased:
+    first: Optional[str] = field(default=None, metadata=dict(name="First"))
+    values: List[int] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass
+class Crossed:
+    x: Optional[str] = field(default=None, metadata=dict(name="y"))
+    y: Optional[str] = field(default=None, metadata=dict(name="z"))
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from dataclasses import is_dataclass
+from unittest import mock
+from unittest import TestCase
+
+from xsdata.formats.dataclass.parsers.lazy import lazy_class
+from xsdata.formats.dataclass.parsers.lazy import LAZY_LOADER
+from xsdata.formats.dataclass.parsers.lazy import lazy_object
+from xsdata.formats.dataclass.parsers.lazy import materialize
+from xsdata.formats.dataclass.slots import slotted
+
+
+@dataclass
+class Point:
+    x: int = 0
+    y: int = 0
+
+
+class LazyTests(TestCase):
+    def test_lazy_object(self):
+        loader = mock.Mock(return_value=Point(1, 2))
+        obj = lazy_object(Point, loader)
+
+        self.assertIsNot(Point, type(obj))
+        self.assertIsInstance(obj, Point)
+        self.assertEqual(0, loader.call_count)
+
+        self.assertEqual(1, obj.x)
+        self.assertTrue(is_dataclass(obj))
+        self.assertIs(Point, type(obj))
+        self.assertEqual(Point(1, 2), obj)
+        self.assertNotIn(LAZY_LOADER, obj.__dict__)
+
+        materialize(obj)
+        self.assertEqual(1, loader.call_count)
+
+    def test_lazy_object_with_setattr_and_delattr(self):
+        obj = lazy_object(Point, lambda: Point(1, 2))
+        obj.x = 3
+        self.assertEqual(Point(3, 2), obj)
+
+        obj = lazy_object(Point, lambda: Point(1, 2))
+        del obj.y
+        self.assertEqual({"x": 1}, obj.__dict__)
+
+    def test_lazy_object_with_failed_loader(self):
+        loader = mock.Mock(side_effect=[ValueError, Point(1, 2)])
+        obj = lazy_object(Point, loader)
+
+        with self.assertRaises(ValueError):
+            obj.x
+
+        self.assertEqual(2, obj.y)
+
+    def test_lazy_object_with_slotted_class(self):
+        clazz = slotted(dataclass(type("Foo", (), {"__annotations__": {"x": int}})))
+
+        self.assertIsNone(lazy_object(clazz, mock.Mock()))
+
+    def test_lazy_class(self):
+        actual = lazy_class(Point)
+
+        self.assertIs(actual, lazy_class(Point))
+        self.assertTrue(issubclass(actual, Point))
+        self.assertEqual(Point.__qualname__, actual.__qualname__)
+        self.assertEqual(Point.__module__, actual.__module__)
@@ -16,7 +16,9 @@ from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.elements import XmlWildcard
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
 from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.parsers.nodes import LazyNode
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes import RootNode
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
@@ -193,6 +195,29 @@ class ElementNodeTests(TestCase):
         actual = node.next_node(ele, 10, ctx)
         self.assertEqual(SkipNode(position=10), actual)
 
+    def test_next_node_with_projection(self):
+        ctx = XmlContext()
+        cfg = ParserConfig()
+        a = XmlElement(name="a", qname=QName("a"), types=[Foo], dataclass=True)
+        b = XmlElement(name="b", qname=QName("b"), types=[int])
+        meta = XmlMeta(
+            name="foo",
+            clazz=None,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=[a, b],
+        )
+        projection = Projection.create(["a.c"])
+        node = ElementNode(position=0, meta=meta, config=cfg, projection=projection)
+
+        actual = node.next_node(Element("b"), 10, ctx)
+        self.assertEqual(SkipNode(position=10), actual)
+
+        actual = node.next_node(Element("a"), 10, ctx)
+        self.assertIsInstance(actual, ElementNode)
+        self.assertEqual(Projection(fields={"c": None}), actual.projection)
+
 
 class RootNodeTests(TestCase):
     def test_next_node_return_self_on_root_element(self):
@@ -245,18 +270,16 @@ class WildcardNodeTests(TestCase):
 
 
 class PrimitiveNodeTests(TestCase):
-    @mock.patch.object(ParserUtils, "parse_value")
-    def test_parse_element(self, mock_parse_value):
-        mock_parse_value.return_value = 13
+    @mock.patch.object(ParserUtils, "parse_var")
+    def test_parse_element(self, mock_parse_var):
+        mock_parse_var.return_value = 13
         var = XmlText(name="foo", qname=QName("foo"), default=100)
         node = PrimitiveNode(position=0, var=var)
         ele = Element("foo", nsmap={"foo": "bar"})
         ele.text = "13"
 
         self.assertEqual((QName("foo"), 13), node.parse_element(ele, []))
-        mock_parse_value.assert_called_once_with(
-            var.types, ele.text, var.default, ele.nsmap, var.is_tokens
-        )
+        mock_parse_var.assert_called_once_with(var, ele.text, ele.nsmap)
 
     def test_next_node(self):
         ele = Element("foo")
@@ -281,3 +304,37 @@ class SKipNodeTests(TestCase):
 
         self.assertEqual((None, None), node.parse_element(ele, objects))
         self.assertEqual(0, len(objects))
+
+
+class LazyNodeTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.meta = XmlContext().build(Foo)
+        self.bind = mock.Mock(return_value=Foo(1, 2, 3, 4))
+        self.node = LazyNode(position=0, meta=self.meta, bind=self.bind)
+
+    def test_next_node(self):
+        ele = Element("foo")
+        expected = SkipNode(position=1)
+
+        self.assertEqual(expected, self.node.next_node(ele, 1, XmlContext()))
+
+    def test_parse_element(self):
+        ele = Element("foo")
+
+        qname, obj = self.node.parse_element(ele, [])
+        self.assertEqual("foo", qname)
+        self.assertIsNot(Foo, type(obj))
+        self.assertEqual(0, self.bind.call_count)
+
+        self.assertEqual(1, obj.a)
+        self.assertIs(Foo, type(obj))
+        self.bind.assert_called_once_with(ele, self.meta, None)
+
+    @mock.patch("xsdata.formats.dataclass.parsers.nodes.lazy_object")
+    def test_parse_element_with_eager_class(self, mock_lazy_object):
+        mock_lazy_object.return_value = None
+        ele = Element("foo")
+
+        self.assertEqual(("foo", Foo(1, 2, 3, 4)), self.node.parse_element(ele, []))
+        self.bind.assert_called_once_with(ele, self.meta, None)
@@ -4,7 +4,6 @@ from dataclasses import make_dataclass
 from dataclasses import replace
 from unittest import mock
 from unittest.case import TestCase
-from unittest.mock import MagicMock
 
 from lxml.etree import Element
 from lxml.etree import QName
@@ -12,13 +11,16 @@ from lxml.etree import QName
 from tests.fixtures.books import Books
 from tests.fixtures.defxmlschema.chapter12 import ProductType
 from tests.fixtures.defxmlschema.chapter12 import SizeType
+from xsdata.formats.converters import compile_converter
+from xsdata.formats.converters import return_value
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.constants import XmlType
-from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlText
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.formats.dataclass.slots import slotted
 from xsdata.models.enums import Namespace
 from xsdata.models.enums import QNames
 
@@ -69,6 +71,24 @@ class ParserUtilsTests(TestCase):
             ]
         )
 
+    def test_parse_var(self):
+        var = XmlText(name="a", qname=QName("a"), types=[int], default=1)
+        self.assertEqual(1, ParserUtils.parse_var(var, None))
+        self.assertEqual("a", ParserUtils.parse_var(var, "a"))
+
+        var = replace(var, converter=compile_converter([int]))
+        self.assertEqual(2, ParserUtils.parse_var(var, "2"))
+        self.assertEqual("a", ParserUtils.parse_var(var, "a"))
+
+        var = replace(var, default=list)
+        self.assertIsNone(ParserUtils.parse_var(var, None))
+        self.assertEqual([1, 2], ParserUtils.parse_var(var, " 1 2 "))
+        self.assertEqual([1, 2], ParserUtils.parse_var(var, ["1", 2]))
+
+        var = replace(var, types=[QName], converter=compile_converter([QName]))
+        actual = ParserUtils.parse_var(var, "a:b c", {"a": "xsdata"})
+        self.assertEqual([QName("xsdata", "b"), QName("c")], actual)
+
     @mock.patch.object(ParserUtils, "bind_element_wildcard_param")
     @mock.patch.object(ParserUtils, "find_eligible_wildcard")
     @mock.patch.object(ParserUtils, "bind_element_param")
@@ -104,6 +124,7 @@ class ParserUtilsTests(TestCase):
 
         params = {}
         ParserUtils.bind_element_children(params, meta, 1, objects)
+        self.assertEqual([("foo", 0)], objects)
 
         mock_bind_element_param.assert_has_calls(
             [
@@ -123,10 +144,11 @@ class ParserUtilsTests(TestCase):
     def test_fetch_any_children(self):
         objects = [(x, x) for x in "abc"]
         self.assertEqual(["b", "c"], ParserUtils.fetch_any_children(1, objects))
+        self.assertEqual([("a", "a")], objects)
 
-    @mock.patch.object(ParserUtils, "parse_value")
-    def test_bind_element_attrs(self, mock_parse_value):
-        mock_parse_value.return_value = "2020-03-02"
+    @mock.patch.object(ParserUtils, "parse_var")
+    def test_bind_element_attrs(self, mock_parse_var):
+        mock_parse_var.return_value = "2020-03-02"
         metadata = self.ctx.build(ProductType)
         eff_date = metadata.find_var("effDate")
         element = Element("foo")
@@ -137,13 +159,7 @@ class ParserUtilsTests(TestCase):
         ParserUtils.bind_element_attrs(params, metadata, element)
         expected = {"eff_date": "2020-03-02", "other_attributes": {"whatever": "foo"}}
         self.assertEqual(expected, params)
-        mock_parse_value.assert_called_once_with(
-            eff_date.types,
-            "2020-03-01",
-            eff_date.default,
-            element.nsmap,
-            eff_date.is_list,
-        )
+        mock_parse_var.assert_called_once_with(eff_date, "2020-03-01", None)
 
     def test_bind_element_attrs_doesnt_overwrite_values(self):
         metadata = self.ctx.build(ProductType)
@@ -159,8 +175,9 @@ class ParserUtilsTests(TestCase):
     def test_bind_elements_attrs_ignore_init_false_vars(self):
         metadata = self.ctx.build(ProductType)
         eff_date = metadata.find_var("effDate")
-        metadata.vars.remove(eff_date)
-        metadata.vars.append(replace(eff_date, init=False))
+        vars = [var for var in metadata.vars if var is not eff_date]
+        vars.append(replace(eff_date, init=False))
+        metadata = replace(metadata, vars=vars)
 
         element = Element("foo")
         element.set("effDate", "2020-03-01")
@@ -178,21 +195,30 @@ class ParserUtilsTests(TestCase):
         ParserUtils.bind_element_text(params, metadata, element)
         self.assertEqual({}, params)
 
-    @mock.patch.object(ParserUtils, "parse_value", return_value="yes!")
-    def test_bind_element_text_with_text_var(self, mock_parse_value):
+    @mock.patch.object(ParserUtils, "parse_var", return_value="yes!")
+    def test_bind_element_text_with_text_var(self, mock_parse_var):
         element = Element("foo")
         params = {}
         metadata = self.ctx.build(SizeType)
-        var = metadata.find_var(mode=FindMode.TEXT)
+        var = metadata.text_var
         ParserUtils.bind_element_text(params, metadata, element)
         self.assertEqual({}, params)
 
         element.text = "foo"
         ParserUtils.bind_element_text(params, metadata, element)
         self.assertEqual({"value": "yes!"}, params)
-        mock_parse_value.assert_called_once_with(
-            var.types, element.text, var.default, element.nsmap, var.is_list,
-        )
+        mock_parse_var.assert_called_once_with(var, element.text, None)
+
+    def test_element_ns_map(self):
+        element = Element("foo", nsmap={"a": "b"})
+        var = XmlVar(name="a", qname=QName("a"), types=[int])
+        self.assertEqual({"a": "b"}, ParserUtils.element_ns_map(var, element))
+
+        var = replace(var, converter=return_value)
+        self.assertIsNone(ParserUtils.element_ns_map(var, element))
+
+        var = replace(var, needs_ns_map=True)
+        self.assertEqual({"a": "b"}, ParserUtils.element_ns_map(var, element))
 
     def test_bind_element_param(self):
         var = XmlVar(name="a", qname=QName("a"))
@@ -248,13 +274,30 @@ class ParserUtilsTests(TestCase):
         self.assertIsNone(value.qname)
 
         params.clear()
-        ParserUtils.bind_element_wildcard_param(params, var, qname, foo)
+        ParserUtils.bind_element_wildcard_param(params, var, qname.text, foo)
         self.assertEqual(dict(a=foo), params)
         self.assertEqual(qname, foo.qname)
+        self.assertIsInstance(foo.qname, QName)
+
+        params.clear()
+        bar = slotted(clazz)()
+        ParserUtils.bind_element_wildcard_param(params, var, qname.text, bar)
+        self.assertEqual(dict(a=bar), params)
+        self.assertEqual(qname, bar.qname)
+
+        params.clear()
+        frozen = make_dataclass("Bar", fields=[], frozen=True)()
+        with mock.patch("xsdata.formats.dataclass.parsers.utils.logger") as logger:
+            ParserUtils.bind_element_wildcard_param(params, var, qname.text, frozen)
+
+        self.assertEqual(dict(a=frozen), params)
+        logger.warning.assert_called_once_with(
+            "Unassigned element name %s of %s", qname.text, "Bar"
+        )
 
     def test_bind_element_wild_text_when_find_var_returns_none(self):
         meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=None)
+        meta.wildcard_var = None
         elem = Element("foo")
         params = {}
         ParserUtils.bind_element_wild_text(params, meta, elem)
@@ -263,7 +306,7 @@ class ParserUtilsTests(TestCase):
     def test_bind_element_wild_text_when_element_has_no_text_and_tail(self):
         var = XmlVar(name="a", qname=QName("a"))
         meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        meta.wildcard_var = var
         elem = Element("foo")
         params = {}
 
@@ -273,7 +316,7 @@ class ParserUtilsTests(TestCase):
     def test_bind_element_wild_text(self):
         var = XmlVar(name="a", qname=QName("a"))
         meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        meta.wildcard_var = var
         elem = Element("foo")
         elem.text = "txt"
         elem.tail = "tail"
@@ -292,7 +335,7 @@ class ParserUtilsTests(TestCase):
     def test_bind_element_wild_text_when_var_is_list(self):
         var = XmlVar(name="a", qname=QName("a"), default=list)
         meta = mock.Mock(XmlMeta)
-        meta.find_var = MagicMock(return_value=var)
+        meta.wildcard_var = var
         elem = Element("foo")
         elem.text = "txt"
         elem.tail = "tail"
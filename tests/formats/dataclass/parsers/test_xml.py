@@ -1,6 +1,10 @@
+import asyncio
+import io
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from typing import Any
+from typing import Iterator
 from typing import List
 from unittest import mock
 from unittest.case import TestCase
@@ -10,14 +14,21 @@ from lxml.etree import QName
 
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
+from xsdata.codegen.parser import SchemaParser
 from xsdata.exceptions import ParserError
 from xsdata.formats.dataclass.models.elements import XmlText
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import LxmlSaxHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlSaxHandler
 from xsdata.formats.dataclass.parsers.nodes import PrimitiveNode
 from xsdata.formats.dataclass.parsers.nodes import RootNode
 from xsdata.formats.dataclass.parsers.nodes import SkipNode
+from xsdata.formats.dataclass.parsers.xml import hook_methods
 from xsdata.formats.dataclass.parsers.xml import XmlParser
 from xsdata.models.enums import EventType
+from xsdata.utils import text
 
 
 class XmlParserTests(TestCase):
@@ -52,6 +63,7 @@ class XmlParserTests(TestCase):
         objects = []
         queue = []
         queue.append(root_queue_item)
+        self.parser.emit_events = True
         self.parser.queue(element, queue, objects)
 
         self.assertEqual(2, len(queue))
@@ -73,6 +85,7 @@ class XmlParserTests(TestCase):
         var = XmlText(name="foo", qname=QName("foo"))
         queue.append(PrimitiveNode(position=0, var=var))
 
+        self.parser.emit_events = True
         result = self.parser.dequeue(element, queue, objects)
         self.assertEqual("result", result)
         self.assertEqual(0, len(queue))
@@ -98,13 +111,77 @@ class XmlParserTests(TestCase):
         self.assertEqual(0, mock_emit_event.call_count)
 
     def test_emit_event(self):
-        mock_func = mock.Mock()
-        self.parser.foo_bar_element = mock_func
+        calls = []
 
-        self.parser.emit_event("foo", "{tns}barElement", a=1, b=2)
+        @dataclass
+        class HookParser(XmlParser):
+            def foo_bar_element(self, **kwargs: Any):
+                calls.append((self, kwargs))
+
+        parser = HookParser()
+        callback = mock.Mock()
+        parser.subscribe("foo", "{tns}barElement", callback)
+        parser.emit_event("foo", "{tns}barElement", a=1, b=2)
+        HookParser().emit_event("foo", "{tns}barElement", a=2)
+
+        self.assertEqual([(parser, dict(a=1, b=2)), (mock.ANY, dict(a=2))], calls)
+        callback.assert_called_once_with(a=1, b=2)
+
+    def test_hook_method(self):
+        @dataclass
+        class HookParser(XmlParser):
+            foo_baz = None
+
+            def foo_bar_element(self):
+                pass
+
+        key = (HookParser, "foo", "{tns}barElement")
+        with mock.patch.object(text, "snake_case", wraps=text.snake_case) as mock_snake:
+            method = HookParser.hook_method("foo", "{tns}barElement")
+            self.assertIs(method, HookParser().hook_method("foo", "{tns}barElement"))
+
+        self.assertIs(HookParser.foo_bar_element, method)
+        self.assertIs(method, hook_methods[key])
+        self.assertEqual(1, mock_snake.call_count)
+        self.assertIsNone(HookParser.hook_method("foo", "baz"))
+        self.assertIsNone(XmlParser.hook_method("foo", "{tns}barElement"))
+
+    @mock.patch.object(XmlParser, "emit_event")
+    def test_queue_and_dequeue_without_hooks(self, mock_emit_event):
+        self.assertFalse(self.parser.emit_events)
+
+        self.parser.from_bytes(b"<books><book/></books>", Books)
+        self.assertEqual(0, mock_emit_event.call_count)
+
+    def test_subscribe(self):
+        starts = []
+        ends = []
+
+        def on_start(element: Element, item: Any):
+            starts.append((element.tag, item.meta.clazz))
 
-        mock_func.assert_called_once_with(a=1, b=2)
-        self.assertEqual({"{tns}barElement": "bar_element"}, self.parser.event_names)
+        def on_end(element: Element, obj: Any):
+            ends.append(obj)
+
+        self.parser.subscribe(EventType.START, "book", on_start)
+        self.parser.subscribe(EventType.END, QName("book"), on_end)
+        self.assertTrue(self.parser.emit_events)
+
+        xml = b'<books><book id="1"/><book id="2"/></books>'
+        self.parser.from_bytes(xml, Books)
+        self.assertEqual([("book", Books), ("book", Books)], starts)
+        self.assertEqual([BookForm(id="1"), BookForm(id="2")], ends)
+
+    def test_has_hook_methods(self):
+        @dataclass
+        class HookParser(XmlParser):
+            def end_book(self, obj: Any, element: Element):
+                pass
+
+        self.assertFalse(XmlParser.has_hook_methods())
+        self.assertTrue(HookParser.has_hook_methods())
+        self.assertTrue(SchemaParser.has_hook_methods())
+        self.assertTrue(HookParser().emit_events)
 
 
 class XmlParserIntegrationTest(TestCase):
@@ -157,6 +234,247 @@ class XmlParserIntegrationTest(TestCase):
         self.assertEqual(self.books, actual)
         self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
 
+    def test_parse_with_lxml_sax_handler(self):
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<brk:books xmlns:brk="urn:books">\n'
+            '  <book id="bk001">\n'
+            "    <author>Hightower, Kim</author>\n"
+            "    <title>The First Book</title>\n"
+            "    <genre>Fiction</genre>\n"
+            "    <price>44.95</price>\n"
+            "    <pub_date>2000-10-01</pub_date>\n"
+            "    <review>An amazing story of nothing.</review>\n"
+            "  </book>\n"
+            '  <book id="bk002">\n'
+            "    <author>Nagata, Suanne</author>\n"
+            "    <title>Becoming Somebody</title>\n"
+            "    <genre>Biography</genre>\n"
+            "    <review>A masterpiece of the fine art of gossiping.</review>\n"
+            "  </book>\n"
+            "</brk:books>\n"
+        )
+
+        parser = XmlParser(config=ParserConfig(handler=LxmlSaxHandler()))
+        actual = parser.from_string(xml, Books)
+        self.assertEqual(self.books, actual)
+        self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
+
+    def test_iterparse(self):
+        xml = (
+            '<brk:books xmlns:brk="urn:books">'
+            '<book id="bk001"><author>Hightower, Kim</author>'
+            "<title>The First Book</title><genre>Fiction</genre>"
+            "<price>44.95</price><pub_date>2000-10-01</pub_date>"
+            "<review>An amazing story of nothing.</review></book>"
+            '<book id="bk002"><author>Nagata, Suanne</author>'
+            "<title>Becoming Somebody</title><genre>Biography</genre>"
+            "<review>A masterpiece of the fine art of gossiping.</review></book>"
+            "</brk:books>"
+        ).encode()
+
+        parser = XmlParser()
+        actual = parser.iterparse(io.BytesIO(xml), Books, "book")
+        self.assertIsInstance(actual, Iterator)
+        self.assertEqual(self.books.book, list(actual))
+
+        path = [QName("urn:books", "books"), "book"]
+        actual = parser.iterparse(io.BytesIO(xml), Books, path)
+        self.assertEqual(self.books.book, list(actual))
+
+        path = ["foo", "book"]
+        actual = parser.iterparse(io.BytesIO(xml), Books, path)
+        self.assertEqual([], list(actual))
+
+        actual = parser.iterparse(io.BytesIO(xml), Books, "{urn:books}books")
+        self.assertEqual([self.books], list(actual))
+
+        for handler in (LxmlSaxHandler(), XmlSaxHandler()):
+            parser = XmlParser(config=ParserConfig(handler=handler))
+            actual = parser.iterparse(io.BytesIO(xml), Books, "book")
+            self.assertEqual(self.books.book, list(actual))
+
+    @mock.patch.object(LxmlEventHandler, "release")
+    def test_iterparse_releases_elements(self, mock_release):
+        xml = b"<books><book/><foo/><book/></books>"
+        parser = XmlParser(config=ParserConfig(fail_on_unknown_properties=False))
+        actual = parser.iterparse(io.BytesIO(xml), Books, "book")
+
+        self.assertEqual([BookForm(), BookForm()], list(actual))
+        self.assertEqual(2, mock_release.call_count)
+        self.assertEqual("book", mock_release.call_args[0][0].tag)
+
+    def test_feed_parser(self):
+        xml = (
+            '<brk:books xmlns:brk="urn:books">'
+            '<book id="bk001"><author>Hightower, Kim</author>'
+            "<title>The First Book</title><genre>Fiction</genre>"
+            "<price>44.95</price><pub_date>2000-10-01</pub_date>"
+            "<review>An amazing story of nothing.</review></book>"
+            '<book id="bk002"><author>Nagata, Suanne</author>'
+            "<title>Becoming Somebody</title><genre>Biography</genre>"
+            "<review>A masterpiece of the fine art of gossiping.</review></book>"
+            "</brk:books>"
+        ).encode()
+        chunks = [xml[i : i + 10] for i in range(0, len(xml), 10)]
+
+        for handler in (LxmlEventHandler(), LxmlSaxHandler(), XmlSaxHandler()):
+            parser = XmlParser(config=ParserConfig(handler=handler))
+            feed = parser.feed_parser(Books)
+            actual = [obj for chunk in chunks for obj in feed.feed(chunk)]
+            actual.extend(feed.close())
+            self.assertEqual([self.books], actual)
+            self.assertEqual({"brk": "urn:books"}, parser.namespaces.ns_map)
+
+            # The end event is complete when the next element starts
+            split = xml.index(b"<author>Nagata")
+            feed = parser.feed_parser(Books, "book")
+            self.assertEqual([], feed.feed(chunks[0]))
+            self.assertEqual([self.books.book[0]], feed.feed(xml[10:split]))
+            actual = feed.feed(xml[split:]) + feed.close()
+            self.assertEqual([self.books.book[1]], actual)
+
+    def test_feed_parser_close_with_empty_document(self):
+        feed = XmlParser().feed_parser(Books)
+        feed.feed(b"")
+
+        with self.assertRaises(ParserError) as cm:
+            feed.close()
+
+        self.assertEqual("Failed to create target class `Books`", str(cm.exception))
+
+        feed = XmlParser().feed_parser(Books, "book")
+        self.assertEqual([], feed.close())
+
+    def test_parse_documents(self):
+        xml = (
+            b'<?xml version="1.0"?>\n<books><book id="bk001"/></books>\n'
+            b'<?xml version="1.0"?>\n<books/><books><book id="bk002"/></books>\n'
+        )
+        expected = [
+            Books(book=[BookForm(id="bk001")]),
+            Books(),
+            Books(book=[BookForm(id="bk002")]),
+        ]
+
+        for handler in (LxmlEventHandler(), LxmlSaxHandler(), XmlSaxHandler()):
+            parser = XmlParser(config=ParserConfig(handler=handler))
+            actual = parser.parse_documents(io.BytesIO(xml), Books, chunk_size=16)
+
+            self.assertIsInstance(actual, Iterator)
+            self.assertEqual(expected, list(actual))
+
+    def test_parse_async(self):
+        xml = b'<books><book id="bk001"/><book id="bk002"/></books>'
+
+        async def chunks():
+            for i in range(0, len(xml), 8):
+                yield xml[i : i + 8]
+
+        async def read():
+            stream = asyncio.StreamReader()
+            stream.feed_data(xml)
+            stream.feed_eof()
+            return await XmlParser().parse_async(stream, Books, chunk_size=4)
+
+        expected = Books(book=[BookForm(id="bk001"), BookForm(id="bk002")])
+        self.assertEqual(
+            expected, asyncio.run(XmlParser().parse_async(chunks(), Books))
+        )
+        self.assertEqual(expected, asyncio.run(read()))
+
+    def test_iterparse_async(self):
+        xml = b'<books><book id="bk001"/><book id="bk002"/></books>'
+
+        async def chunks():
+            for i in range(0, len(xml), 8):
+                yield xml[i : i + 8]
+
+        async def collect():
+            stream = XmlParser().iterparse_async(chunks(), Books, "book")
+            return [obj async for obj in stream]
+
+        expected = [BookForm(id="bk001"), BookForm(id="bk002")]
+        self.assertEqual(expected, asyncio.run(collect()))
+
+    @mock.patch.object(SkipNode, "next_node")
+    def test_parse_skips_unknown_subtrees(self, mock_next_node):
+        xml = (
+            b'<books><book id="bk001"/>'
+            b"<ext><a><b>1</b></a><book/></ext>"
+            b'<book id="bk002"/><ext/></books>'
+        )
+        config = ParserConfig(fail_on_unknown_properties=False)
+        expected = [BookForm(id="bk001"), BookForm(id="bk002")]
+
+        for handler in (LxmlEventHandler(), LxmlSaxHandler(), XmlSaxHandler()):
+            config.handler = handler
+            parser = XmlParser(config=config)
+            ends = []
+            parser.subscribe(
+                EventType.END, "book", lambda obj, element: ends.append(obj)
+            )
+
+            self.assertEqual(Books(book=expected), parser.from_bytes(xml, Books))
+            self.assertEqual(expected, ends)
+
+            feed = parser.feed_parser(Books, "book")
+            actual = [obj for i in range(len(xml)) for obj in feed.feed(xml[i : i + 1])]
+            self.assertEqual(expected, actual + feed.close())
+            self.assertEqual(0, feed.skip)
+
+        self.assertEqual(0, mock_next_node.call_count)
+
+    def test_parse_lazy(self):
+        xml = (
+            b'<books><book id="bk001"><author>Kim</author></book>'
+            b'<ext><book/></ext><book id="bk002"/></books>'
+        )
+        config = ParserConfig(fail_on_unknown_properties=False)
+        parser = XmlParser(config=config)
+        expected = parser.from_bytes(xml, Books)
+
+        with mock.patch.object(
+            XmlParser, "bind_lazy", wraps=parser.bind_lazy
+        ) as mock_bind_lazy:
+            actual = parser.parse_lazy(io.BytesIO(xml), Books)
+
+            self.assertIs(Books, type(actual))
+            self.assertEqual(1, mock_bind_lazy.call_count)
+            self.assertEqual(2, len(actual.book))
+            self.assertIsNot(BookForm, type(actual.book[0]))
+
+            self.assertEqual("Kim", actual.book[0].author)
+            self.assertIs(BookForm, type(actual.book[0]))
+            self.assertIsNot(BookForm, type(actual.book[1]))
+            self.assertEqual(2, mock_bind_lazy.call_count)
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(3, mock_bind_lazy.call_count)
+
+    def test_parse_with_projection(self):
+        xml = (
+            b'<books><book id="bk001"><author>Kim</author><title>Foo</title>'
+            b'</book><book id="bk002"><title>Bar</title></book></books>'
+        )
+        config = ParserConfig(projection={"book.title"})
+        parser = XmlParser(config=config)
+        expected = Books(
+            book=[BookForm(id="bk001", title="Foo"), BookForm(id="bk002", title="Bar")]
+        )
+
+        self.assertEqual(expected, parser.from_bytes(xml, Books))
+        self.assertEqual(expected, parser.parse_lazy(io.BytesIO(xml), Books))
+
+        config.projection = Projection.create([])
+        self.assertEqual(Books(), parser.from_bytes(xml, Books))
+
+    def test_parse_lazy_raises_exception(self):
+        with self.assertRaises(ParserError) as cm:
+            XmlParser().parse_lazy(io.BytesIO(b"<"), Books)
+
+        self.assertEqual("Failed to create target class `Books`", str(cm.exception))
+
     def test_parse_with_fail_on_unknown_properties_false(self):
         xml = (
             '<?xml version="1.0" encoding="UTF-8"?>\n'
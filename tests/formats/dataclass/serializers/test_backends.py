@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from unittest import mock
+from unittest.case import TestCase
+from xml.etree import ElementTree
+
+from lxml.etree import QName
+
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.backends import escape_attribute
+from xsdata.formats.dataclass.serializers.backends import escape_text
+from xsdata.formats.dataclass.serializers.backends import EtreeBackend
+from xsdata.formats.dataclass.serializers.backends import StreamBackend
+from xsdata.formats.dataclass.serializers.backends import StreamElement
+from xsdata.formats.dataclass.serializers.backends import StreamValues
+from xsdata.formats.dataclass.serializers.backends import XmlStreamWriter
+
+
+class XmlBackendTests(TestCase):
+    def test_render_children_and_values(self):
+        render = mock.Mock()
+        backend = EtreeBackend()
+        backend.render_children("a", render, 1)
+        backend.render_values("b", iter([2, 3]), render, 4)
+
+        self.assertEqual(
+            [mock.call("a", 1), mock.call("b", 2, 4), mock.call("b", 3, 4)],
+            render.mock_calls,
+        )
+
+
+class EtreeBackendTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.backend = EtreeBackend()
+
+    def test_render_matches_lxml_backend(self):
+        @dataclass
+        class Root:
+            class Meta:
+                name = "root"
+                namespace = "urn:a"
+
+            attr: str = field(metadata=dict(type="Attribute", namespace="urn:b"))
+            child: List[str] = field(
+                default_factory=list, metadata=dict(type="Element")
+            )
+            wildcard: List[object] = field(
+                default_factory=list, metadata=dict(type="Wildcard", namespace="##any"),
+            )
+
+        obj = Root(
+            attr='a<b>&"c\n',
+            child=["1", "<2>"],
+            wildcard=[
+                AnyElement(qname=QName("urn:a", "any"), text="<1>", tail="tail"),
+                AnyElement(qname=QName("urn:c", "other"), children=["foo"]),
+            ],
+        )
+
+        for pretty_print in (True, False):
+            lxml = XmlSerializer(pretty_print=pretty_print)
+            etree = XmlSerializer(pretty_print=pretty_print, backend=self.backend)
+            self.assertEqual(lxml.render(obj), etree.render(obj))
+
+    def test_tostring(self):
+        namespaces = Namespaces()
+        namespaces.add("urn:a", "")
+        namespaces.add("urn:b", "b")
+        namespaces.add("urn:c", "")
+
+        root = self.backend.create_element(QName("urn:b", "root"), namespaces)
+        first = self.backend.create_sub_element(root, QName("urn:b", "first"))
+        self.backend.create_sub_element(first, QName("urn:d", "second"))
+        self.backend.create_sub_element(root, "{urn:d}third").text = "ü"
+
+        expected = (
+            "<?xml version='1.0' encoding='ascii'?>\n"
+            '<b:root xmlns:b="urn:b">\n'
+            "  <b:first>\n"
+            '    <ns0:second xmlns:ns0="urn:d"/>\n'
+            "  </b:first>\n"
+            '  <ns1:third xmlns:ns1="urn:d">&#252;</ns1:third>\n'
+            "</b:root>\n"
+        )
+        actual = self.backend.tostring(root, namespaces, True, "ascii", True)
+        self.assertEqual(expected, actual.decode())
+
+    def test_create_element(self):
+        root = self.backend.create_element(QName("urn:a", "root"), Namespaces())
+        child = self.backend.create_sub_element(root, QName("urn:a", "child"))
+
+        self.assertIsInstance(root, ElementTree.Element)
+        self.assertEqual("{urn:a}root", root.tag)
+        self.assertEqual([child], list(root))
+
+
+class StreamBackendTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.backend = StreamBackend()
+        self.namespaces = Namespaces()
+        self.namespaces.add("urn:a")
+
+    def test_tostring(self):
+        root = self.backend.create_element(QName("urn:a", "root"), self.namespaces)
+        child = self.backend.create_sub_element(root, QName("urn:a", "child"))
+        child.set(QName("urn:a", "x"), "1")
+        child.text = "ü"
+        self.backend.create_sub_element(child, "{urn:b}mixed").tail = "tail"
+        self.backend.create_sub_element(root, QName("urn:a", "empty"))
+
+        expected = (
+            "<?xml version='1.0' encoding='ascii'?>\n"
+            '<ns0:root xmlns:ns0="urn:a">\n'
+            '  <ns0:child ns0:x="1">&#252;<ns1:mixed xmlns:ns1="urn:b"/>tail</ns0:child>\n'
+            "  <ns0:empty/>\n"
+            "</ns0:root>\n"
+        )
+        actual = self.backend.tostring(root, self.namespaces, True, "ascii", True)
+        self.assertEqual(expected, actual.decode())
+
+    def test_render_children(self):
+        render = mock.Mock()
+        element = self.backend.create_element(QName("a"), self.namespaces)
+        self.backend.render_children(element, render, 1, 2)
+
+        self.assertEqual(0, render.call_count)
+        element.render()
+        element.render()
+        render.assert_called_once_with(element, 1, 2)
+
+    def test_render_values(self):
+        render = mock.Mock()
+        parent = self.backend.create_element(QName("a"), self.namespaces)
+        values = iter([1, 2])
+        self.backend.render_values(parent, values, render, 3)
+
+        self.assertEqual(0, render.call_count)
+        self.assertEqual(1, len(parent))
+        self.assertEqual("a", parent.children[0].tag)
+        self.assertIs(values, parent.children[0].values)
+        self.assertEqual((3,), parent.children[0].args)
+
+        self.backend.render_values(parent, [], render)
+        self.backend.render_values(parent, [4], render)
+        self.assertEqual(0, render.call_count)
+        self.assertEqual(2, len(parent))
+        self.assertEqual([4], list(parent.children[1].values))
+
+
+class XmlStreamWriterTests(TestCase):
+    def test_write_document(self):
+        namespaces = Namespaces()
+        namespaces.add("urn:a", "")
+        namespaces.add("urn:b", "b")
+        root = StreamElement("{urn:a}root")
+        for i in range(3):
+            child = StreamElement("{urn:a}child")
+            child.text = str(i)
+            root.children.append(child)
+
+        target = mock.Mock()
+        writer = XmlStreamWriter(target, namespaces, "UTF-8", False, buffer_size=3)
+        writer.write_document(root, False)
+
+        self.assertEqual(
+            [
+                mock.call(b'<root xmlns="urn:a" xmlns:b="urn:b"><child>0</child>'),
+                mock.call(b"<child>1</child>"),
+                mock.call(b"<child>2</child>"),
+                mock.call(b"</root>"),
+            ],
+            target.write.mock_calls,
+        )
+        self.assertEqual([None, None, None], root.children)
+
+    def test_write_document_with_pretty_print(self):
+        render = mock.Mock()
+        root = StreamElement("root")
+        root.children.extend(
+            (StreamElement("child", render), StreamElement("child", render))
+        )
+
+        target = mock.Mock()
+        writer = XmlStreamWriter(target, Namespaces(), "UTF-8", True)
+        self.assertTrue(writer.is_element_only(root.children))
+        render.assert_called_once_with()
+
+        writer.write_document(root, False)
+        self.assertEqual(
+            b"<root>\n  <child/>\n  <child/>\n</root>\n",
+            b"".join(call.args[0] for call in target.write.mock_calls),
+        )
+
+    def test_is_empty(self):
+        writer = XmlStreamWriter(mock.Mock(), Namespaces(), "UTF-8", False)
+        render = mock.Mock()
+        empty = StreamValues("a", iter([]), render, ())
+
+        self.assertTrue(writer.is_empty([]))
+        self.assertTrue(writer.is_empty([empty]))
+        self.assertFalse(writer.is_empty([empty, StreamElement("b")]))
+        self.assertFalse(writer.is_empty([StreamValues("a", [1], render, ())]))
+        render.assert_called_once()
+
+    def test_escape(self):
+        self.assertEqual("&lt;a&gt; &amp; &#13;", escape_text("<a> & \r"))
+        self.assertEqual("&lt;&quot;&#10;&#9;&#13;'", escape_attribute("<\"\n\t\r'"))
@@ -1,9 +1,26 @@
+import io
+import json
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from decimal import Decimal
+from typing import List
+from typing import Optional
+from unittest import mock
 from unittest.case import TestCase
 
+from lxml.etree import QName
+
 from tests.fixtures.books import BookForm
 from tests.fixtures.books import Books
+from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.serializers import DictFactory
 from xsdata.formats.dataclass.serializers import DictSerializer
+from xsdata.formats.dataclass.serializers import JsonSerializer
+from xsdata.formats.dataclass.serializers.json import compile_getter
+from xsdata.formats.dataclass.serializers.json import encode_scalar
+from xsdata.formats.dataclass.serializers.json import JsonEncoder
+from xsdata.models.enums import Namespace
 
 
 class DictSerializerTests(TestCase):
@@ -57,3 +74,135 @@ class DictSerializerTests(TestCase):
             ]
         }
         self.assertEqual(expected, actual)
+
+    def test_render_with_local_names(self):
+        serializer = DictSerializer(local_names=True)
+        actual = serializer.render(Aliased(first="a"))
+
+        self.assertEqual({"First": "a", "values": []}, actual)
+
+    def test_encode(self):
+        serializer = DictSerializer()
+        element = AnyElement(
+            qname=QName("foo", "bar"),
+            children=["a", AnyElement(text=Decimal("1.5"))],
+            attributes={"a": Namespace.XS},
+        )
+        expected = {
+            "qname": "{foo}bar",
+            "text": None,
+            "tail": None,
+            "ns_map": {},
+            "children": [
+                "a",
+                {
+                    "qname": None,
+                    "text": "1.5",
+                    "tail": None,
+                    "ns_map": {},
+                    "children": [],
+                    "attributes": {},
+                },
+            ],
+            "attributes": {"a": Namespace.XS.value},
+        }
+
+        self.assertEqual(expected, serializer.encode(element))
+        self.assertEqual([1, "a"], serializer.encode((1, "a")))
+        self.assertEqual({}, serializer.encode(Empty()))
+        self.assertEqual([AnyElement, Empty], list(serializer.accessors))
+
+    def test_compile_getter(self):
+        obj = Aliased(first="a", values=[1])
+
+        self.assertEqual(("a", [1]), compile_getter(("first", "values"))(obj))
+        self.assertEqual(("a",), compile_getter(("first",))(obj))
+        self.assertEqual((), compile_getter(())(obj))
+
+    def test_pickle_resets_accessors(self):
+        serializer = DictSerializer()
+        serializer.render(self.books)
+
+        clone = pickle.loads(pickle.dumps(serializer))
+        self.assertEqual({}, clone.accessors)
+        self.assertEqual(serializer.render(self.books), clone.render(self.books))
+
+
+class JsonSerializerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.books = Books(book=[BookForm(id="bk001", title="The First Book")])
+
+    def test_write(self):
+        serializer = JsonSerializer(indent=2)
+        target = io.BytesIO()
+        serializer.write(self.books, target)
+
+        self.assertFalse(target.closed)
+        self.assertEqual(serializer.render(self.books), target.getvalue().decode())
+        self.assertEqual("bk001", json.loads(target.getvalue())["book"][0]["id"])
+
+    def test_write_with_nested_values(self):
+        element = AnyElement(
+            qname=QName("foo"),
+            children=["a", 1, 1.5, True, AnyElement(), [], [None, Namespace.XS]],
+            attributes={"a": "b", 1: Decimal("1.5")},
+        )
+        for indent in (None, 0, 2):
+            serializer = JsonSerializer(
+                indent=indent, dict_factory=DictFactory.FILTER_NONE
+            )
+            target = io.BytesIO()
+            serializer.write(element, target)
+
+            self.assertEqual(serializer.render(element), target.getvalue().decode())
+
+    def test_write_lines(self):
+        serializer = JsonSerializer(indent=2, dict_factory=DictFactory.FILTER_NONE)
+        target = io.BytesIO()
+        books = (BookForm(id=f"bk{i}", title="Title") for i in range(3))
+        serializer.write_lines(books, target)
+
+        self.assertEqual(
+            (
+                '{"title": "Title", "id": "bk0", "lang": "en"}\n'
+                '{"title": "Title", "id": "bk1", "lang": "en"}\n'
+                '{"title": "Title", "id": "bk2", "lang": "en"}\n'
+            ),
+            target.getvalue().decode(),
+        )
+
+    def test_write_chunks(self):
+        target = mock.Mock()
+        JsonSerializer.write_chunks(iter(["ab", "c", "dé", "f"]), target, 3)
+
+        self.assertEqual(
+            [mock.call(b"abc"), mock.call("déf".encode())], target.write.mock_calls,
+        )
+
+    def test_encode_scalar(self):
+        encoder = JsonEncoder()
+
+        self.assertEqual("null", encode_scalar(None, encoder))
+        self.assertEqual('"a\\""', encode_scalar('a"', encoder))
+        self.assertEqual("1.5", encode_scalar(1.5, encoder))
+        self.assertEqual("NaN", encode_scalar(float("nan"), encoder))
+        self.assertEqual("1", encode_scalar(1, encoder))
+        self.assertEqual("false", encode_scalar(False, encoder))
+        self.assertIsNone(encode_scalar(Namespace.XS, encoder))
+        self.assertIsNone(encode_scalar([], encoder))
+
+    def test_dict_serializer_has_no_binary_output(self):
+        self.assertFalse(hasattr(DictSerializer(), "write"))
+        self.assertFalse(hasattr(DictSerializer(), "to_path"))
+
+
+@dataclass
+class Aliased:
+    first: Optional[str] = field(default=None, metadata=dict(name="First"))
+    values: List[int] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@dataclass
+class Empty:
+    pass
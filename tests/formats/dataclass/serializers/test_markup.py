@@ -0,0 +1,180 @@
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+from typing import Optional
+from unittest import mock
+from unittest.case import TestCase
+
+from lxml.etree import QName
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from tests.fixtures.defxmlschema.chapter12 import Items
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers import XmlStringSerializer
+from xsdata.formats.dataclass.serializers.markup import Indentation
+from xsdata.formats.dataclass.serializers.markup import indentation
+from xsdata.formats.dataclass.serializers.markup import MarkupBuilder
+
+fixtures = Path(__file__).parent.parent.parent.parent.joinpath("fixtures")
+
+
+@dataclass
+class Leaves:
+    text: Optional[str] = field(
+        default=None, metadata=dict(type="Element", nillable=True)
+    )
+    price: Optional[Decimal] = field(default=None, metadata=dict(type="Element"))
+    code: Optional[QName] = field(default=None, metadata=dict(type="Element"))
+    first: List[int] = field(
+        default_factory=list, metadata=dict(type="Element", sequential=True)
+    )
+    second: List[int] = field(
+        default_factory=list, metadata=dict(type="Element", sequential=True)
+    )
+    wildcard: List[object] = field(
+        default_factory=list, metadata=dict(type="Wildcard", namespace="##any")
+    )
+    lang: Optional[str] = field(default=None, metadata=dict(type="Attribute"))
+
+
+class XmlStringSerializerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.serializer = XmlStringSerializer(pretty_print=True)
+        self.books = Books(
+            book=[
+                BookForm(
+                    id="bk001",
+                    author="Hightower, Kim",
+                    title="The First Book",
+                    genre="Fiction",
+                    price=44.95,
+                    pub_date="2000-10-01",
+                    review="An amazing story of nothing.",
+                ),
+                BookForm(id="bk002", author="Nagata, Suanne", title="Becoming"),
+            ]
+        )
+
+    def assert_same_output(self, obj, **kwargs):
+        expected = XmlSerializer(**kwargs).render(obj)
+        self.assertEqual(expected, XmlStringSerializer(**kwargs).render(obj))
+
+    def test_render(self):
+        self.assert_same_output(self.books)
+        self.assert_same_output(self.books, pretty_print=True)
+        self.assert_same_output(self.books, xml_declaration=False)
+
+    def test_render_with_mixed_content(self):
+        path = fixtures.joinpath("defxmlschema", "chapter12.xml")
+        items = XmlParser().from_path(path, Items)
+
+        self.assert_same_output(items)
+        self.assert_same_output(items, pretty_print=True)
+
+    def test_render_with_leaf_values(self):
+        obj = Leaves(
+            text="a < b & c\r",
+            price=Decimal("1.50"),
+            code=QName("urn:a", "b"),
+            first=[1, 2, 3],
+            second=[4],
+            wildcard=["tail", AnyElement(qname="c", text="d", tail="e")],
+            lang='e\t"n"',
+        )
+        self.assert_same_output(obj)
+        self.assert_same_output(obj, pretty_print=True)
+        self.assert_same_output(Leaves(text=""), pretty_print=True)
+
+        expected = (
+            '<Leaves xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            '<text xsi:nil="true"/>'
+            "</Leaves>"
+        )
+        actual = XmlStringSerializer(xml_declaration=False).render(Leaves(text=""))
+        self.assertEqual(expected, actual)
+
+    def test_render_with_encoding(self):
+        obj = Leaves(text="ü€")
+        expected = (
+            "<?xml version='1.0' encoding='ascii'?>\n"
+            "<Leaves><text>&#252;&#8364;</text></Leaves>"
+        )
+        self.assertEqual(expected, XmlStringSerializer(encoding="ascii").render(obj))
+        self.assert_same_output(obj, encoding="ascii")
+
+    def test_render_with_iterator(self):
+        expected = self.serializer.render(self.books)
+        books = Books(book=iter(self.books.book))
+
+        self.assertEqual(expected, self.serializer.render(books))
+
+    def test_render_with_unknown_namespaces(self):
+        obj = Leaves(
+            wildcard=[
+                AnyElement(qname="{urn:b}any", attributes={"{urn:c}x": "y"}),
+                AnyElement(qname="{urn:b}any", ns_map={"ns0": "urn:d"}),
+            ]
+        )
+        expected_namespaces = Namespaces()
+        expected_namespaces.add("urn:a", "a")
+        expected = XmlSerializer().render(obj, expected_namespaces)
+
+        namespaces = Namespaces()
+        namespaces.add("urn:a", "a")
+        with mock.patch.object(
+            XmlSerializer, "render", return_value=expected
+        ) as mock_render:
+            self.assertEqual(expected, XmlStringSerializer().render(obj, namespaces))
+
+        mock_render.assert_called_once_with(obj, namespaces)
+        self.assertEqual({"a": "urn:a"}, namespaces.ns_map)
+        self.assertEqual(1, namespaces.auto_ns)
+
+    def test_build_with_changed_prefixes(self):
+        obj = Leaves(
+            wildcard=[
+                AnyElement(qname="{urn:a}first"),
+                AnyElement(qname="{urn:a}second", ns_map={"a": "urn:a"}),
+            ]
+        )
+        namespaces = Namespaces()
+        namespaces.add("urn:a")
+        builder = MarkupBuilder(self.serializer, namespaces)
+        meta = self.serializer.context.build(Leaves)
+
+        self.assertIsNone(builder.build(obj, meta))
+        self.assertEqual({"urn:a": "ns0"}, builder.used)
+        self.assertEqual("a", builder.prefixes["urn:a"])
+        self.assert_same_output(obj)
+
+    def test_plan(self):
+        plan = self.serializer.plan(BookForm)
+
+        self.assertIs(plan, self.serializer.plan(BookForm))
+        self.assertEqual(["author", "title", "genre"], [x.name for x in plan.vars][:3])
+        self.assertEqual(MarkupBuilder.render_leaf_value, plan.handlers[0])
+        self.assertEqual(MarkupBuilder.render_attribute, plan.handlers[-1])
+        self.assertEqual(("a", "b", "c"), plan.getter(BookForm("a", "b", "c"))[:3])
+        self.assertIsNone(self.serializer.plan(Leaves).getter)
+
+    def test_pickle_resets_plans(self):
+        self.serializer.render(self.books)
+        serializer = pickle.loads(pickle.dumps(self.serializer))
+
+        self.assertEqual({}, serializer.plans)
+        self.assertEqual(
+            self.serializer.render(self.books), serializer.render(self.books)
+        )
+
+    def test_indentation(self):
+        self.assertIsInstance(indentation(2), Indentation)
+        self.assertEqual("\n    ", indentation(2))
+        self.assertIs(indentation(2), indentation(2))
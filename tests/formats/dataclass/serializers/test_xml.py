@@ -1,3 +1,4 @@
+import io
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import replace
@@ -25,6 +26,7 @@ from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.backends import EtreeBackend
 from xsdata.formats.dataclass.serializers.utils import SerializeUtils
 from xsdata.models.enums import QNames
 
@@ -55,6 +57,87 @@ class XmlSerializerTests(TestCase):
             ]
         )
 
+    def test_write(self):
+        for backend in (self.serializer.backend, EtreeBackend()):
+            serializer = XmlSerializer(pretty_print=True, backend=backend)
+            target = io.BytesIO()
+            serializer.write(self.books, target)
+
+            self.assertEqual(serializer.render(self.books), target.getvalue().decode())
+
+    def test_write_with_iterator(self):
+        expected = self.serializer.render(self.books)
+        books = Books(book=iter(self.books.book))
+        target = io.BytesIO()
+        self.serializer.write(books, target)
+
+        self.assertEqual(expected, target.getvalue().decode())
+
+    def test_write_with_unknown_namespaces(self):
+        @dataclass
+        class Root:
+            wildcard: List[object] = field(
+                default_factory=list, metadata=dict(type="Wildcard", namespace="##any"),
+            )
+
+        obj = Root(
+            wildcard=[
+                AnyElement(qname=QName("urn:b", "any"), attributes={"{urn:c}x": "y"}),
+                AnyElement(qname=QName("urn:b", "any"), text=QName("urn:d", "v")),
+            ]
+        )
+        target = io.BytesIO()
+        XmlSerializer(xml_declaration=False).write(obj, target)
+
+        expected = (
+            '<Root xmlns:ns0="urn:d">'
+            '<ns1:any xmlns:ns1="urn:b" xmlns:ns2="urn:c" ns2:x="y"/>'
+            '<ns3:any xmlns:ns3="urn:b">ns0:v</ns3:any>'
+            "</Root>"
+        )
+        self.assertEqual(expected, target.getvalue().decode())
+
+    def test_write_with_empty_iterator(self):
+        for pretty_print in (False, True):
+            serializer = XmlSerializer(pretty_print=pretty_print)
+            target = io.BytesIO()
+            serializer.write(Books(book=iter([])), target)
+
+            expected = serializer.render(Books(book=[]))
+            self.assertEqual(expected, target.getvalue().decode())
+            self.assertIn('<ns0:books xmlns:ns0="urn:books"/>', expected)
+
+    def test_write_with_records_namespaces(self):
+        @dataclass
+        class Record:
+            value: int = field(metadata=dict(type="Element", namespace="urn:b"))
+            any: Optional[object] = field(
+                default=None, metadata=dict(type="Wildcard", namespace="##any")
+            )
+
+        @dataclass
+        class Root:
+            records: Iterator[Record] = field(
+                metadata=dict(type="Element", namespace="urn:a")
+            )
+
+        records = [
+            Record(1),
+            Record(2, AnyElement(qname="{urn:c}x", ns_map={"c": "urn:c"})),
+            Record(3, AnyElement(qname="{urn:c}x")),
+        ]
+        target = io.BytesIO()
+        XmlSerializer(xml_declaration=False).write(Root(iter(records)), target)
+
+        expected = (
+            '<Root xmlns:ns0="urn:a" xmlns:ns1="urn:b">'
+            "<ns0:records><ns1:value>1</ns1:value></ns0:records>"
+            '<ns0:records><ns1:value>2</ns1:value><c:x xmlns:c="urn:c"/></ns0:records>'
+            '<ns0:records><ns1:value>3</ns1:value><c:x xmlns:c="urn:c"/></ns0:records>'
+            "</Root>"
+        )
+        self.assertEqual(expected, target.getvalue().decode())
+
     def test_render(self):
         actual = self.serializer.render(self.books)
 
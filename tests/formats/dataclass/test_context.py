@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from dataclasses import make_dataclass
 from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Iterator
 from unittest import mock
 from unittest import TestCase
@@ -14,12 +16,14 @@ from tests.fixtures.defxmlschema.chapter05prod import ProductType
 from tests.fixtures.defxmlschema.chapter13 import ItemsType
 from tests.fixtures.defxmlschema.chapter16 import Umbrella
 from xsdata.exceptions import XmlContextError
+from xsdata.formats.converters import compile_converter
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.formats.dataclass.models.elements import XmlAttribute
 from xsdata.formats.dataclass.models.elements import XmlElement
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlWildcard
+from xsdata.formats.dataclass.store import MetaStore
 from xsdata.utils import text
 
 
@@ -94,24 +98,33 @@ class XmlContextTests(TestCase):
         self.assertEqual(a, self.ctx.find_subclass(c, "A"))
         self.assertIsNone(self.ctx.find_subclass(c, "What"))
 
-    def test_match_class_name(self):
-        qname_foo = QName("qname_foo")
-        qname_items = QName("ItemsType")
-        qname_product = QName("http://example.org/prod", "product")
-        qname_object = QName("object")
-        qname_int = QName("int")
+    def test_find_subclass_with_registry(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        c = make_dataclass("C", fields=[], bases=(b,))
+        other = make_dataclass("C", fields=[])
+
+        self.ctx.build(other)
+        self.assertEqual([other], self.ctx.xsi_cache["C"])
 
-        # no meta name
-        self.assertFalse(self.ctx.match_class_source_qname(ItemsType, qname_foo))
-        self.assertTrue(self.ctx.match_class_source_qname(ItemsType, qname_items))
+        with mock.patch.object(
+            XmlContext, "scan_hierarchy", wraps=self.ctx.scan_hierarchy
+        ) as mock_scan_hierarchy:
+            self.assertEqual(c, self.ctx.find_subclass(a, "C"))
+            self.assertEqual(c, self.ctx.find_subclass(a, "C"))
+            self.assertIsNone(self.ctx.find_subclass(a, "What"))
+            self.assertEqual(other, self.ctx.find_subclass(other, "C"))
 
-        # with meta name
-        self.assertFalse(self.ctx.match_class_source_qname(Product, qname_items))
-        self.assertTrue(self.ctx.match_class_source_qname(Product, qname_product))
+        mock_scan_hierarchy.assert_called_once_with(a)
+        self.assertEqual([other, c], self.ctx.xsi_cache["C"])
+        self.assertEqual({a}, self.ctx.xsi_scanned)
+
+    def test_find_subclass_with_prebuilt_cache(self):
+        a = make_dataclass("A", fields=[])
+        b = make_dataclass("B", fields=[], bases=(a,))
+        ctx = XmlContext(cache={b: self.ctx.build(b)})
 
-        # not dataclass
-        self.assertFalse(self.ctx.match_class_source_qname(object, qname_object))
-        self.assertFalse(self.ctx.match_class_source_qname(int, qname_int))
+        self.assertEqual(b, ctx.find_subclass(a, "B"))
 
     @mock.patch.object(XmlContext, "get_type_hints")
     def test_build_build_vars(self, mock_get_type_hints):
@@ -175,6 +188,45 @@ class XmlContextTests(TestCase):
 
         self.assertEqual(f"Object {int} is not a dataclass.", str(cm.exception))
 
+    def test_build_with_store(self):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir).joinpath("meta.pickle")
+            ctx = XmlContext(store=MetaStore(path))
+            expected = ctx.build(Books)
+            ctx.store.save()
+
+            ctx = XmlContext(store=MetaStore(path))
+            with mock.patch.object(XmlContext, "build_meta") as mock_build_meta:
+                actual = ctx.build(Books)
+                self.assertEqual(0, mock_build_meta.call_count)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(
+            [var.default for var in expected.vars], [var.default for var in actual.vars]
+        )
+
+        key = MetaStore.key(Books, None)
+        self.assertEqual(
+            ["tests.fixtures.books"],
+            [module for module, _ in ctx.store.entries[key][0]],
+        )
+
+    def test_build_package(self):
+        ctx = XmlContext()
+        self.assertEqual(3, ctx.build_package("tests.fixtures.books"))
+        self.assertEqual(67, ctx.build_package("tests.fixtures.defxmlschema"))
+        self.assertIn(Books, ctx.cache)
+        self.assertIn(Umbrella, ctx.cache)
+
+    def test_dump_meta_and_load_meta(self):
+        meta = self.ctx.build(BookForm)
+        data = self.ctx.dump_meta(meta)
+
+        self.assertEqual(
+            ("BookForm", "BookForm", "{urn:books}BookForm", False), data[:4]
+        )
+        self.assertEqual(meta, XmlContext.load_meta(BookForm, data))
+
     def test_get_type_hints(self):
         result = self.ctx.get_type_hints(BookForm, None)
         self.assertIsInstance(result, Iterator)
@@ -198,6 +250,15 @@ class XmlContextTests(TestCase):
             self.assertFalse(var.dataclass)
             self.assertIsNone(var.clazz)
 
+    def test_get_type_hints_compiles_converters(self):
+        for var in self.ctx.get_type_hints(BookForm, None):
+            self.assertIs(compile_converter(var.types), var.converter)
+            self.assertFalse(var.needs_ns_map)
+
+        clazz = make_dataclass("Foo", [("a", QName), ("b", int)])
+        result = list(self.ctx.get_type_hints(clazz, None))
+        self.assertEqual([True, False], [var.needs_ns_map for var in result])
+
     def test_get_type_hints_with_dataclass_list(self):
         result = list(self.ctx.get_type_hints(Books, None))
 
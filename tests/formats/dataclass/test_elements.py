@@ -92,6 +92,8 @@ class XmlWildcardTests(TestCase):
         var = XmlWildcard(name="foo", qname=QName("foo"), namespaces=["tns"])
         self.assertFalse(var.matches(QName("a")))
         self.assertTrue(var.matches(QName("tns", "a")))
+        self.assertTrue(var.matches("{tns}a"))
+        self.assertFalse(var.matches("a"))
 
         var = XmlWildcard(name="foo", qname=QName("foo"), namespaces=["##any"])
         self.assertTrue(var.matches(QName("a")))
@@ -183,3 +185,52 @@ class XmlMetaTests(TestCase):
 
         meta.cache[key] = meta._find_var(title)
         self.assertEqual("title", meta.find_var(author).name)
+
+    def test_compiled_lookups(self):
+        text = XmlText(name="a", qname=QName("a"))
+        elem = XmlElement(name="b", qname=QName("tns", "b"))
+        attr = XmlAttribute(name="c", qname=QName("c"))
+        attrs = XmlAttributes(name="d", qname=QName("d"))
+        wild = XmlWildcard(name="e", qname=QName("e"), namespaces=["tns"])
+        dupe = XmlElement(name="f", qname=QName("tns", "b"))
+
+        meta = XmlMeta(
+            name="foo",
+            clazz=BookForm,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=[text, elem, attr, attrs, wild, dupe],
+        )
+
+        self.assertEqual({"a": text, "{tns}b": elem}, meta.element_vars)
+        self.assertEqual({"c": attr}, meta.attribute_vars)
+        self.assertEqual(text, meta.text_var)
+        self.assertEqual(wild, meta.wildcard_var)
+        self.assertEqual(attrs, meta.attributes_var)
+        self.assertEqual([wild], meta.wildcard_vars)
+
+    def test_find_element(self):
+        elem = XmlElement(name="a", qname=QName("tns", "a"))
+        wild = XmlWildcard(name="b", qname=QName("b"), namespaces=["tns"])
+        meta = XmlMeta(
+            name="foo",
+            clazz=BookForm,
+            qname=QName("foo"),
+            source_qname=QName("foo"),
+            nillable=False,
+            vars=[elem, wild],
+        )
+
+        self.assertEqual(elem, meta.find_element("{tns}a"))
+        self.assertEqual(elem, meta.find_element(QName("tns", "a")))
+        self.assertEqual(wild, meta.find_element("{tns}b"))
+        self.assertIsNone(meta.find_element("b"))
+        self.assertEqual({"{tns}b": wild, "b": None}, meta.wildcard_cache)
+
+    def test_find_attribute(self):
+        ctx = XmlContext()
+        meta = ctx.build(BookForm)
+
+        self.assertEqual("id", meta.find_attribute("id").name)
+        self.assertIsNone(meta.find_attribute("author"))
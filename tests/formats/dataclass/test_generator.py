@@ -99,6 +99,16 @@ class DataclassGeneratorTests(FactoryTestCase):
         )
         self.assertEqual(expected, actual)
 
+    def test_render_classes_with_slots(self):
+        classes = [ClassFactory.enumeration(2), ClassFactory.elements(2)]
+
+        actual = DataclassGenerator().render_classes(classes)
+        self.assertNotIn("@slotted", actual)
+
+        actual = DataclassGenerator(slots=True).render_classes(classes)
+        self.assertEqual(1, actual.count("@slotted\n@dataclass\nclass ClassC:"))
+        self.assertNotIn("@slotted\nclass ClassB", actual)
+
     def test_module_name(self):
         self.assertEqual("foo_bar", DataclassGenerator.module_name("fooBar"))
         self.assertEqual("foo_bar_wtf", DataclassGenerator.module_name("fooBar.wtf"))
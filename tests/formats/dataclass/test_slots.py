@@ -0,0 +1,100 @@
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from typing import List
+from typing import Optional
+from unittest import TestCase
+
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.parsers import JsonParser
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import JsonSerializer
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.slots import slotted
+
+
+@slotted
+@dataclass
+class Base:
+    class Meta:
+        name = "base"
+        namespace = "urn:slots"
+
+    id: Optional[str] = field(default=None, metadata=dict(type="Attribute"))
+    items: List[int] = field(default_factory=list, metadata=dict(type="Element"))
+
+
+@slotted
+@dataclass
+class Derived(Base):
+    class Meta:
+        name = "derived"
+
+    version: str = field(init=False, default="1.0", metadata=dict(type="Attribute"))
+    items: List[int] = field(
+        default_factory=list, metadata=dict(type="Element", name="item")
+    )
+
+
+@slotted
+@dataclass
+class Holder:
+    class Meta:
+        name = "holder"
+
+    value: Optional[Derived] = field(
+        default=None, metadata=dict(type="Element", name="a")
+    )
+    any: Optional[object] = field(default=None, metadata=dict(type="Wildcard"))
+
+
+class SlottedTests(TestCase):
+    def test_slotted(self):
+        obj = Derived(id="a", items=[1, 2])
+
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual(("id", "items", "qname"), Base.__slots__)
+        self.assertEqual(("version",), Derived.__slots__)
+        self.assertEqual("Derived", Derived.__qualname__)
+        self.assertEqual("derived", Derived.Meta.name)
+        self.assertEqual(["id", "items", "version"], [x.name for x in fields(obj)])
+        self.assertEqual("1.0", obj.version)
+        self.assertEqual([], Derived().items)
+        self.assertIsNot(Derived().items, Derived().items)
+        self.assertEqual(obj, pickle.loads(pickle.dumps(obj)))
+
+        with self.assertRaises(AttributeError):
+            obj.foo = "bar"
+
+        obj.qname = "foo"
+        self.assertEqual("foo", obj.qname)
+
+    def test_bindings_with_wildcard(self):
+        xml = '<holder><a id="x"/><a id="y"/></holder>'
+        obj = XmlParser().from_string(xml, Holder)
+
+        self.assertEqual(Derived(id="y"), obj.any)
+        self.assertEqual("a", obj.any.qname)
+
+        actual = XmlSerializer(xml_declaration=False).render(obj)
+        expected = '<holder><a id="x" version="1.0"/><a id="y" version="1.0"/></holder>'
+        self.assertEqual(expected, actual)
+
+    def test_slotted_with_invalid_class(self):
+        with self.assertRaises(TypeError):
+            slotted(int)
+
+    def test_bindings(self):
+        obj = Derived(id="a", items=[1, 2])
+
+        meta = XmlContext().build(Derived)
+        self.assertEqual("derived", meta.qname.text)
+        self.assertEqual("1.0", meta.find_var("version").default)
+
+        xml = XmlSerializer().render(obj)
+        self.assertEqual(obj, XmlParser().from_string(xml, Derived))
+
+        obj = Base(id="a", items=[1, 2])
+        json = JsonSerializer().render(obj)
+        self.assertEqual(obj, JsonParser().from_string(json, Base))
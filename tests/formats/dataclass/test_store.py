@@ -0,0 +1,111 @@
+import pickle
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+from unittest import TestCase
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.store import MetaStore
+from xsdata.models.enums import Namespace
+
+
+class MetaStoreTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = TemporaryDirectory()
+        self.path = Path(self.tmpdir.name).joinpath("meta.pickle")
+        self.store = MetaStore(self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def test_add_and_get(self):
+        self.assertIsNone(self.store.get(Books, None))
+
+        self.store.add(Books, None, ["tests.fixtures.books"] * 2, ("data",))
+        self.assertEqual(("data",), self.store.get(Books, None))
+        self.assertIsNone(self.store.get(Books, "foo"))
+
+        key = ("tests.fixtures.books", "Books", None)
+        hashed = self.store.module_hash("tests.fixtures.books")
+        self.assertEqual(
+            ((("tests.fixtures.books", hashed),), ("data",)), self.store.entries[key]
+        )
+
+    def test_get_with_changed_dependency(self):
+        self.store.add(Books, None, ["tests.fixtures.books"], ("data",))
+        self.store.add(BookForm, None, ["tests.fixtures.books"], ("form",))
+        self.store.hashes["tests.fixtures.books"] = "foo"
+        self.store.add(Books, None, ["tests.fixtures.books"], ("new",))
+
+        self.assertEqual(("new",), self.store.get(Books, None))
+        self.assertIsNone(self.store.get(BookForm, None))
+
+    def test_get_with_dependency_without_source(self):
+        self.store.add(Books, None, ["sys"], ("data",))
+
+        self.assertEqual(
+            (("sys", None),),
+            self.store.entries[("tests.fixtures.books", "Books", None)][0],
+        )
+        self.assertIsNone(self.store.get(Books, None))
+
+    def test_save_and_load(self):
+        self.store.add(Books, None, ["tests.fixtures.books"], ("books",))
+        self.store.add(BookForm, None, ["sys"], ("form",))
+        self.store.save()
+
+        store = MetaStore(self.path)
+        self.assertEqual(("books",), store.get(Books, None))
+        self.assertIsNone(store.get(BookForm, None))
+        self.assertEqual(1, len(store.entries))
+        self.assertTrue(store.loaded)
+
+    def test_load_with_invalid_file(self):
+        self.path.write_bytes(b"foo")
+
+        with mock.patch("xsdata.formats.dataclass.store.logger") as mock_logger:
+            self.store.load()
+            self.store.load()
+
+        self.assertTrue(self.store.loaded)
+        self.assertEqual({}, self.store.entries)
+        mock_logger.warning.assert_called_once()
+
+    def test_load_merges_entries(self):
+        self.store.add(Books, None, ["tests.fixtures.books"], ("new",))
+        key = MetaStore.key(Books, None)
+        other = MetaStore.key(BookForm, None)
+        with self.path.open("wb") as fp:
+            pickle.dump({key: ((), "old"), other: ((), "form")}, fp)
+
+        self.store.load()
+        self.assertEqual(("new",), self.store.entries[key][1])
+        self.assertEqual(((), "form"), self.store.entries[other])
+
+    def test_module_hash(self):
+        actual = self.store.module_hash("tests.fixtures.books")
+        source = Path(sys.modules["tests.fixtures.books"].__file__).read_bytes()
+
+        self.assertEqual(16, len(actual))
+        self.assertEqual(actual, self.store.hashes["tests.fixtures.books"])
+        self.assertIsNone(self.store.module_hash("sys"))
+        self.assertIsNone(self.store.module_hash("foo.bar"))
+
+        with mock.patch.object(Path, "read_bytes", return_value=source + b"#"):
+            self.assertEqual(actual, self.store.module_hash("tests.fixtures.books"))
+            self.store.hashes.clear()
+            self.assertNotEqual(actual, self.store.module_hash("tests.fixtures.books"))
+
+    def test_dependencies(self):
+        actual = MetaStore.dependencies(Books, [str, BookForm, Namespace, object])
+        expected = [
+            "tests.fixtures.books",
+            "tests.fixtures.books",
+            "tests.fixtures.books",
+            "xsdata.models.enums",
+        ]
+        self.assertEqual(expected, list(actual))
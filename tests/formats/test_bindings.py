@@ -0,0 +1,228 @@
+import gzip
+import mmap
+import pickle
+import tempfile
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+from unittest import TestCase
+
+from lxml import etree
+from lxml.etree import QName
+
+from tests.fixtures.defxmlschema.chapter01 import Product
+from xsdata.exceptions import ParserError
+from xsdata.formats import bindings
+from xsdata.formats.bindings import BufferReader
+from xsdata.formats.bindings import ParseResult
+from xsdata.formats.dataclass.parsers import JsonParser
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.serializers import JsonSerializer
+from xsdata.formats.dataclass.serializers import XmlSerializer
+
+fixtures = Path(__file__).parent.parent.joinpath("fixtures/defxmlschema")
+
+
+@dataclass
+class Named:
+    value: Optional[QName] = field(default=None, metadata=dict(type="Attribute"))
+
+
+class BufferReaderTests(TestCase):
+    def test_read(self):
+        reader = BufferReader(bytearray(b"abcde"))
+
+        self.assertTrue(reader.readable())
+        self.assertEqual(b"ab", reader.read(2))
+        self.assertEqual(b"cde", reader.read(10))
+        self.assertEqual(b"", reader.read(1))
+
+        reader.position = 1
+        self.assertEqual(b"bcde", reader.read())
+
+        reader.close()
+        self.assertTrue(reader.closed)
+
+    def test_readinto(self):
+        reader = BufferReader(memoryview(b"abc"))
+        target = bytearray(2)
+
+        self.assertEqual(2, reader.readinto(target))
+        self.assertEqual(b"ab", target)
+        self.assertEqual(1, reader.readinto(target))
+        self.assertEqual(b"cb", target)
+
+
+class AbstractParserTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.xml_path = fixtures.joinpath("chapter01.xml")
+        self.json_path = fixtures.joinpath("chapter01.json")
+
+    def test_from_path(self):
+        xml_parser = XmlParser()
+        json_parser = JsonParser()
+        expected = xml_parser.from_bytes(self.xml_path.read_bytes(), Product)
+
+        self.assertEqual(expected, xml_parser.from_path(self.xml_path, Product))
+        self.assertEqual(expected, json_parser.from_path(self.json_path, Product))
+
+    def test_from_path_with_compressed_files(self):
+        parser = XmlParser()
+        expected = parser.from_path(self.xml_path, Product)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for suffix in (".gz", ".bz2", ".xz", ".lzma"):
+                path = Path(tmp).joinpath(f"chapter01.xml{suffix}")
+                XmlSerializer().to_path(expected, path)
+
+                self.assertNotEqual(b"<", path.read_bytes()[:1])
+                self.assertEqual(expected, parser.from_path(path, Product))
+
+                path = Path(tmp).joinpath(f"chapter01.json{suffix}")
+                JsonSerializer().to_path(expected, path)
+                self.assertEqual(expected, JsonParser().from_path(path, Product))
+
+            path = Path(tmp).joinpath("chapter01.xml")
+            path.write_bytes(gzip.compress(self.xml_path.read_bytes()))
+            self.assertEqual(expected, parser.from_path(path, Product))
+
+    def test_from_bytes_with_buffers(self):
+        parser = XmlParser()
+        source = self.xml_path.read_bytes()
+        expected = parser.from_bytes(source, Product)
+
+        self.assertEqual(expected, parser.from_bytes(bytearray(source), Product))
+        self.assertEqual(expected, parser.from_bytes(memoryview(source), Product))
+
+        with self.xml_path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.assertEqual(expected, parser.from_bytes(buffer, Product))
+
+        source = self.json_path.read_bytes()
+        actual = JsonParser().from_bytes(memoryview(source), Product)
+        self.assertEqual(expected, actual)
+
+    def test_parse_many(self):
+        parser = XmlParser()
+        expected = parser.from_path(self.xml_path, Product)
+        sources = [self.xml_path, str(self.xml_path), b"", self.xml_path]
+
+        results = list(parser.parse_many(sources, Product, workers=2, chunksize=3))
+
+        self.assertEqual([0, 1, 2, 3], [result.index for result in results])
+        self.assertEqual(ParseResult(0, obj=expected), results[0])
+        self.assertEqual(ParseResult(1, obj=expected), results[1])
+        self.assertEqual(ParseResult(3, obj=expected), results[3])
+        self.assertIsNone(results[2].obj)
+        self.assertIsInstance(results[2].error, ParserError)
+
+    def test_parse_many_unordered(self):
+        parser = XmlParser()
+        sources = [self.xml_path] * 5
+
+        results = list(parser.parse_many(sources, Product, workers=2, ordered=False))
+
+        self.assertEqual([0, 1, 2, 3, 4], sorted(result.index for result in results))
+        self.assertTrue(all(isinstance(result.obj, Product) for result in results))
+
+    def test_parse_many_reads_sources_lazily(self):
+        consumed = []
+
+        def sources():
+            for index in range(10):
+                consumed.append(index)
+                yield self.xml_path
+
+        results = XmlParser().parse_many(sources(), Product, workers=1)
+
+        self.assertEqual(0, next(results).index)
+        self.assertEqual([0, 1], consumed)
+
+        results.close()
+        self.assertEqual([0, 1], consumed)
+
+    def test_parse_many_with_json_parser(self):
+        parser = JsonParser()
+        expected = parser.from_path(self.json_path, Product)
+        sources = [self.json_path, self.json_path.read_bytes(), b"{"]
+
+        results = list(parser.parse_many(sources, Product, workers=1))
+
+        self.assertEqual(expected, results[0].obj)
+        self.assertEqual(expected, results[1].obj)
+        self.assertIsNotNone(results[2].error)
+
+    def test_parse_many_with_qname_fields(self):
+        sources = [b'<Named value="a"/>', b'<Named value="{urn:b}c"/>']
+
+        results = list(XmlParser().parse_many(sources, Named, workers=1))
+
+        self.assertEqual(Named(QName("a")), results[0].obj)
+        self.assertEqual(Named(QName("urn:b", "c")), results[1].obj)
+
+        results = list(JsonParser().parse_many([b'{"value": "x"}'], Named, workers=1))
+        self.assertEqual(ParseResult(0, obj=Named(QName("x"))), results[0])
+
+    def test_parse_many_with_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            list(XmlParser().parse_many([], Product, chunksize=0))
+
+    def test_parse_chunk(self):
+        parser = XmlParser()
+        bindings.init_worker(parser, Product)
+
+        self.assertIs(parser, bindings.worker_parser)
+        self.assertIs(Product, bindings.worker_clazz)
+        self.assertIn(Product, parser.context.cache)
+
+        results = bindings.parse_chunk([(5, self.xml_path), (6, b"")])
+        self.assertEqual(5, results[0].index)
+        self.assertIsInstance(pickle.loads(results[0].obj), Product)
+        self.assertEqual(6, results[1].index)
+        self.assertIsInstance(results[1].error, ParserError)
+
+    def test_parse_chunk_with_unpicklable_object(self):
+        bindings.init_worker(XmlParser(), Product)
+        with mock.patch.object(XmlParser, "from_bytes", return_value=lambda: None):
+            results = bindings.parse_chunk([(1, b"")])
+
+        self.assertIsNone(results[0].obj)
+        self.assertIsInstance(results[0].error, Exception)
+
+    def test_load_result(self):
+        result = bindings.load_result(ParseResult(1, obj=pickle.dumps(QName("a"))))
+        self.assertEqual(ParseResult(1, obj=QName("a")), result)
+
+        result = bindings.load_result(ParseResult(2, obj=b"foo"))
+        self.assertIsNone(result.obj)
+        self.assertIsInstance(result.error, pickle.UnpicklingError)
+
+        error = ValueError()
+        result = bindings.load_result(ParseResult(3, error=error))
+        self.assertEqual(ParseResult(3, error=error), result)
+
+    def test_portable_error(self):
+        error = ValueError("foo")
+        self.assertIs(error, bindings.portable_error(error))
+
+        try:
+            etree.fromstring(b"<a>")
+        except etree.XMLSyntaxError as e:
+            error = e
+
+        actual = bindings.portable_error(error)
+        self.assertIsInstance(actual, ParserError)
+        self.assertTrue(str(actual).startswith("XMLSyntaxError: "))
+
+    def test_pickle_parser(self):
+        parser = XmlParser()
+        parser.from_path(self.xml_path, Product)
+
+        actual = pickle.loads(pickle.dumps(parser))
+        self.assertEqual({}, actual.context.cache)
+        self.assertEqual(
+            parser.config.handler.__class__, actual.config.handler.__class__
+        )
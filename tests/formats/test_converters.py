@@ -1,15 +1,27 @@
 from dataclasses import dataclass
+from dataclasses import field
 from decimal import Decimal
 from enum import Enum
+from typing import NamedTuple
 from unittest import TestCase
 
 from lxml.etree import QName
 
 from tests.fixtures.books import BookForm
 from xsdata.exceptions import ConverterError
+from xsdata.formats.converters import compile_converter
+from xsdata.formats.converters import compiled
+from xsdata.formats.converters import converters
+from xsdata.formats.converters import func_map
+from xsdata.formats.converters import register_converter
+from xsdata.formats.converters import requires_ns_map
+from xsdata.formats.converters import return_value
 from xsdata.formats.converters import to_python
 from xsdata.formats.converters import to_xml
+from xsdata.formats.converters import unregister_converter
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.parsers import JsonParser
 from xsdata.models.enums import UseType
 
 
@@ -109,3 +121,123 @@ class ConvertersTestCases(TestCase):
             pass
 
         self.assertEqual("1", to_python([Foo], "1"))
+
+    def test_compile_converter(self):
+        convert = compile_converter([int])
+        self.assertIs(convert, compile_converter((int,)))
+        self.assertEqual(1, convert("1"))
+        self.assertEqual("a", convert("a"))
+        self.assertEqual(2, convert(2))
+
+        convert = compile_converter([str])
+        self.assertIs(return_value, convert)
+
+        convert = compile_converter([bool, int, str, float])
+        self.assertEqual(True, convert("true"))
+        self.assertEqual(2, convert("2"))
+        self.assertEqual("a", convert("a"))
+
+        convert = compile_converter([object])
+        self.assertEqual("a", convert("a"))
+
+    def test_compile_converter_with_unhandled_types(self):
+        class Foo:
+            pass
+
+        self.assertIs(return_value, compile_converter([Foo]))
+        self.assertEqual(1, compile_converter([Foo, int])("1"))
+
+    def test_compile_converter_with_enum(self):
+        class IntType(Enum):
+            a = 1
+            b = 2
+            c = 1
+
+        class QNameType(Enum):
+            a = QName("xsdata", "a")
+
+        class EmptyType(Enum):
+            pass
+
+        convert = compile_converter([IntType])
+        self.assertEqual(IntType.a, convert("1"))
+        self.assertEqual(IntType.b, convert(" 2"))
+        self.assertEqual("3", convert("3"))
+        self.assertEqual("a", convert("a"))
+
+        convert = compile_converter([QNameType])
+        self.assertEqual(QNameType.a, convert("x:a", {"x": "xsdata"}))
+        self.assertEqual("x:b", convert("x:b", {"x": "xsdata"}))
+
+        self.assertIs(return_value, compile_converter([EmptyType]))
+
+    def test_requires_ns_map(self):
+        class QNameType(Enum):
+            a = QName("xsdata", "a")
+
+        self.assertTrue(requires_ns_map([int, QName]))
+        self.assertTrue(requires_ns_map([QNameType]))
+        self.assertFalse(requires_ns_map([int, str, UseType, BookForm]))
+
+    def test_register_converter(self):
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        def to_point(value: str) -> Point:
+            return Point(*map(int, value.split(",")))
+
+        with self.assertRaises(TypeError):
+            to_python([Point], "1,2")
+
+        register_converter(Point, to_point)
+        try:
+            self.assertEqual(Point(1, 2), to_python([Point], "1,2"))
+            self.assertEqual("a", to_python([Point], "a"))
+            self.assertEqual(Point(1, 2), to_python([int, Point], "1,2"))
+        finally:
+            unregister_converter(Point)
+
+        self.assertNotIn(Point, converters)
+        self.assertEqual({}, compiled)
+
+    def test_register_converter_resets_contexts(self):
+        class Point(NamedTuple):
+            value: str
+
+        @dataclass
+        class Shape:
+            point: Point = field(metadata=dict(type="Attribute"))
+
+        context = XmlContext()
+        parser = JsonParser()
+        self.assertEqual("1,2", context.build(Shape).vars[0].converter("1,2"))
+        self.assertEqual(Shape("1,2"), parser.parse_context({"point": "1,2"}, Shape))
+
+        register_converter(Point, lambda value: Point(value.replace(",", "|")))
+        try:
+            self.assertEqual({}, context.cache)
+            self.assertEqual({}, parser.plans)
+            converter = context.build(Shape).vars[0].converter
+            self.assertEqual(Point("1|2"), converter("1,2"))
+            self.assertEqual(
+                Shape(Point("1|2")), parser.parse_context({"point": "1,2"}, Shape)
+            )
+        finally:
+            unregister_converter(Point)
+
+        self.assertEqual("1,2", context.build(Shape).vars[0].converter("1,2"))
+
+    def test_func_map(self):
+        class Point(NamedTuple):
+            value: str
+
+        func_map["Point"] = lambda value: Point(value.upper())
+        try:
+            self.assertEqual(Point("A"), to_python([Point], "a"))
+        finally:
+            del func_map["Point"]
+
+        self.assertEqual({}, compiled)
+        self.assertEqual("a", to_python([Point], "a"))
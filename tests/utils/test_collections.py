@@ -7,3 +7,8 @@ class CollectionsTests(TestCase):
     def test_find(self):
         self.assertEqual(-1, collections.find([0, 1], 2))
         self.assertEqual(1, collections.find([0, 1], 1))
+
+    def test_chunked(self):
+        self.assertEqual([], list(collections.chunked([], 2)))
+        self.assertEqual([[1, 2], [3]], list(collections.chunked(iter([1, 2, 3]), 2)))
+        self.assertEqual([[1], [2]], list(collections.chunked([1, 2], 1)))
@@ -0,0 +1,86 @@
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
+from unittest import TestCase
+
+from lxml import etree
+
+from xsdata.utils import compat
+
+SCRIPT = """
+import sys
+sys.modules["lxml"] = None
+
+from tests.fixtures.books import BookForm
+from tests.fixtures.books import Books
+from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.handlers import XmlSaxHandler
+from xsdata.formats.dataclass.serializers import XmlSerializer
+from xsdata.formats.dataclass.serializers.backends import EtreeBackend
+
+obj = Books(book=[BookForm(id="a", author="b", title="c")])
+xml = XmlSerializer(backend=EtreeBackend()).render(obj)
+parser = XmlParser(config=ParserConfig(handler=XmlSaxHandler()))
+assert obj == parser.from_string(xml, Books)
+"""
+
+
+def load_without_lxml():
+    """Load a copy of the compat module as if lxml wasn't installed."""
+    spec = importlib.util.spec_from_file_location(
+        "compat_without_lxml", compat.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, {"lxml": None, "lxml.etree": None}):
+        spec.loader.exec_module(module)
+
+    return module
+
+
+class CompatTests(TestCase):
+    def test_lxml_qname(self):
+        self.assertIs(etree.QName, compat.QName)
+        self.assertIs(etree.Element, compat.Element)
+
+    def test_pure_qname(self):
+        QName = load_without_lxml().QName
+
+        for args in (("{urn}a",), ("urn", "a"), (QName("{urn}a"),)):
+            qname = QName(*args)
+            self.assertEqual("{urn}a", qname.text)
+            self.assertEqual("urn", qname.namespace)
+            self.assertEqual("a", qname.localname)
+            self.assertEqual("{urn}a", str(qname))
+
+        element = etree.Element("{urn}a")
+        self.assertEqual(QName("{urn}a"), QName(element))
+        self.assertEqual(QName("a"), QName(None, "a"))
+        self.assertIsNone(QName("a").namespace)
+
+        self.assertEqual(QName("a"), "a")
+        self.assertNotEqual(QName("a"), QName("b"))
+        self.assertNotEqual(QName("a"), 1)
+        self.assertEqual(hash("a"), hash(QName("a")))
+        self.assertLess(QName("a"), QName("b"))
+        self.assertLess(QName("a"), "b")
+        self.assertEqual([QName("a"), QName("b")], sorted([QName("b"), QName("a")]))
+        self.assertEqual("QName('{urn}a')", repr(QName("{urn}a")))
+        self.assertEqual((QName, ("a",)), QName("a").__reduce__())
+
+        with self.assertRaises(ValueError):
+            QName("")
+
+        with self.assertRaises(TypeError):
+            QName("a") < 1
+
+    def test_bindings_without_lxml(self):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT],
+            capture_output=True,
+            cwd=Path(__file__).parents[2],
+            text=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
@@ -0,0 +1,62 @@
+import bz2
+import gzip
+import lzma
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from xsdata.utils.compression import find_codec
+from xsdata.utils.compression import open_path
+
+
+class CompressionTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_open_path(self):
+        for name, decompress in (
+            ("a.gz", gzip.decompress),
+            ("a.bz2", bz2.decompress),
+            ("a.xz", lzma.decompress),
+            ("a.LZMA", lzma.decompress),
+            ("a.xml", bytes),
+        ):
+            path = self.root.joinpath(name)
+            with open_path(path, "wb") as target:
+                target.write(b"foo")
+                target.write(b"bar")
+
+            self.assertEqual(b"foobar", decompress(path.read_bytes()))
+
+            with open_path(path) as source:
+                self.assertEqual(b"foobar", source.read())
+
+    def test_open_path_with_lzma_suffix(self):
+        path = self.root.joinpath("a.lzma")
+        with open_path(path, "wb") as target:
+            target.write(b"foo")
+
+        self.assertEqual(b"foo", lzma.decompress(path.read_bytes(), lzma.FORMAT_ALONE))
+        with open_path(path) as source:
+            self.assertEqual(b"foo", source.read())
+
+    def test_find_codec(self):
+        path = self.root.joinpath("a")
+
+        path.write_bytes(b"")
+        self.assertIsNone(find_codec(path))
+
+        path.write_bytes(gzip.compress(b"a"))
+        self.assertIs(gzip.open, find_codec(path))
+
+        path.write_bytes(bz2.compress(b"a"))
+        self.assertIs(bz2.open, find_codec(path))
+
+        path.write_bytes(lzma.compress(b"a"))
+        self.assertIs(lzma.open, find_codec(path))
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from lxml.etree import QName
+
+from xsdata.utils.namespaces import local_name
+from xsdata.utils.namespaces import split_qname
+from xsdata.utils.namespaces import target_uri
+
+
+class NamespacesTests(TestCase):
+    def test_split_qname(self):
+        for tag in ("{a}b", "b", "{}b", "{urn:x:y}b.c"):
+            qname = QName(tag)
+            self.assertEqual((qname.namespace, qname.localname), split_qname(tag))
+
+    def test_target_uri(self):
+        self.assertEqual("a", target_uri("{a}b"))
+        self.assertIsNone(target_uri("b"))
+
+    def test_local_name(self):
+        self.assertEqual("b", local_name("{a}b"))
+        self.assertEqual("b", local_name("b"))
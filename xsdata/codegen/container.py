@@ -6,8 +6,6 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 
-from lxml.etree import QName
-
 from xsdata.codegen.handlers import AttributeEnumUnionHandler
 from xsdata.codegen.handlers import AttributeGroupHandler
 from xsdata.codegen.handlers import AttributeImpliedHandler
@@ -21,6 +19,7 @@ from xsdata.codegen.models import Class
 from xsdata.codegen.models import Status
 from xsdata.utils import collections
 from xsdata.utils.collections import group_by
+from xsdata.utils.compat import QName
 
 methodcaller("source_qname")
 
@@ -5,14 +5,13 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-from lxml.etree import QName
-
 from xsdata.codegen.mixins import ContainerInterface
 from xsdata.codegen.mixins import HandlerInterface
 from xsdata.codegen.models import Attr
 from xsdata.codegen.models import AttrType
 from xsdata.codegen.models import Class
 from xsdata.utils import collections
+from xsdata.utils.compat import QName
 
 Substitutions = Optional[Dict[QName, List[Attr]]]
 
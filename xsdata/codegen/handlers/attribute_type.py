@@ -5,8 +5,6 @@ from typing import Optional
 from typing import Set
 from typing import Tuple
 
-from lxml.etree import QName
-
 from xsdata.codegen.mixins import ContainerInterface
 from xsdata.codegen.mixins import HandlerInterface
 from xsdata.codegen.models import Attr
@@ -18,6 +16,7 @@ from xsdata.exceptions import AnalyzerValueError
 from xsdata.logger import logger
 from xsdata.models.enums import DataType
 from xsdata.utils.collections import unique_sequence
+from xsdata.utils.compat import QName
 
 
 @dataclass
@@ -4,9 +4,8 @@ from typing import Iterator
 from typing import List
 from typing import Optional
 
-from lxml.etree import QName
-
 from xsdata.codegen.models import Class
+from xsdata.utils.compat import QName
 
 Condition = Optional[Callable]
 
@@ -11,8 +11,6 @@ from typing import List
 from typing import Optional
 from typing import Type
 
-from lxml.etree import QName
-
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.models.enums import DataType
 from xsdata.models.enums import QNames
@@ -21,6 +19,7 @@ from xsdata.models.mixins import ElementBase
 from xsdata.models.xsd import ComplexType
 from xsdata.models.xsd import Element
 from xsdata.utils import text
+from xsdata.utils.compat import QName
 
 
 def qname(name: str, ns_map: Dict, default_namespace: Optional[str] = None) -> QName:
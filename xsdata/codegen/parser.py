@@ -4,23 +4,20 @@ from dataclasses import field
 from typing import Any
 from typing import List
 from typing import Optional
-from typing import Tuple
 from typing import TypeVar
 from urllib.parse import urljoin
 
-from lxml.etree import Element
-from lxml.etree import QName
-
 from xsdata.formats.dataclass.parsers.nodes import XmlNode
+from xsdata.formats.dataclass.parsers.xml import ParsedObjects
 from xsdata.formats.dataclass.parsers.xml import XmlParser
 from xsdata.models import xsd
 from xsdata.models.enums import FormType
 from xsdata.models.enums import Mode
 from xsdata.models.enums import Namespace
 from xsdata.models.mixins import ElementBase
+from xsdata.utils.compat import Element
 
 T = TypeVar("T")
-ParsedObjects = List[Tuple[QName, Any]]
 XmlNodes = List[XmlNode]
 
 
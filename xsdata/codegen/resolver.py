@@ -4,13 +4,13 @@ from dataclasses import field
 from typing import Dict
 from typing import List
 
-from lxml.etree import QName
 from toposort import toposort_flatten
 
 from xsdata.codegen.models import Class
 from xsdata.codegen.models import Package
 from xsdata.exceptions import ResolverValueError
 from xsdata.utils import collections
+from xsdata.utils.compat import QName
 
 logger = logging.getLogger(__name__)
 
@@ -87,4 +87,5 @@ class CodeWriter:
 
 writer = CodeWriter()
 writer.register_format("pydata", DataclassGenerator())
+writer.register_format("pydata-slots", DataclassGenerator(slots=True))
 writer.register_format("plantuml", PlantUmlGenerator())
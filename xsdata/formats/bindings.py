@@ -1,9 +1,33 @@
+import copyreg
 import io
+import os
 import pathlib
+import pickle
 from abc import ABC
 from abc import abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any
+from typing import BinaryIO
+from typing import cast
+from typing import Deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union
+
+from xsdata.exceptions import ParserError
+from xsdata.utils.collections import chunked
+from xsdata.utils.compat import QName
+from xsdata.utils.compression import open_path
 
 
 class AbstractSerializer(ABC):
@@ -12,22 +36,244 @@ class AbstractSerializer(ABC):
         """Render the given object to the target output format."""
 
 
+class BinarySerializer(ABC):
+    """Mixin of the serializers with a binary stream output."""
+
+    @abstractmethod
+    def write(self, obj: object, target: BinaryIO):
+        """Render the given object to the binary target stream."""
+
+    def to_path(self, obj: object, path: pathlib.Path):
+        """Render the given object to the file path, paths with the ``.gz``,
+        ``.bz2``, ``.xz`` suffixes are compressed on the fly."""
+        with open_path(path, "wb") as target:
+            self.write(obj, target)
+
+
 T = TypeVar("T")
+Buffer = Union[bytes, bytearray, memoryview]
+Source = Union[str, pathlib.Path, bytes]
+
+
+@dataclass
+class ParseResult:
+    """
+    Batch parsing result of a single source.
+
+    :param index: The source position in the input sources
+    :param obj: The resulting object tree, if parsing succeeded
+    :param error: The raised exception, if parsing failed
+    """
+
+    index: int
+    obj: Any = None
+    error: Optional[Exception] = None
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Binary file-like reader over a bytes-like object.
+
+    The buffer is never copied as a whole, the reads copy only the
+    requested slices.
+
+    :param buffer: A bytes, bytearray, memoryview or mmap object
+    """
+
+    def __init__(self, buffer: Any):
+        super().__init__()
+        self.buffer = memoryview(buffer).cast("B")
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read and return up to size bytes, read until the end if size is
+        omitted or negative."""
+        start = self.position
+        end = len(self.buffer)
+        if size is not None and size >= 0:
+            end = min(end, start + size)
+
+        self.position = max(start, end)
+        return self.buffer[start:end].tobytes()
+
+    def readinto(self, target: Any) -> int:
+        """Read bytes into the given writable buffer and return their
+        number."""
+        data = self.read(len(target))
+        size = len(data)
+        target[:size] = data
+        return size
+
+    def close(self):
+        self.buffer.release()
+        super().close()
 
 
 class AbstractParser(ABC):
     def from_path(self, path: pathlib.Path, clazz: Type[T]) -> T:
-        """Parse the input file path and return the resulting object tree."""
-        return self.from_bytes(path.read_bytes(), clazz)
+        """
+        Parse the input file path and return the resulting object tree.
+
+        The parser reads the file in chunks, gzip, bzip2 and xz files are
+        decompressed on the fly.
+        """
+        with open_path(path) as source:
+            return self.parse(source, clazz)
 
     def from_string(self, source: str, clazz: Type[T]) -> T:
         """Parse the input string and return the resulting object tree."""
         return self.from_bytes(source.encode(), clazz)
 
-    def from_bytes(self, source: bytes, clazz: Type[T]) -> T:
-        """Parse the input bytes array return the resulting object tree."""
-        return self.parse(io.BytesIO(source), clazz)
+    def from_bytes(self, source: Buffer, clazz: Type[T]) -> T:
+        """
+        Parse the input bytes-like object and return the resulting object
+        tree.
+
+        Bytes arrays and memory views, e.g. of memory mapped files, are
+        read in place without copying.
+        """
+        if isinstance(source, bytes):
+            return self.parse(io.BytesIO(source), clazz)
+
+        with BufferReader(source) as reader:
+            return self.parse(cast(BinaryIO, reader), clazz)
 
     @abstractmethod
-    def parse(self, source: io.BytesIO, clazz: Type[T]) -> T:
+    def parse(self, source: BinaryIO, clazz: Type[T]) -> T:
         """Parse the input stream and return the resulting object tree."""
+
+    def warm_up(self, clazz: Type):
+        """Prepare the parser to parse documents of the given class."""
+        return
+
+    def parse_many(
+        self,
+        sources: Iterable[Source],
+        clazz: Type[T],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[ParseResult]:
+        """
+        Parse the input file paths or bytes arrays in a process pool and yield
+        the results of every source.
+
+        Every worker process parses with a copy of this parser, warmed up for
+        the given class. Failures don't interrupt the batch, the exceptions
+        are captured in the results, exceptions that can't be transferred
+        between processes are converted to parser errors. The objects are
+        pickled by the workers, objects that can't be pickled are reported
+        as failures too.
+
+        The sources are read as the results are consumed, at most two chunks
+        per worker are in flight and closing the generator early cancels the
+        pending chunks.
+
+        :param sources: The file paths or bytes arrays
+        :param clazz: The target class of all the sources
+        :param workers: The number of the worker processes, default: cpu count
+        :param chunksize: The number of the sources to send to a worker at once
+        :param ordered: Yield the results in the sources order or as they
+            complete
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+
+        chunks = chunked(enumerate(sources), chunksize)
+        window = 2 * (workers or os.cpu_count() or 1)
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(self, clazz)
+        ) as executor:
+            try:
+                for chunk in chunks:
+                    pending.append(executor.submit(parse_chunk, chunk))
+                    if len(pending) == window:
+                        yield from next_results(pending, ordered)
+
+                while pending:
+                    yield from next_results(pending, ordered)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+worker_parser: Optional[AbstractParser] = None
+worker_clazz: Optional[Type] = None
+
+
+def init_worker(parser: AbstractParser, clazz: Type):
+    """Initialize the parser and target class of the current worker
+    process."""
+    global worker_parser, worker_clazz
+
+    parser.warm_up(clazz)
+    worker_parser = parser
+    worker_clazz = clazz
+
+
+def parse_chunk(chunk: List[Tuple[int, Source]]) -> List[ParseResult]:
+    """Parse the given sources with the current worker parser, the objects
+    are returned pickled."""
+    parser = cast(AbstractParser, worker_parser)
+    clazz = cast(Type, worker_clazz)
+
+    results = []
+    for index, source in chunk:
+        try:
+            if isinstance(source, bytes):
+                obj = parser.from_bytes(source, clazz)
+            else:
+                obj = parser.from_path(pathlib.Path(source), clazz)
+
+            payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+            results.append(ParseResult(index, obj=payload))
+        except Exception as e:
+            results.append(ParseResult(index, error=portable_error(e)))
+
+    return results
+
+
+def next_results(pending: Deque[Future], ordered: bool) -> Iterator[ParseResult]:
+    """Remove the first pending future, or all the completed ones if the
+    results are unordered, and yield their results."""
+    if ordered:
+        yield from map(load_result, pending.popleft().result())
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield from map(load_result, future.result())
+
+
+def load_result(result: ParseResult) -> ParseResult:
+    """Unpickle the object of the given worker result."""
+    if result.error is None:
+        try:
+            result.obj = pickle.loads(result.obj)
+        except Exception as e:
+            result.obj = None
+            result.error = portable_error(e)
+
+    return result
+
+
+def portable_error(error: Exception) -> Exception:
+    """Return the given exception if it can be pickled or an equivalent
+    parser error."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return ParserError(f"{type(error).__name__}: {error}")
+
+
+def reduce_qname(qname: QName) -> Tuple:
+    """Pickle the lxml qualified names by their text."""
+    return QName, (qname.text,)
+
+
+copyreg.pickle(QName, reduce_qname)
@@ -4,16 +4,23 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 from typing import Callable
+from typing import cast
 from typing import Dict
 from typing import List
+from typing import MutableMapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
-
-from lxml.etree import QName
+from weakref import WeakValueDictionary
 
 from xsdata.exceptions import ConverterError
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.utils import text
+from xsdata.utils.compat import QName
+
+
+Converter = Callable[[Any, Optional[Dict]], Any]
 
 
 def sort_types(types: List[Type]) -> List[Type]:
@@ -38,18 +45,210 @@ def to_python(
     if not in_order and len(types) > 1:
         types = sort_types(list(types))
 
+    return compile_converter(types)(value, ns_map)
+
+
+def register_converter(clazz: Type, func: Callable[[str], Any]):
+    """
+    Register the function to convert xml string values to the given type.
+
+    The function must raise a ValueError if the value is not valid. The
+    metadata of the live contexts is reset and rebuilt with the new
+    converters.
+    """
+    converters[clazz] = func
+    reset_converters()
+
+
+def unregister_converter(clazz: Type):
+    """Remove the registered function of the given type."""
+    converters.pop(clazz, None)
+    reset_converters()
+
+
+def reset_converters():
+    """Clear the compiled converters and reset the subscribed metadata
+    caches."""
+    compiled.clear()
+    for subscriber in list(subscribers.values()):
+        subscriber.reset()
+
+
+def subscribe(cache: Any):
+    """Subscribe the given metadata cache to be reset when the registered
+    converters change, the cache is held by a weak reference."""
+    subscribers[id(cache)] = cache
+
+
+def find_function(clazz: Type) -> Optional[Callable]:
+    """Return the registered conversion function of the given type, the
+    functions registered by class name take precedence."""
+    func = func_map.get(getattr(clazz, "__name__", ""))
+    return func if func is not None else converters.get(clazz)
+
+
+def compile_converter(types: Sequence[Type]) -> Converter:
+    """
+    Return the converter of the given types in order of priority.
+
+    The converter accepts a value and an optional prefix-namespace map and
+    returns the first successful conversion or the value itself. Non string
+    values are returned as they are.
+    """
+    key = tuple(types)
+    if key not in compiled:
+        compiled[key] = build_converter(key)
+
+    return compiled[key]
+
+
+def requires_ns_map(types: Sequence[Type]) -> bool:
+    """Return whether the conversion to any of the given types needs the
+    prefix-namespace map, the qualified names and the enumerations of
+    qualified names."""
     for clazz in types:
+        if clazz is QName:
+            return True
+
+        if isinstance(clazz, type) and issubclass(clazz, Enum):
+            if any(isinstance(member.value, QName) for member in clazz):
+                return True
+
+    return False
+
+
+def build_converter(types: Tuple[Type, ...]) -> Converter:
+    """Build the converter of the given types, single type conversions
+    are called directly and union conversions are chained."""
+    if len(types) == 1:
+        registered = find_function(types[0])
+        if registered is not None:
+            return value_converter(registered)
+
+    chain = []
+    for clazz in types:
+        func = class_converter(clazz)
+        if func is None:
+            continue
+
+        chain.append(func)
+        if find_function(clazz) is str:
+            break
+
+    if not chain:
+        return return_value
+
+    if len(chain) == 1:
+        return single_converter(chain[0])
+
+    return chain_converter(chain)
+
+
+def value_converter(func: Callable[[str], Any]) -> Converter:
+    """Return a converter for a registered conversion function."""
+    if func is str:
+        return return_value
+
+    def convert(value: Any, ns_map: Optional[Dict] = None) -> Any:
+        if not isinstance(value, str):
+            return value
+
         try:
-            if clazz.__name__ in func_map:
-                return func_map[clazz.__name__](value)
+            return func(value)
+        except ValueError:
+            return value
+
+    return convert
+
 
-            return to_class(clazz, value, ns_map)
+def single_converter(func: Converter) -> Converter:
+    """Return a converter for a single class conversion."""
+
+    def convert(value: Any, ns_map: Optional[Dict] = None) -> Any:
+        if not isinstance(value, str):
+            return value
+
+        try:
+            return func(value, ns_map)
         except ValueError:
-            pass
+            return value
+
+    return convert
+
+
+def chain_converter(chain: List[Converter]) -> Converter:
+    """Return a converter that tries the given class conversions in
+    order."""
+
+    def convert(value: Any, ns_map: Optional[Dict] = None) -> Any:
+        if not isinstance(value, str):
+            return value
+
+        for func in chain:
+            try:
+                return func(value, ns_map)
+            except ValueError:
+                pass
+
+        return value
 
+    return convert
+
+
+def return_value(value: Any, ns_map: Optional[Dict] = None) -> Any:
+    """Return the given value as it is."""
     return value
 
 
+def class_converter(clazz: Type) -> Optional[Converter]:
+    """Return the class conversion of the given type or None if the type is
+    not supported."""
+    func = find_function(clazz)
+    if func is not None:
+        return lambda value, ns_map: func(value)
+    if clazz is QName:
+        return to_qname
+    if isinstance(clazz, type) and issubclass(clazz, Enum):
+        return enum_converter(clazz)
+    if is_dataclass(clazz):
+        factory = cast(Callable, clazz)
+        return lambda value, ns_map: factory(value)
+
+    return None
+
+
+def enum_converter(clazz: Type[Enum]) -> Optional[Converter]:
+    """
+    Return the class conversion of the given enumeration.
+
+    The values are converted to the type of the first member value and
+    the members are looked up in a precomputed value to member map.
+    """
+    members = list(clazz.__members__.values())
+    if not members:
+        return None
+
+    value_type = type(members[0].value)
+    try:
+        lookup = {member.value: member for member in members}
+    except TypeError:
+        lookup = {}
+
+    def convert(value: str, ns_map: Optional[Dict]) -> Enum:
+        key: Any
+        if value_type is QName:
+            key = to_qname(value, ns_map)
+        elif value_type is str:
+            key = value
+        else:
+            key = value_type(value)
+
+        member = lookup.get(key)
+        return member if member is not None else clazz(key)
+
+    return convert
+
+
 def to_qname(value: str, ns_map: Optional[Dict]) -> QName:
     if ns_map is None:
         return QName(value)
@@ -60,23 +259,11 @@ def to_qname(value: str, ns_map: Optional[Dict]) -> QName:
 
 
 def to_class(clazz: Any, value: Any, ns_map: Optional[Dict]) -> Any:
-    if clazz is QName:
-        return to_qname(value, ns_map)
-    if issubclass(clazz, Enum):
-        return to_enum(clazz, value, ns_map)
-    if is_dataclass(clazz):
-        return clazz(value)
-
-    raise ConverterError(f"Unhandled class type {clazz.__name__}")
+    func = class_converter(clazz)
+    if func is None:
+        raise ConverterError(f"Unhandled class type {clazz.__name__}")
 
-
-def to_enum(clazz: Type[Enum], value: Any, ns_map: Optional[Dict]) -> Enum:
-    enumeration = next(enumeration for enumeration in clazz)
-
-    if isinstance(enumeration.value, QName):
-        value = to_qname(value, ns_map)
-
-    return clazz(type(enumeration.value)(value))
+    return func(value, ns_map)
 
 
 def to_bool(value: Any) -> bool:
@@ -116,11 +303,30 @@ def qname_to_xml(qname: QName, namespaces: Namespaces) -> str:
     return f"{prefix}:{qname.localname}" if prefix else qname.localname
 
 
-func_map: Dict[str, Callable] = {
-    "str": str,
-    "int": int,
-    "float": float,
-    "bool": to_bool,
-    "Decimal": Decimal,
-    "object": str,
+converters: Dict[Type, Callable] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: to_bool,
+    Decimal: Decimal,
+    object: str,
 }
+compiled: Dict[Tuple, Converter] = {}
+subscribers: MutableMapping[int, Any] = WeakValueDictionary()
+
+
+class FuncMap(dict):
+    """Class name to conversion function registry, the registered changes
+    reset the converters."""
+
+    def __setitem__(self, key: str, value: Callable):
+        super().__setitem__(key, value)
+        reset_converters()
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        reset_converters()
+
+
+# Deprecated, use register_converter
+func_map: Dict[str, Callable] = FuncMap()
@@ -1,4 +1,7 @@
+import importlib
+import pkgutil
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import Field
 from dataclasses import field
@@ -12,16 +15,26 @@ from typing import get_type_hints
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 
-from lxml.etree import QName
-
 from xsdata.exceptions import XmlContextError
+from xsdata.formats.converters import compile_converter
+from xsdata.formats.converters import requires_ns_map
 from xsdata.formats.converters import sort_types
+from xsdata.formats.converters import subscribe
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.store import MetaStore
 from xsdata.models.enums import NamespaceType
+from xsdata.utils.compat import QName
+
+
+def return_input(value: Any) -> Any:
+    """Return the given value, the default local name generator."""
+    return value
 
 
 @dataclass
@@ -33,10 +46,48 @@ class XmlContext:
     :param name_generator: Callable to convert attribute names to local document names
                             if the model fields metadata name is missing.
     :param cache: Local storage to store and reuse models' bind metadata.
+    :param store: Optional persistent storage to load and save the models'
+        bind metadata across processes.
+    :param xsi_cache: Source qualified name to classes registry of the
+        built models.
+    :param xsi_scanned: The classes whose hierarchies have been built and
+        added to the registry.
     """
 
-    name_generator: Callable = field(default=lambda x: x)
+    name_generator: Callable = field(default=return_input)
     cache: Dict[Type, XmlMeta] = field(default_factory=dict)
+    store: Optional[MetaStore] = None
+    xsi_cache: Dict[str, List[Type]] = field(
+        init=False, default_factory=lambda: defaultdict(list)
+    )
+    xsi_scanned: Set[Type] = field(init=False, default_factory=set)
+
+    def __getstate__(self) -> Dict:
+        """Exclude the metadata cache and the xsi type registry from the
+        pickled state, the cached qualified names can't be pickled."""
+        state = self.__dict__.copy()
+        state["cache"] = {}
+        state["xsi_cache"] = defaultdict(list)
+        state["xsi_scanned"] = set()
+        return state
+
+    def __setstate__(self, state: Dict):
+        """Restore the pickled state and subscribe to the converter
+        changes."""
+        self.__dict__.update(state)
+        subscribe(self)
+
+    def __post_init__(self):
+        """Subscribe to the converter changes to reset the metadata
+        cache."""
+        subscribe(self)
+
+    def reset(self):
+        """Clear the metadata cache and the xsi type registry, when the
+        registered converters change."""
+        self.cache.clear()
+        self.xsi_cache.clear()
+        self.xsi_scanned.clear()
 
     def fetch(
         self,
@@ -67,33 +118,53 @@ class XmlContext:
         Find a derived class of the given clazz that matches the given
         qualified xsi type.
 
-        The derived class is either a subclass or shares the same parent
-        class as the given class.
+        The derived class is either a base class, a subclass or shares a
+        common dataclass ancestor with the given class. The classes are
+        looked up in the xsi type registry, on the first miss the whole
+        hierarchy of the given class is built and registered.
         """
-        for subclass in clazz.__subclasses__():
-            if self.match_class_source_qname(subclass, xsi_type):
-                return subclass
-
-        for base in clazz.__bases__:
-            if not is_dataclass(base):
-                continue
-
-            if self.match_class_source_qname(base, xsi_type):
-                return base
-
-            sibling = self.find_subclass(base, xsi_type)
-            if sibling:
-                return sibling
+        key = str(xsi_type)
+        subclass = self.find_xsi_type(clazz, key)
+        if subclass is None and clazz not in self.xsi_scanned:
+            self.scan_hierarchy(clazz)
+            subclass = self.find_xsi_type(clazz, key)
+
+        return subclass
+
+    def find_xsi_type(self, clazz: Type, xsi_type: str) -> Optional[Type]:
+        """Find a registered class related to the given clazz by the source
+        qualified name."""
+        candidates = self.xsi_cache.get(xsi_type)
+        if not candidates:
+            return None
+
+        bases = [base for base in clazz.__mro__ if is_dataclass(base)]
+        return next(
+            (
+                candidate
+                for candidate in candidates
+                if any(issubclass(candidate, base) for base in bases)
+            ),
+            None,
+        )
 
-        return None
+    def scan_hierarchy(self, clazz: Type):
+        """Build and register all the dataclass ancestors of the given class
+        and all their subclasses."""
+        pending = [base for base in clazz.__mro__ if is_dataclass(base)]
+        visited = set(pending)
+        while pending:
+            current = pending.pop()
+            registered = self.xsi_cache[self.build(current).source_qname.text]
+            if current not in registered:
+                registered.append(current)
 
-    def match_class_source_qname(self, clazz: Type, xsi_type: QName) -> bool:
-        """Match a given source qualified name with the given xsi type."""
-        if is_dataclass(clazz):
-            meta = self.build(clazz)
-            return meta.source_qname == xsi_type
+            for subclass in current.__subclasses__():
+                if subclass not in visited and is_dataclass(subclass):
+                    visited.add(subclass)
+                    pending.append(subclass)
 
-        return False
+        self.xsi_scanned.add(clazz)
 
     def build(self, clazz: Type, parent_ns: Optional[str] = None) -> XmlMeta:
         """Fetch from cache or build the metadata object for the given class
@@ -105,28 +176,147 @@ class XmlContext:
             if not is_dataclass(clazz):
                 raise XmlContextError(f"Object {clazz} is not a dataclass.")
 
-            # Fetch the dataclass meta settings and make sure we don't inherit
-            # the parent class meta.
-            meta = getattr(clazz, "Meta", None)
-            if meta and meta.__qualname__ != f"{clazz.__name__}.Meta":
-                meta = None
-
-            name = getattr(meta, "name", self.name_generator(clazz.__name__))
-            nillable = getattr(meta, "nillable", False)
-            namespace = getattr(meta, "namespace", parent_ns)
-            module = sys.modules[clazz.__module__]
-            source_namespace = getattr(module, "__NAMESPACE__", None)
-
-            self.cache[clazz] = XmlMeta(
-                name=name,
-                clazz=clazz,
-                qname=QName(namespace, name),
-                source_qname=QName(source_namespace, name),
-                nillable=nillable,
-                vars=list(self.get_type_hints(clazz, namespace)),
-            )
+            data = self.store.get(clazz, parent_ns) if self.store else None
+            if data:
+                meta = self.load_meta(clazz, data)
+            else:
+                meta = self.build_meta(clazz, parent_ns)
+
+                if self.store:
+                    types = (tp for var in meta.vars for tp in var.types)
+                    dependencies = MetaStore.dependencies(clazz, types)
+                    self.store.add(clazz, parent_ns, dependencies, self.dump_meta(meta))
+
+            self.cache[clazz] = meta
+            self.xsi_cache[meta.source_qname.text].append(clazz)
+
         return self.cache[clazz]
 
+    def build_meta(self, clazz: Type, parent_ns: Optional[str]) -> XmlMeta:
+        """Build the metadata object for the given class and parent
+        namespace."""
+
+        # Fetch the dataclass meta settings and make sure we don't inherit
+        # the parent class meta.
+        meta = getattr(clazz, "Meta", None)
+        if meta and meta.__qualname__ != f"{clazz.__name__}.Meta":
+            meta = None
+
+        name = getattr(meta, "name", self.name_generator(clazz.__name__))
+        nillable = getattr(meta, "nillable", False)
+        namespace = getattr(meta, "namespace", parent_ns)
+        module = sys.modules[clazz.__module__]
+        source_namespace = getattr(module, "__NAMESPACE__", None)
+
+        return XmlMeta(
+            name=name,
+            clazz=clazz,
+            qname=QName(namespace, name),
+            source_qname=QName(source_namespace, name),
+            nillable=nillable,
+            vars=list(self.get_type_hints(clazz, namespace)),
+        )
+
+    def build_package(self, package: str) -> int:
+        """
+        Import all the modules of the given package and build the metadata of
+        every dataclass defined in them.
+
+        Use it with a persistent store to precompute the metadata of a
+        generated package.
+
+        :return: The number of the dataclasses.
+        """
+        modules = [importlib.import_module(package)]
+        path = getattr(modules[0], "__path__", None)
+        if path:
+            prefix = f"{package}."
+            for info in pkgutil.walk_packages(path, prefix):
+                modules.append(importlib.import_module(info.name))
+
+        total = 0
+        for module in modules:
+            for value in list(vars(module).values()):
+                if (
+                    isinstance(value, type)
+                    and is_dataclass(value)
+                    and value.__module__ == module.__name__
+                ):
+                    self.build(value)
+                    total += 1
+
+        return total
+
+    @staticmethod
+    def dump_meta(meta: XmlMeta) -> Tuple:
+        """
+        Convert the given metadata object to a tuple of picklable values.
+
+        The field defaults are excluded, they are restored from the dataclass
+        fields when the metadata is loaded.
+        """
+        return (
+            meta.name,
+            meta.qname.text,
+            meta.source_qname.text,
+            meta.nillable,
+            tuple(
+                (
+                    type(var),
+                    var.name,
+                    var.qname.text,
+                    var.init,
+                    var.nillable,
+                    var.dataclass,
+                    var.sequential,
+                    var.types,
+                    var.namespaces,
+                )
+                for var in meta.vars
+            ),
+        )
+
+    @classmethod
+    def load_meta(cls, clazz: Type, data: Tuple) -> XmlMeta:
+        """Create the metadata object of the given class from the stored
+        data."""
+        name, qname, source_qname, nillable, var_list = data
+        defaults = {var.name: cls.default_value(var) for var in fields(clazz)}
+
+        return XmlMeta(
+            name=name,
+            clazz=clazz,
+            qname=QName(qname),
+            source_qname=QName(source_qname),
+            nillable=nillable,
+            vars=[
+                xml_clazz(
+                    name=var_name,
+                    qname=QName(var_qname),
+                    init=init,
+                    nillable=var_nillable,
+                    dataclass=is_class,
+                    sequential=sequential,
+                    default=defaults[var_name],
+                    types=types,
+                    namespaces=namespaces,
+                    converter=compile_converter(types),
+                    needs_ns_map=requires_ns_map(types),
+                )
+                for (
+                    xml_clazz,
+                    var_name,
+                    var_qname,
+                    init,
+                    var_nillable,
+                    is_class,
+                    sequential,
+                    types,
+                    namespaces,
+                ) in var_list
+            ],
+        )
+
     def get_type_hints(self, clazz: Type, parent_ns: Optional[str]) -> Iterator[XmlVar]:
         """Build the model class fields metadata."""
         type_hints = get_type_hints(clazz)
@@ -156,6 +346,8 @@ class XmlContext:
                 sequential=var.metadata.get("sequential", False),
                 types=types,
                 default=self.default_value(var),
+                converter=compile_converter(types),
+                needs_ns_map=requires_ns_map(types),
             )
 
     @staticmethod
@@ -9,7 +9,6 @@ from typing import Optional
 from xml.sax.saxutils import quoteattr
 
 from docformatter import format_code
-from lxml.etree import QName
 
 from xsdata.codegen.models import Attr
 from xsdata.codegen.models import AttrType
@@ -18,6 +17,7 @@ from xsdata.formats.converters import to_python
 from xsdata.formats.dataclass import utils
 from xsdata.models.enums import DataType
 from xsdata.utils import text
+from xsdata.utils.compat import QName
 
 
 @functools.lru_cache(maxsize=50)
@@ -118,6 +118,9 @@ def default_imports(output: str) -> str:
     if types:
         result.append(f"from typing import {', '.join(types)}")
 
+    if "@slotted" in output:
+        result.append("from xsdata.formats.dataclass.slots import slotted")
+
     return "\n".join(result)
 
 
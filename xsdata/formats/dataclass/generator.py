@@ -15,14 +15,20 @@ from xsdata.utils.collections import group_by
 
 
 class DataclassGenerator(AbstractGenerator):
-    """Python dataclasses code generator."""
+    """
+    Python dataclasses code generator.
 
-    def __init__(self):
+    :param slots: Generate slotted dataclasses, the instances don't carry
+        a ``__dict__``.
+    """
+
+    def __init__(self, slots: bool = False):
         """Override generator constructor to set templates directory and
         environment filters."""
         tpl_dir = Path(__file__).parent.joinpath("templates")
         super().__init__(str(tpl_dir))
         self.env.filters.update(filters)
+        self.slots = slots
 
     def render(self, classes: List[Class]) -> Iterator[GeneratorResult]:
         """
@@ -81,7 +87,7 @@ class DataclassGenerator(AbstractGenerator):
         def render_class(obj: Class) -> str:
             """Render class or enumeration."""
             template = "enum" if obj.is_enumeration else "class"
-            return load(template).render(obj=obj).strip()
+            return load(template).render(obj=obj, slots=self.slots).strip()
 
         return "\n\n\n".join(map(render_class, classes)) + "\n"
 
@@ -3,16 +3,18 @@ from dataclasses import field
 from enum import auto
 from enum import IntEnum
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Type
-
-from lxml.etree import QName
+from typing import Union
 
 from xsdata.models.enums import FormType
 from xsdata.models.enums import NamespaceType
 from xsdata.models.enums import QNames
+from xsdata.utils.compat import QName
+from xsdata.utils.namespaces import target_uri
 
 
 @dataclass(frozen=True)
@@ -29,6 +31,8 @@ class XmlVar:
     :param default: default value or factory
     :param types: field bind or cast types.
     :param namespaces: a list of the all the possible namespaces.
+    :param converter: the precompiled converter of the field types.
+    :param needs_ns_map: the converter needs the prefix-namespace map.
     """
 
     name: str
@@ -40,6 +44,8 @@ class XmlVar:
     default: Any = None
     types: List[Type] = field(default_factory=list)
     namespaces: List[str] = field(default_factory=list)
+    converter: Optional[Callable] = field(default=None, compare=False, repr=False)
+    needs_ns_map: bool = field(default=False, compare=False, repr=False)
 
     @property
     def clazz(self) -> Optional[Type]:
@@ -86,7 +92,7 @@ class XmlVar:
         """Return whether or not the field is a text element."""
         return False
 
-    def matches(self, qname: QName) -> bool:
+    def matches(self, qname: Union[str, QName]) -> bool:
         """
         Match the field qualified local name to the given qname.
 
@@ -120,23 +126,24 @@ class XmlWildcard(XmlVar):
     def is_any_type(self) -> bool:
         return True
 
-    def matches(self, qname: QName) -> bool:
+    def matches(self, qname: Union[str, QName]) -> bool:
         """Match the given qname to the wildcard allowed namespaces."""
 
         if qname == QNames.ALL:
             return True
 
-        if not self.namespaces and qname.namespace is None:
+        uri = target_uri(str(qname))
+        if not self.namespaces and uri is None:
             return True
 
         for namespace in self.namespaces:
-            if not namespace and qname.namespace is None:
+            if not namespace and uri is None:
                 return True
-            if namespace == qname.namespace:
+            if namespace == uri:
                 return True
             if namespace == NamespaceType.ANY.value:
                 return True
-            if namespace and namespace[0] == "!" and namespace[1:] != qname.namespace:
+            if namespace and namespace[0] == "!" and namespace[1:] != uri:
                 return True
 
         return False
@@ -205,6 +212,9 @@ class XmlMeta:
     """
     Dataclass model bind metadata.
 
+    The field lookups used by the parsers are compiled once on
+    initialization, the var lists should be considered immutable.
+
     :param name: local name
     :param clazz: dataclass type
     :param qname: local name qualified with target namespace.
@@ -212,6 +222,13 @@ class XmlMeta:
     :param nillable: allow render as empty element.
     :param vars: list of field metadata
     :param cache: field lookup cache
+    :param element_vars: qualified name to element/text field map
+    :param attribute_vars: qualified name to attribute field map
+    :param text_var: the text field if any
+    :param wildcard_var: the first wildcard field if any
+    :param attributes_var: the wildcard attributes field if any
+    :param wildcard_vars: list of the wildcard fields
+    :param wildcard_cache: qualified name to wildcard field lookup cache
     """
 
     name: str
@@ -221,6 +238,34 @@ class XmlMeta:
     nillable: bool
     vars: List[XmlVar] = field(default_factory=list)
     cache: Dict = field(default_factory=dict)
+    element_vars: Dict[str, XmlVar] = field(init=False, repr=False, compare=False)
+    attribute_vars: Dict[str, XmlVar] = field(init=False, repr=False, compare=False)
+    text_var: Optional[XmlVar] = field(init=False, repr=False, compare=False)
+    wildcard_var: Optional[XmlVar] = field(init=False, repr=False, compare=False)
+    attributes_var: Optional[XmlVar] = field(init=False, repr=False, compare=False)
+    wildcard_vars: List[XmlVar] = field(init=False, repr=False, compare=False)
+    wildcard_cache: Dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Compile the field lookups, the first field definition wins."""
+        element_vars: Dict[str, XmlVar] = {}
+        attribute_vars: Dict[str, XmlVar] = {}
+        for var in self.vars:
+            if var.is_attribute:
+                attribute_vars.setdefault(var.qname.text, var)
+            elif not var.is_wildcard and not var.is_attributes:
+                element_vars.setdefault(var.qname.text, var)
+
+        wildcard_vars = [var for var in self.vars if var.is_wildcard]
+
+        setattr_ = object.__setattr__
+        setattr_(self, "element_vars", element_vars)
+        setattr_(self, "attribute_vars", attribute_vars)
+        setattr_(self, "text_var", self._find_var(mode=FindMode.TEXT))
+        setattr_(self, "wildcard_var", wildcard_vars[0] if wildcard_vars else None)
+        setattr_(self, "attributes_var", self._find_var(mode=FindMode.ATTRIBUTES))
+        setattr_(self, "wildcard_vars", wildcard_vars)
+        setattr_(self, "wildcard_cache", {})
 
     @property
     def element_form(self) -> FormType:
@@ -232,6 +277,33 @@ class XmlMeta:
             else FormType.QUALIFIED
         )
 
+    def find_element(self, qname: str) -> Optional[XmlVar]:
+        """
+        Find the field that can bind the child element with the given
+        qualified name.
+
+        Explicit element and text fields have priority over wildcards.
+        """
+        var = self.element_vars.get(qname)
+        return var if var else self.find_wildcard(qname)
+
+    def find_attribute(self, qname: str) -> Optional[XmlVar]:
+        """Find the attribute field with the given qualified name."""
+        return self.attribute_vars.get(qname)
+
+    def find_wildcard(self, qname: str) -> Optional[XmlVar]:
+        """
+        Find the first wildcard field that matches the given qualified name.
+
+        The lookup process is cached.
+        """
+        if qname not in self.wildcard_cache:
+            self.wildcard_cache[qname] = next(
+                (var for var in self.wildcard_vars if var.matches(qname)), None
+            )
+
+        return self.wildcard_cache[qname]
+
     def find_var(
         self, qname: QName = QNames.ALL, mode: FindMode = FindMode.ALL
     ) -> Optional[XmlVar]:
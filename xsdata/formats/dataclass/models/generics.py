@@ -5,11 +5,9 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-from lxml.etree import QName
-from lxml.etree import register_namespace
-
 from xsdata.formats.dataclass.models.constants import XmlType
 from xsdata.models.enums import Namespace
+from xsdata.utils.compat import QName
 
 
 @dataclass
@@ -113,12 +111,16 @@ class Namespaces:
 
     def register(self):
         """Register the current namespaces map to lxml global registry."""
+        from lxml.etree import register_namespace
+
         for prefix, uri in self.ns_map.items():
             if prefix and not prefix.startswith("ns"):
                 register_namespace(prefix, uri)
 
     def unregister(self):
         """Remove from lxml global registry the current namespaces map."""
+        from lxml.etree import register_namespace
+
         for prefix, uri in self.ns_map.items():
             if prefix and not prefix.startswith("ns") and not Namespace.get_enum(uri):
                 register_namespace(prefix, "")
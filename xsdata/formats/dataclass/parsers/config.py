@@ -1,4 +1,84 @@
 from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
+from xsdata.formats.dataclass.parsers.handlers import XmlHandler
+
+
+@dataclass
+class Projection:
+    """
+    The selection of the fields to bind, the rest are left to their
+    defaults and their elements are skipped.
+
+    :param fields: Field name to the projection of the field's own fields,
+        None selects the field with all of its descendants.
+    :param predicate: Select the fields of every level that satisfy the
+        given callable instead.
+    """
+
+    fields: Dict[str, Optional["Projection"]] = field(default_factory=dict)
+    predicate: Optional[Callable[[XmlVar], bool]] = None
+
+    @classmethod
+    def create(cls, selection: Any) -> "Projection":
+        """
+        Create a projection from a collection of dotted field name paths,
+        e.g. ``{"ship_to.name", "item"}`` or a predicate callable.
+
+        :raises ValueError: If a path is empty
+        """
+        if isinstance(selection, Projection):
+            return selection
+
+        if callable(selection):
+            return cls(predicate=selection)
+
+        result = cls()
+        for path in selection:
+            result.add(path.split("."))
+
+        return result
+
+    def add(self, names: Iterable[str]):
+        """Select the given field names path."""
+        names = list(names)
+        if not all(names):
+            raise ValueError(f"Invalid projection path: `{'.'.join(names)}`")
+
+        current = self
+        for name in names[:-1]:
+            if name not in current.fields:
+                current.fields[name] = Projection()
+
+            subset = current.fields[name]
+            if subset is None:
+                return
+
+            current = subset
+
+        current.fields[names[-1]] = None
+
+    def includes(self, var: XmlVar) -> bool:
+        """Return whether the given field is selected."""
+        if self.predicate:
+            return self.predicate(var)
+
+        return var.name in self.fields
+
+    def subset(self, var: XmlVar) -> Optional["Projection"]:
+        """Return the projection of the given selected field's own fields or
+        None if all of them are selected."""
+        if self.predicate:
+            return self
+
+        return self.fields[var.name]
 
 
 @dataclass
@@ -7,6 +87,16 @@ class ParserConfig:
     Parsing configuration.
 
     :param fail_on_unknown_properties: Skip unknown properties or fail with exception.
+    :param handler: The xml parsing engine.
+    :param projection: Bind only the selected child element fields, a
+        collection of dotted field name paths from the root class or a
+        predicate over the fields metadata, see :class:`Projection`.
     """
 
     fail_on_unknown_properties: bool = True
+    handler: XmlHandler = field(default_factory=LxmlEventHandler)
+    projection: Optional[Projection] = None
+
+    def __post_init__(self):
+        if self.projection is not None:
+            self.projection = Projection.create(self.projection)
@@ -0,0 +1,466 @@
+import abc
+from collections import deque
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xml.parsers import expat
+
+from xsdata.exceptions import ParserError
+from xsdata.models.enums import EventType
+from xsdata.utils.compat import Element
+
+EventsIterator = Iterator[Tuple[str, Any]]
+EventsList = List[Tuple[str, Any]]
+NS_SEPARATOR = "}"
+JUNK_AFTER_ROOT = expat.errors.codes[expat.errors.XML_ERROR_JUNK_AFTER_DOC_ELEMENT]
+NO_ELEMENTS = expat.errors.codes[expat.errors.XML_ERROR_NO_ELEMENTS]
+
+
+class XmlHandler(metaclass=abc.ABCMeta):
+    """
+    Abstract xml parsing engine.
+
+    The handlers generate the start, end and start-ns event stream in the same
+    format as lxml's iterparse, the xml parser consumes the stream to bind the
+    document to the target class.
+    """
+
+    @abc.abstractmethod
+    def events(self, source: BinaryIO) -> EventsIterator:
+        """Parse the input stream and yield the event/element tuples."""
+
+    @abc.abstractmethod
+    def push_parser(self) -> "PushParser":
+        """Create a new push parser that generates the same events from input
+        fed in chunks."""
+
+    def release(self, element: Any):
+        """Release the given parsed element and its previous siblings, if the
+        handler builds a document tree."""
+        return
+
+
+class LxmlEventHandler(XmlHandler):
+    """Event handler based on lxml's iterparse."""
+
+    def events(self, source: BinaryIO) -> EventsIterator:
+        """Yield the lxml iterparse start, end and start-ns events."""
+        from lxml.etree import iterparse
+
+        return iterparse(
+            source=source,
+            events=(EventType.START, EventType.END, EventType.START_NS),
+            recover=True,
+            remove_comments=True,
+        )
+
+    def push_parser(self) -> "PushParser":
+        return LxmlPushParser()
+
+    def release(self, element: Element):
+        """Remove the given element and its previous siblings from the
+        document tree."""
+        parent = element.getparent()
+        if parent is None:
+            return
+
+        while element.getprevious() is not None:
+            del parent[0]
+
+        parent.remove(element)
+
+
+class SaxElement:
+    """
+    Lightweight element used by the sax handlers instead of lxml elements.
+
+    The element only holds a reference to its parent, once an element is
+    parsed and cleared it's free to be garbage collected. The element's
+    namespace map is resolved lazily from the new namespace declarations and
+    the parent namespace map.
+
+    :param tag: qualified name in clark notation
+    :param attrib: attributes dictionary
+    :param ns_decl: the namespaces declared by this element
+    :param parent: parent element
+    """
+
+    __slots__ = ("tag", "attrib", "text", "tail", "ns_decl", "parent", "_nsmap")
+
+    sourceline: Optional[int] = None
+
+    def __init__(
+        self,
+        tag: str,
+        attrib: Dict,
+        ns_decl: Optional[Dict],
+        parent: Optional["SaxElement"],
+    ):
+        self.tag = tag
+        self.attrib = attrib
+        self.text: Optional[str] = None
+        self.tail: Optional[str] = None
+        self.ns_decl = ns_decl
+        self.parent = parent
+        self._nsmap: Optional[Dict] = None
+
+    @property
+    def nsmap(self) -> Dict:
+        """Return a copy of the prefix to namespace map in scope."""
+        return dict(self.scoped_nsmap())
+
+    def scoped_nsmap(self) -> Dict:
+        """Resolve and cache the prefix to namespace map in scope, elements
+        without new declarations share the parent map."""
+        if self._nsmap is None:
+            nsmap = self.parent.scoped_nsmap() if self.parent else {}
+            if self.ns_decl:
+                nsmap = dict(nsmap)
+                for prefix, uri in self.ns_decl.items():
+                    nsmap[prefix or None] = uri
+
+            self._nsmap = nsmap
+
+        return self._nsmap
+
+    def getparent(self) -> Optional["SaxElement"]:
+        """Return the parent element."""
+        return self.parent
+
+    def clear(self):
+        """Drop the attributes and text content."""
+        self.attrib = {}
+        self.text = None
+        self.tail = None
+
+
+class SaxTarget:
+    """
+    Lxml parser target that records the start, end and start-ns events with
+    sax elements.
+
+    Character data is accumulated in a buffer and assigned as text or tail
+    content on the next event. End events are held back until the closed
+    element's tail content is complete.
+
+    :param events: the recorded events
+    :param element: the current open element
+    :param pending: the last closed element waiting for its tail content
+    :param buffer: the character data buffer
+    """
+
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+        self.element: Optional[SaxElement] = None
+        self.pending: Optional[SaxElement] = None
+        self.buffer: List[str] = []
+
+    def start(self, tag: str, attrib: Dict, nsmap: Optional[Dict] = None):
+        self.flush()
+        self.element = SaxElement(tag, dict(attrib), nsmap, self.element)
+        self.events.append((EventType.START, self.element))
+
+    def end(self, tag: str):
+        self.flush()
+        self.pending = self.element
+        self.element = self.element.parent if self.element else None
+
+    def data(self, data: str):
+        self.buffer.append(data)
+
+    def start_ns(self, prefix: str, uri: str):
+        self.flush()
+        self.events.append((EventType.START_NS, (prefix, uri)))
+
+    def close(self):
+        self.flush()
+
+    def pop_events(self) -> List[Tuple[str, Any]]:
+        """Return and clear the recorded events."""
+        events = self.events
+        self.events = []
+        return events
+
+    def flush(self):
+        """Assign the buffered character data and record the pending end
+        event."""
+        if self.buffer:
+            content = "".join(self.buffer)
+            self.buffer.clear()
+
+            if self.pending:
+                self.pending.tail = content
+            elif self.element:
+                self.element.text = content
+
+        if self.pending:
+            self.events.append((EventType.END, self.pending))
+            self.pending = None
+
+
+class LxmlSaxHandler(XmlHandler):
+    """
+    Event handler based on the lxml parser target interface.
+
+    The input is fed to the parser in chunks and lxml never builds the
+    document tree. The elements are :class:`SaxElement` instances, they don't
+    keep track of the source line numbers.
+
+    :param chunk_size: the size of the input chunks in bytes
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        self.chunk_size = chunk_size
+
+    def events(self, source: BinaryIO) -> EventsIterator:
+        """Feed the input stream to a target parser and yield the recorded
+        events after every chunk."""
+        return read_events(source, self.push_parser(), self.chunk_size)
+
+    def push_parser(self) -> "PushParser":
+        return LxmlTargetPushParser()
+
+
+class XmlSaxHandler(XmlHandler):
+    """
+    Event handler based on the python standard library expat parser.
+
+    The input is fed to the parser in chunks, the elements are
+    :class:`SaxElement` instances. Unlike the lxml handlers malformed
+    documents are not recovered.
+
+    :param chunk_size: the size of the input chunks in bytes
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        self.chunk_size = chunk_size
+
+    def events(self, source: BinaryIO) -> EventsIterator:
+        """
+        Feed the input stream to an expat parser and yield the recorded
+        events after every chunk.
+
+        :raises ParserError: When the input is not well formed
+        """
+        return read_events(source, self.push_parser(), self.chunk_size)
+
+    def push_parser(self) -> "PushParser":
+        return ExpatPushParser()
+
+
+class PushParser(metaclass=abc.ABCMeta):
+    """Incremental parser that generates the handler events from input fed
+    in chunks."""
+
+    @abc.abstractmethod
+    def feed(self, data: bytes) -> EventsList:
+        """Feed the next input chunk and return the complete events."""
+
+    @abc.abstractmethod
+    def close(self) -> EventsList:
+        """Finish parsing and return the remaining events."""
+
+
+class LxmlPushParser(PushParser):
+    """
+    Push parser based on lxml's pull parser.
+
+    The last end event of every chunk is held back until the next chunk,
+    the element's tail content might be incomplete.
+    """
+
+    def __init__(self):
+        from lxml.etree import XMLPullParser
+
+        self.parser = XMLPullParser(
+            events=(EventType.START, EventType.END, EventType.START_NS),
+            recover=True,
+            remove_comments=True,
+        )
+        self.pending: EventsList = []
+        self.empty = True
+
+    def feed(self, data: bytes) -> EventsList:
+        if data:
+            self.empty = False
+            self.parser.feed(data)
+
+        events = self.pending
+        events.extend(self.parser.read_events())
+        if events and events[-1][0] == EventType.END:
+            self.pending = [events.pop()]
+        else:
+            self.pending = []
+
+        return events
+
+    def close(self) -> EventsList:
+        events = self.pending
+        self.pending = []
+        if not self.empty:
+            self.parser.close()
+            events.extend(self.parser.read_events())
+
+        return events
+
+
+class LxmlTargetPushParser(PushParser):
+    """Push parser based on the lxml parser target interface."""
+
+    def __init__(self):
+        from lxml.etree import XMLParser
+
+        self.target = SaxTarget()
+        self.parser = XMLParser(target=self.target, recover=True, remove_comments=True)
+        self.empty = True
+
+    def feed(self, data: bytes) -> EventsList:
+        if data:
+            self.empty = False
+            self.parser.feed(data)
+
+        return self.target.pop_events()
+
+    def close(self) -> EventsList:
+        if not self.empty:
+            self.parser.close()
+
+        return self.target.pop_events()
+
+
+class ExpatPushParser(PushParser):
+    """
+    Push parser based on the python standard library expat parser.
+
+    :raises ParserError: When the input is not well formed
+    """
+
+    def __init__(self):
+        self.target = SaxTarget()
+        self.ns_decl: Dict = {}
+        self.tags: Dict[str, str] = {}
+
+        self.parser = expat.ParserCreate(namespace_separator=NS_SEPARATOR)
+        self.parser.buffer_text = True
+        self.parser.StartNamespaceDeclHandler = self.start_ns
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.target.end
+        self.parser.CharacterDataHandler = self.target.data
+
+    def feed(self, data: bytes) -> EventsList:
+        self.parse(data, False)
+        return self.target.pop_events()
+
+    def close(self) -> EventsList:
+        self.parse(b"", True)
+        self.target.close()
+        return self.target.pop_events()
+
+    def parse(self, data: bytes, is_final: bool):
+        try:
+            self.parser.Parse(data, is_final)
+        except expat.ExpatError as e:
+            raise ParserError(f"Parsing failed: {e}")
+
+    def start_ns(self, prefix: Optional[str], uri: str):
+        prefix = prefix or ""
+        self.ns_decl[prefix] = uri
+        self.target.start_ns(prefix, uri)
+
+    def start(self, name: str, attrs: Dict):
+        attrib = {self.clark(key): value for key, value in attrs.items()}
+        ns_decl = dict(self.ns_decl) if self.ns_decl else None
+        self.target.start(self.clark(name), attrib, ns_decl)
+        self.ns_decl.clear()
+
+    def clark(self, name: str) -> str:
+        """Convert the expat namespace separated name to clark notation."""
+        if name not in self.tags:
+            self.tags[name] = f"{{{name}" if NS_SEPARATOR in name else name
+        return self.tags[name]
+
+
+def read_events(
+    source: BinaryIO, parser: PushParser, chunk_size: int
+) -> EventsIterator:
+    """Feed the input stream to the given push parser in chunks and yield the
+    events after every chunk."""
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+
+        yield from parser.feed(chunk)
+
+    yield from parser.close()
+
+
+def split_documents(source: BinaryIO, chunk_size: int) -> Iterator[List[bytes]]:
+    """
+    Split the input stream of concatenated xml documents and yield the input
+    chunks of every document.
+
+    A bare expat parser without any handlers scans the input, the next
+    document starts where the parser finds content after the root element
+    of the current one. Only the chunks across the documents boundaries are
+    sliced, trailing whitespace, comments and processing instructions are
+    ignored.
+
+    :raises ParserError: When a document is not well formed
+    """
+    parser = expat.ParserCreate()
+    parts: List[bytes] = []
+    pending: deque = deque()
+
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+
+        pending.append(chunk)
+        while pending:
+            data = pending.popleft()
+            parts.append(data)
+            try:
+                parser.Parse(data, False)
+            except expat.ExpatError as e:
+                if e.code != JUNK_AFTER_ROOT:
+                    raise ParserError(f"Parsing failed: {e}")
+
+                head, tail = split_parts(parts, parser.ErrorByteIndex)
+                yield head
+
+                pending.extendleft(reversed(tail))
+                parser = expat.ParserCreate()
+                parts = []
+
+    try:
+        parser.Parse(b"", True)
+    except expat.ExpatError as e:
+        if e.code == NO_ELEMENTS:
+            return
+
+        raise ParserError(f"Parsing failed: {e}")
+
+    yield parts
+
+
+def split_parts(parts: List[bytes], position: int) -> Tuple[List[bytes], List[bytes]]:
+    """Split the given list of input chunks at the given byte position."""
+    for index, part in enumerate(parts):
+        if position < len(part):
+            head = parts[:index]
+            tail = parts[index:]
+            tail[0] = part[position:]
+            if position:
+                head.append(part[:position])
+
+            return head, tail
+
+        position -= len(part)
+
+    return parts, []
@@ -1,94 +1,266 @@
-import io
+import functools
 import json
+from collections import defaultdict
 from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
+from typing import cast
 from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.bindings import AbstractParser
+from xsdata.formats.converters import return_value
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class JsonField:
+    """
+    Json decode plan entry of a dataclass field.
+
+    :param var: the field metadata
+    :param name: the field name
+    :param local_name: the field local name if the key is the field name,
+        the local name key takes precedence
+    :param clazz: the dataclass type of the object values, wildcard object
+        values are bound to generic elements
+    :param decode: the callable to bind the rest of the values, None if
+        they are bound as they are
+    :param is_list: wrap single values to lists
+    :param is_wildcard: text values are bound as they are
+    :param projected: the field is subject to the parser projection
+    :param shared: the next field bound to the same json key
+    """
+
+    var: XmlVar
+    name: str
+    local_name: Optional[str]
+    clazz: Optional[Type]
+    decode: Optional[Callable[[Any], Any]]
+    is_list: bool
+    is_wildcard: bool
+    projected: bool
+    shared: Optional["JsonField"] = None
+
+    @classmethod
+    def create(cls, var: XmlVar, alias: bool) -> "JsonField":
+        """Create the plan entry of the given field and precompute the
+        value decoder."""
+        decode: Optional[Callable[[Any], Any]] = None
+        if var.is_attributes:
+            decode = dict
+        elif var.is_wildcard or var.converter is return_value:
+            decode = None
+        elif var.converter and not var.is_tokens:
+            decode = functools.partial(var.converter, ns_map=None)
+        else:
+            decode = functools.partial(ParserUtils.parse_var, var)
+
+        return cls(
+            var=var,
+            name=var.name,
+            local_name=var.qname.localname if alias else None,
+            clazz=var.clazz or (AnyElement if var.is_wildcard else None),
+            decode=decode,
+            is_list=var.is_list,
+            is_wildcard=var.is_wildcard,
+            projected=var.is_element or var.is_wildcard,
+        )
+
+
+JsonPlan = Dict[str, JsonField]
+JsonTask = Tuple[Any, Type, Optional[Projection], Any, Any]
+
+
 @dataclass
 class JsonParser(AbstractParser, XmlContext):
-    def parse(self, source: io.BytesIO, clazz: Type[T]) -> T:
+    """
+    Json parsing and binding for dataclasses.
+
+    :param config: Parser configuration, only the projection applies.
+    :param plans: Class to json decode plan cache.
+    """
+
+    config: ParserConfig = field(default_factory=ParserConfig)
+    plans: Dict[Type, JsonPlan] = field(init=False, default_factory=dict)
+
+    def __getstate__(self) -> Dict:
+        """Exclude the decode plans from the pickled state, they are
+        rebuilt along with the metadata cache."""
+        state = super().__getstate__()
+        state["plans"] = {}
+        return state
+
+    def reset(self):
+        """Clear the metadata cache and the decode plans."""
+        super().reset()
+        self.plans.clear()
+
+    def parse(self, source: BinaryIO, clazz: Type[T]) -> T:
         """Parse the JSON input stream and return the resulting object tree."""
         ctx = json.load(source)
         return self.parse_context(ctx, clazz)
 
+    def parse_lines(self, source: BinaryIO, clazz: Type[T]) -> Iterator[T]:
+        """
+        Parse the JSON Lines input stream lazily and yield the object of
+        every line, the blank lines are skipped.
+
+        :param source: A binary file-like object
+        :param clazz: The class of all the lines objects
+        """
+        for line in source:
+            if line.strip():
+                yield self.parse_context(json.loads(line), clazz)
+
+    def warm_up(self, clazz: Type):
+        """Build the metadata of the given class."""
+        self.build(clazz)
+
     def parse_context(self, data: Dict, clazz: Type[T]) -> T:
         """
-        Recursively build the given model from the input dict data.
+        Build the given model from the input dict data.
 
-        :raise TypeError: When parsing fails for any reason
+        :raise ParserError: When parsing fails for any reason
         """
-        params = {}
+        return self.bind_dataclass(data, clazz, self.config.projection)
 
-        if isinstance(data, list) and len(data) == 1:
-            data = data[0]
+    def plan(self, clazz: Type) -> JsonPlan:
+        """
+        Return the json key to field plan of the given class, the plan is
+        built once per class.
 
-        for var in self.build(clazz).vars:
-            value = self.get_value(data, var)
+        The fields are matched by their local name and then by their name,
+        the fields that share a key are chained in definition order and
+        all of them are bound to the key value.
+        """
+        if clazz not in self.plans:
+            entries: Dict[str, List[JsonField]] = defaultdict(list)
+            meta_vars = self.build(clazz).vars
+            for var in meta_vars:
+                entries[var.qname.localname].append(JsonField.create(var, False))
+            for var in meta_vars:
+                if var.name != var.qname.localname:
+                    entries[var.name].append(JsonField.create(var, True))
 
-            if value is None:
-                continue
-            elif var.is_list:
-                params[var.name] = [self.bind_value(var, val) for val in value]
-            else:
-                params[var.name] = self.bind_value(var, value)
+            result: JsonPlan = {}
+            for key, json_fields in entries.items():
+                shared = None
+                for json_field in reversed(json_fields):
+                    shared = replace(json_field, shared=shared)
+
+                result[key] = cast(JsonField, shared)
+
+            self.plans[clazz] = result
 
-        try:
-            return clazz(**params)  # type: ignore
-        except Exception:
-            raise ParserError("Parsing failed")
+        return self.plans[clazz]
 
-    def bind_value(self, var: XmlVar, value: Any) -> Any:
+    def bind_dataclass(
+        self, data: Dict, clazz: Type[T], projection: Optional[Projection]
+    ) -> T:
         """
-        Bind value according to the class var.
-
-        The return value can be:
-        - a dataclass instance
-        - a dictionary with unknown attributes
-        - a list of unknown elements
-        - an enumeration
-        - a primitive value
+        Build the given model from the input dict data, the element fields
+        outside the projection are left to their defaults.
+
+        The nested objects data are bound with an explicit stack, deeply
+        nested documents don't hit the recursion limit. The objects are
+        created in reverse order, the children before their parents, and
+        assigned to the placeholders of their parents params.
+
+        :raise ParserError: When parsing fails for any reason
         """
-        if var.dataclass and var.clazz:
-            return self.parse_context(value, var.clazz)
+        result: List = [None]
+        tasks: List[JsonTask] = [(data, clazz, projection, result, 0)]
+        objects: List[Tuple[Type, Dict, Any, Any]] = []
 
-        if var.is_attributes:
-            return dict(value)
+        while tasks:
+            data, clazz, projection, container, key = tasks.pop()
+            params: Dict = {}
+            objects.append((clazz, params, container, key))
+            self.bind_values(data, clazz, params, projection, tasks)
 
-        if var.is_wildcard:
-            return (
-                value
-                if isinstance(value, str)
-                else self.parse_context(value, AnyElement)
-            )
+        for clazz, params, container, key in reversed(objects):
+            try:
+                container[key] = clazz(**params)
+            except Exception:
+                raise ParserError("Parsing failed")
 
-        return ParserUtils.parse_value(
-            var.types, value, var.default, tokens=var.is_tokens
-        )
+        return result[0]
 
-    @staticmethod
-    def get_value(data: Dict, field: XmlVar) -> Any:
-        """Find the field value in the given dictionary or return the default
-        field value."""
-        if field.qname.localname in data:
-            value = data[field.qname.localname]
-        elif field.name in data:
-            value = data[field.name]
-        else:
-            return None
+    def bind_values(
+        self,
+        data: Dict,
+        clazz: Type,
+        params: Dict,
+        projection: Optional[Projection],
+        tasks: List[JsonTask],
+    ):
+        """
+        Bind the given input dict values to the params dictionary according
+        to the class plan.
+
+        The values that need to be bound to dataclasses are added to the
+        tasks list with the container and the key of their placeholder.
+        """
+        if isinstance(data, list) and len(data) == 1:
+            data = data[0]
+
+        plan = self.plans.get(clazz) or self.plan(clazz)
+        for key, value in data.items():
+            if value is None:
+                continue
+
+            next_field = plan.get(key)
+            while next_field is not None:
+                json_field, next_field = next_field, next_field.shared
+
+                local_name = json_field.local_name
+                if local_name is not None and local_name in data:
+                    continue
+
+                sub_projection = projection
+                if projection and json_field.projected:
+                    if not projection.includes(json_field.var):
+                        continue
 
-        if field.is_list and not isinstance(value, list):
-            value = [value]
+                    sub_projection = projection.subset(json_field.var)
 
-        return value
+                name = json_field.name
+                decode = json_field.decode
+                sub_clazz = json_field.clazz
+                if json_field.is_list:
+                    items: List = []
+                    params[name] = items
+                    for val in value if isinstance(value, list) else [value]:
+                        if sub_clazz and not (
+                            json_field.is_wildcard and isinstance(val, str)
+                        ):
+                            tasks.append(
+                                (val, sub_clazz, sub_projection, items, len(items))
+                            )
+                            items.append(None)
+                        else:
+                            items.append(decode(val) if decode else val)
+                elif sub_clazz and not (
+                    json_field.is_wildcard and isinstance(value, str)
+                ):
+                    tasks.append((value, sub_clazz, sub_projection, params, name))
+                    params[name] = None
+                else:
+                    params[name] = decode(value) if decode else value
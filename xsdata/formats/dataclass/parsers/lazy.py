@@ -0,0 +1,84 @@
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Optional
+from typing import Type
+
+LAZY_LOADER = "__xsdata_lazy_loader__"
+
+lazy_classes: Dict[Type, Optional[Type]] = {}
+
+
+def lazy_object(clazz: Type, loader: Callable[[], Any]) -> Optional[Any]:
+    """
+    Return an unbound instance of the given dataclass that calls the loader
+    on the first attribute access.
+
+    The instance belongs to a subclass of the given class with the same
+    name, so type and dataclass checks still work. When an attribute is
+    first accessed, the loader binds the real object, the instance takes
+    its field values and becomes an instance of the real object class.
+
+    Return None if the class instances can't be materialized in place,
+    e.g. slotted dataclasses.
+    """
+    lazy_clazz = lazy_class(clazz)
+    if lazy_clazz is None:
+        return None
+
+    obj = cast(Any, lazy_clazz).__new__(lazy_clazz)
+    object.__getattribute__(obj, "__dict__")[LAZY_LOADER] = loader
+    return obj
+
+
+def lazy_class(clazz: Type) -> Optional[Type]:
+    """Return the cached lazy subclass of the given class or None if the
+    class instances don't have a ``__dict__``."""
+    if clazz not in lazy_classes:
+        metaclass: Callable[..., Type] = type(clazz)
+        lazy_classes[clazz] = (
+            metaclass(
+                clazz.__name__,
+                (clazz,),
+                {
+                    "__module__": clazz.__module__,
+                    "__qualname__": clazz.__qualname__,
+                    "__getattribute__": lazy_getattribute,
+                    "__setattr__": lazy_setattr,
+                    "__delattr__": lazy_delattr,
+                },
+            )
+            if clazz.__dictoffset__
+            else None
+        )
+
+    return lazy_classes[clazz]
+
+
+def materialize(obj: Any):
+    """Bind the given lazy object in place, if it's still unbound."""
+    state = object.__getattribute__(obj, "__dict__")
+    loader = state.get(LAZY_LOADER)
+    if loader is None:
+        return
+
+    result = loader()
+    del state[LAZY_LOADER]
+    state.update(result.__dict__)
+    object.__setattr__(obj, "__class__", type(result))
+
+
+def lazy_getattribute(self: Any, name: str) -> Any:
+    materialize(self)
+    return getattr(self, name)
+
+
+def lazy_setattr(self: Any, name: str, value: Any):
+    materialize(self)
+    setattr(self, name, value)
+
+
+def lazy_delattr(self: Any, name: str):
+    materialize(self)
+    delattr(self, name)
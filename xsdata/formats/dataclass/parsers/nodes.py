@@ -1,19 +1,22 @@
+import functools
 from dataclasses import dataclass
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
-from lxml.etree import Element
-from lxml.etree import QName
-
 from xsdata.exceptions import XmlContextError
 from xsdata.formats.dataclass.context import XmlContext
-from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
+from xsdata.formats.dataclass.parsers.lazy import lazy_object
 from xsdata.formats.dataclass.parsers.utils import ParserUtils
+from xsdata.utils.compat import Element
+from xsdata.utils.compat import QName
 
 
 @dataclass(frozen=True)
@@ -60,10 +63,13 @@ class ElementNode(XmlNode):
 
     :param meta: xml metadata of a dataclass model.
     :param config: Parser config instance passed down from the root node.
+    :param projection: The selection of the child element fields to bind,
+        None binds all of them.
     """
 
     meta: XmlMeta
     config: ParserConfig
+    projection: Optional[Projection] = None
 
     def parse_element(self, element: Element, objects: List[Any]) -> Tuple:
         """
@@ -78,10 +84,9 @@ class ElementNode(XmlNode):
         ParserUtils.bind_element_children(params, self.meta, self.position, objects)
         ParserUtils.bind_element_wild_text(params, self.meta, element)
 
-        qname = QName(element.tag)
         obj = self.meta.clazz(**params)
 
-        return qname, obj
+        return element.tag, obj
 
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
         """
@@ -90,25 +95,33 @@ class ElementNode(XmlNode):
         Search by the given element tag for a matching variable and create the next
         node by the variable type.
 
+        Elements of fields outside the node projection are skipped.
+
         :return: The next node to be queued.
         :raises: XmlContextError if the element is unknown and parser config is strict.
         """
-        qname = QName(element.tag)
-        var = self.meta.find_var(qname, FindMode.NOT_WILDCARD)
-        if not var:
-            var = self.meta.find_var(qname, FindMode.WILDCARD)
+        var = self.meta.find_element(element.tag)
 
         if not var:
             if self.config.fail_on_unknown_properties:
                 raise XmlContextError(
-                    f"{self.meta.qname} does not support mixed content: {qname}"
+                    f"{self.meta.qname} does not support mixed content: {element.tag}"
                 )
             return SkipNode(position=position)
 
+        projection = self.projection
+        if projection:
+            if not projection.includes(var):
+                return SkipNode(position=position)
+
+            projection = projection.subset(var)
+
         if var.clazz:
             xsi_type = ParserUtils.parse_xsi_type(element)
             meta = ctx.fetch(var.clazz, self.meta.qname.namespace, xsi_type)
-            return ElementNode(position=position, meta=meta, config=self.config)
+            return ElementNode(
+                position=position, meta=meta, config=self.config, projection=projection,
+            )
 
         if var.is_any_type:
             return WildcardNode(position=position, qname=var.qname)
@@ -173,14 +186,10 @@ class PrimitiveNode(XmlNode):
 
         :return: A tuple of the object's qualified name and the new object.
         """
-        qname = QName(element.tag)
-        value = element.text
-        ns_map = element.nsmap
-        obj = ParserUtils.parse_value(
-            self.var.types, value, self.var.default, ns_map, self.var.is_tokens
-        )
+        ns_map = ParserUtils.element_ns_map(self.var, element)
+        obj = ParserUtils.parse_var(self.var, element.text, ns_map)
 
-        return qname, obj
+        return element.tag, obj
 
     def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
         raise XmlContextError("Primitive node doesn't support child nodes!")
@@ -201,3 +210,38 @@ class SkipNode(XmlNode):
 
     def parse_element(self, element: Element, objects: List[Any]) -> Tuple:
         return None, None
+
+
+@dataclass(frozen=True)
+class LazyNode(XmlNode):
+    """
+    This node is used by the lazy parser for dataclass elements, the parser
+    skips their children and the elements are bound on the first attribute
+    access of the resulting objects.
+
+    :param meta: xml metadata of a dataclass model.
+    :param bind: Callable to bind an element with the given metadata and
+        projection.
+    :param projection: The selection of the child element fields to bind.
+    """
+
+    meta: XmlMeta
+    bind: Callable[[Element, XmlMeta, Optional[Projection]], Any]
+    projection: Optional[Projection] = None
+
+    def next_node(self, element: Element, position: int, ctx: XmlContext) -> XmlNode:
+        return SkipNode(position=position)
+
+    def parse_element(self, element: Element, objects: List[Any]) -> Tuple:
+        """
+        Return an unbound object that binds the element on first access.
+
+        Classes without instance dictionaries, e.g. slotted dataclasses,
+        are bound immediately.
+
+        :return: A tuple of the object's qualified name and the new object.
+        """
+        loader = functools.partial(self.bind, element, self.meta, self.projection)
+        obj = lazy_object(self.meta.clazz, loader)
+
+        return element.tag, obj if obj is not None else loader()
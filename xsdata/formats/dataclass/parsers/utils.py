@@ -5,19 +5,18 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
-
-from lxml.etree import Element
-from lxml.etree import QName
+from typing import Union
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.converters import to_python
-from xsdata.formats.dataclass.models.elements import FindMode
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.logger import logger
 from xsdata.models.enums import QNames
 from xsdata.utils import text
+from xsdata.utils.compat import Element
+from xsdata.utils.compat import QName
 
 
 class ParserUtils:
@@ -51,6 +50,37 @@ class ParserUtils:
 
         return to_python(types, value, ns_map)
 
+    @classmethod
+    def parse_var(cls, var: XmlVar, value: Any, ns_map: Optional[Dict] = None) -> Any:
+        """Convert xml string values to the field type with the precompiled
+        field converter."""
+
+        if value is None:
+            return None if callable(var.default) else var.default
+
+        convert = var.converter
+        if convert is None:
+            return cls.parse_value(var.types, value, var.default, ns_map, var.is_tokens)
+
+        if var.is_tokens:
+            value = value if isinstance(value, list) else filter(None, value.split(" "))
+            return [convert(val, ns_map) for val in value]
+
+        return convert(value, ns_map)
+
+    @classmethod
+    def element_ns_map(cls, var: XmlVar, element: Element) -> Optional[Dict]:
+        """
+        Return the element prefix-namespace map if the field values need it.
+
+        Building the map walks all the element ancestors, fields with
+        precompiled converters only need it for qualified name values.
+        """
+        if var.converter is None or var.needs_ns_map:
+            return element.nsmap
+
+        return None
+
     @classmethod
     def bind_element_children(
         cls, params: Dict, meta: XmlMeta, position: int, objects: List,
@@ -58,11 +88,11 @@ class ParserUtils:
         """Return a dictionary of qualified object names and their values for
         the given queue item."""
 
-        while len(objects) > position:
-            qname, value = objects.pop(position)
-            arg = meta.find_var(qname, FindMode.NOT_WILDCARD) or meta.find_var(
-                qname, FindMode.WILDCARD
-            )
+        children = objects[position:]
+        del objects[position:]
+
+        for qname, value in children:
+            arg = meta.find_element(qname)
 
             if not arg:
                 raise ParserError("Impossible exception!")
@@ -74,7 +104,10 @@ class ParserUtils:
                 value = ""
 
             if not cls.bind_element_param(params, arg, value):
-                lookup = QName(value.qname) if isinstance(value, AnyElement) else qname
+                lookup: Union[str, QName] = qname
+                if isinstance(value, AnyElement) and value.qname:
+                    lookup = value.qname
+
                 wild = cls.find_eligible_wildcard(meta, lookup, params)
 
                 if not wild:
@@ -84,11 +117,9 @@ class ParserUtils:
 
     @classmethod
     def fetch_any_children(cls, position: int, objects: List) -> List[object]:
-        """Fetch the children of a wildcard node."""
-        children = []
-        while len(objects) > position:
-            _, value = objects.pop(position)
-            children.append(value)
+        """Fetch and remove the children of a wildcard node."""
+        children = [value for _, value in objects[position:]]
+        del objects[position:]
         return children
 
     @classmethod
@@ -113,7 +144,7 @@ class ParserUtils:
 
     @classmethod
     def bind_element_wildcard_param(
-        cls, params: Dict, var: XmlVar, qname: QName, value: Any
+        cls, params: Dict, var: XmlVar, qname: str, value: Any
     ):
         """
         Add the given value to the params dictionary with the wildcard var name
@@ -122,12 +153,20 @@ class ParserUtils:
         If the key is already present wrap the previous value into a
         generic AnyElement instance. If the previous value is already a
         generic instance add the current value as a child object.
+
+        Dataclasses without a ``__dict__`` or a ``qname`` slot can't hold
+        the element name, the serializer falls back to their metadata.
         """
         if is_dataclass(value):
             if not isinstance(value, AnyElement):
-                value.qname = qname
+                try:
+                    value.qname = QName(qname)
+                except AttributeError:
+                    logger.warning(
+                        "Unassigned element name %s of %s", qname, type(value).__name__
+                    )
         else:
-            value = AnyElement(qname=qname, text=value)
+            value = AnyElement(qname=QName(qname), text=value)
 
         if var.name in params:
             previous = params[var.name]
@@ -148,7 +187,7 @@ class ParserUtils:
         - var is present in the params assign the text and tail to the generic object.
         - Otherwise bind the given element to a new generic object.
         """
-        var = meta.find_var(mode=FindMode.WILDCARD)
+        var = meta.wildcard_var
         if not var:
             return
 
@@ -206,11 +245,10 @@ class ParserUtils:
     def bind_element_text(cls, params: Dict, metadata: XmlMeta, element: Element):
         """Add the given element's text content if any to the params dictionary
         with the text var name as key."""
-        var = metadata.find_var(mode=FindMode.TEXT)
+        var = metadata.text_var
         if var and element.text is not None and var.init:
-            params[var.name] = cls.parse_value(
-                var.types, element.text, var.default, element.nsmap, var.is_tokens
-            )
+            ns_map = cls.element_ns_map(var, element)
+            params[var.name] = cls.parse_var(var, element.text, ns_map)
 
     @classmethod
     def bind_element_attrs(cls, params: Dict, metadata: XmlMeta, element: Element):
@@ -221,15 +259,14 @@ class ParserUtils:
         if not element.attrib:
             return
 
-        wildcard = metadata.find_var(mode=FindMode.ATTRIBUTES)
+        wildcard = metadata.attributes_var
         for key, value in element.attrib.items():
-            var = metadata.find_var(QName(key), FindMode.ATTRIBUTE)
+            var = metadata.find_attribute(key)
 
             if var and var.name not in params:
                 if var.init:
-                    params[var.name] = cls.parse_value(
-                        var.types, value, var.default, element.nsmap, var.is_tokens
-                    )
+                    ns_map = cls.element_ns_map(var, element)
+                    params[var.name] = cls.parse_var(var, value, ns_map)
             elif wildcard:
                 if wildcard.name not in params:
                     params[wildcard.name] = {}
@@ -237,7 +274,7 @@ class ParserUtils:
 
     @classmethod
     def find_eligible_wildcard(
-        cls, meta: XmlMeta, qname: QName, params: Dict
+        cls, meta: XmlMeta, qname: Union[str, QName], params: Dict
     ) -> Optional[XmlVar]:
         """
         Last resort lookup for a suitable wildcard var.
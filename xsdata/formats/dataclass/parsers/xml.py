@@ -1,28 +1,42 @@
-import io
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import AsyncIterator
+from typing import BinaryIO
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
-
-from lxml.etree import Element
-from lxml.etree import iterparse
-from lxml.etree import QName
+from typing import Union
 
 from xsdata.exceptions import ParserError
 from xsdata.formats.bindings import AbstractParser
 from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.formats.dataclass.parsers.config import ParserConfig
+from xsdata.formats.dataclass.parsers.config import Projection
+from xsdata.formats.dataclass.parsers.handlers import EventsIterator
+from xsdata.formats.dataclass.parsers.handlers import PushParser
+from xsdata.formats.dataclass.parsers.handlers import split_documents
 from xsdata.formats.dataclass.parsers.json import T
+from xsdata.formats.dataclass.parsers.nodes import ElementNode
+from xsdata.formats.dataclass.parsers.nodes import LazyNode
 from xsdata.formats.dataclass.parsers.nodes import RootNode
+from xsdata.formats.dataclass.parsers.nodes import SkipNode
 from xsdata.formats.dataclass.parsers.nodes import XmlNode
 from xsdata.models.enums import EventType
 from xsdata.utils import text
+from xsdata.utils.compat import Element
+from xsdata.utils.compat import QName
+from xsdata.utils.namespaces import local_name
 
-ParsedObjects = List[Tuple[QName, Any]]
+ParsedObjects = List[Tuple[str, Any]]
 XmlNodes = List[XmlNode]
 
 
@@ -33,65 +47,264 @@ class XmlParser(AbstractParser):
 
     :param namespaces: Store the prefix/namespace as they are parsed.
     :param context: Model metadata builder
-    :param event_names: Cache for event names for each element
+    :param event_names: Deprecated, the hook methods are resolved per
+        parser class
     :param config: Parser configuration
+    :param subscriptions: Event and element qualified name to callbacks map
+    :param emit_events: The parser has any hooks or subscriptions
     """
 
     namespaces: Namespaces = field(init=False, default_factory=Namespaces)
     context: XmlContext = field(default_factory=XmlContext)
     event_names: Dict = field(default_factory=dict)
     config: ParserConfig = field(default_factory=ParserConfig)
+    subscriptions: Dict[Tuple[str, str], List[Callable]] = field(
+        init=False, default_factory=dict
+    )
+    emit_events: bool = field(init=False)
+
+    def __post_init__(self):
+        self.emit_events = self.has_hook_methods()
 
-    def parse(self, source: io.BytesIO, clazz: Type[T]) -> T:
+    def parse(self, source: BinaryIO, clazz: Type[T]) -> T:
         """Parse the XML input stream and return the resulting object tree."""
-        ctx = iterparse(
-            source=source,
-            events=(EventType.START, EventType.END, EventType.START_NS),
-            recover=True,
-            remove_comments=True,
-        )
+        ctx = self.config.handler.events(source)
         return self.parse_context(ctx, clazz)
 
-    def parse_context(self, context: iterparse, clazz: Type[T]) -> T:
+    def parse_context(self, context: EventsIterator, clazz: Type[T]) -> T:
         """
         Dispatch elements to handlers as they arrive and are fully parsed.
 
+        The descendants of skipped elements are ignored without creating any
+        nodes or emitting any events.
+
         :raises ParserError: When the requested type doesn't match the result object
         """
         obj = None
         meta = self.context.build(clazz)
         self.namespaces.clear()
         objects: ParsedObjects = []
-        queue: XmlNodes = [RootNode(position=0, meta=meta, config=self.config)]
+        queue: XmlNodes = [
+            RootNode(
+                position=0,
+                meta=meta,
+                config=self.config,
+                projection=self.config.projection,
+            )
+        ]
 
+        skip = 0
         for event, element in context:
             if event == EventType.START_NS:
                 self.add_namespace(element)
             if event == EventType.START:
-                self.queue(element, queue, objects)
+                if skip:
+                    skip += 1
+                elif isinstance(self.queue(element, queue, objects), SkipNode):
+                    skip = 1
             elif event == EventType.END:
-                obj = self.dequeue(element, queue, objects)
+                if skip > 1:
+                    skip -= 1
+                else:
+                    skip = 0
+                    obj = self.dequeue(element, queue, objects)
 
         if not obj:
             raise ParserError(f"Failed to create target class `{clazz.__name__}`")
 
         return obj
 
+    def warm_up(self, clazz: Type):
+        """Build the metadata of the given class."""
+        self.context.build(clazz)
+
+    def parse_lazy(self, source: Any, clazz: Type[T]) -> T:
+        """
+        Parse the XML input to a document tree and bind only the root
+        element.
+
+        The dataclass children objects are returned unbound, each one binds
+        its element the first time any of its attributes is accessed. The
+        document tree is kept in memory while there are unbound objects and
+        the event hooks are not called.
+
+        :param source: A file path or a binary file-like object
+        :param clazz: The root element class
+        """
+        from lxml.etree import parse
+        from lxml.etree import XMLParser
+
+        parser = XMLParser(recover=True, remove_comments=True)
+        root = parse(source, parser=parser).getroot()
+        if root is None:
+            raise ParserError(f"Failed to create target class `{clazz.__name__}`")
+
+        meta = self.context.build(clazz)
+        return self.bind_lazy(root, meta, self.config.projection)
+
+    def bind_lazy(
+        self, element: Element, meta: XmlMeta, projection: Optional[Projection]
+    ) -> Any:
+        """Bind the given element to the metadata class, the dataclass child
+        elements are queued as lazy nodes and their subtrees are skipped."""
+        objects: ParsedObjects = []
+        queue: XmlNodes = [
+            ElementNode(
+                position=0, meta=meta, config=self.config, projection=projection
+            )
+        ]
+        from lxml.etree import iterwalk
+
+        walker = iterwalk(element, events=(EventType.START, EventType.END))
+        next(walker)
+
+        obj = None
+        for event, child in walker:
+            if event == EventType.START:
+                item = queue[-1].next_node(child, len(objects), self.context)
+                if isinstance(item, ElementNode):
+                    item = LazyNode(
+                        position=item.position,
+                        meta=item.meta,
+                        bind=self.bind_lazy,
+                        projection=item.projection,
+                    )
+                if isinstance(item, (LazyNode, SkipNode)):
+                    walker.skip_subtree()
+
+                queue.append(item)
+            else:
+                qname, obj = queue.pop().parse_element(child, objects)
+                if qname:
+                    objects.append((qname, obj))
+
+        return obj
+
+    def iterparse(
+        self, source: Any, clazz: Type, path: Union[str, QName, Sequence]
+    ) -> Iterator[Any]:
+        """
+        Parse the XML input stream and yield the objects of the elements that
+        match the given path as soon as they are complete.
+
+        :param source: A binary file-like object
+        :param clazz: The root element class
+        :param path: The element qualified name or a sequence of the qualified
+            names of the element's closest ancestors and the element.
+        """
+        ctx = self.config.handler.events(source)
+        return self.iterparse_context(ctx, clazz, path)
+
+    def iterparse_context(
+        self, context: EventsIterator, clazz: Type, path: Union[str, QName, Sequence]
+    ) -> Iterator[Any]:
+        """
+        Dispatch elements to handlers as they arrive and yield the objects of
+        the elements that match the given path.
+
+        The yielded objects are never bound to their parent objects and
+        their elements are released from the handler's document tree, to keep
+        the memory usage flat regardless of the document size.
+        """
+        return XmlFeedParser(self, clazz, path).process(context)
+
+    def parse_documents(
+        self, source: BinaryIO, clazz: Type[T], chunk_size: int = 64 * 1024
+    ) -> Iterator[T]:
+        """
+        Parse the input stream of concatenated xml documents without a common
+        root and yield the object of every document as soon as it's complete.
+
+        The documents are fed to incremental parsers in the input chunks,
+        all of them share this parser's context and configuration.
+
+        :param source: A binary file-like object
+        :param clazz: The root element class of all the documents
+        :param chunk_size: The size of the input chunks in bytes
+        :raises ParserError: When a document is not well formed
+        """
+        for parts in split_documents(source, chunk_size):
+            feed = self.feed_parser(clazz)
+            for part in parts:
+                yield from feed.feed(part)
+
+            yield from feed.close()
+
+    def feed_parser(
+        self, clazz: Type, path: Union[None, str, QName, Sequence] = None
+    ) -> "XmlFeedParser":
+        """
+        Create an incremental parser for input that arrives in chunks.
+
+        :param clazz: The root element class
+        :param path: The path of the elements to return, see
+            :meth:`iterparse`, default: the root element
+        """
+        return XmlFeedParser(self, clazz, path)
+
+    async def parse_async(
+        self, stream: Any, clazz: Type[T], chunk_size: int = 64 * 1024
+    ) -> T:
+        """
+        Parse the input chunks as they arrive and return the resulting object
+        tree.
+
+        :param stream: An asyncio stream reader or an async iterator of bytes
+        :param clazz: The root element class
+        :param chunk_size: The size of the chunks to read from stream readers
+        """
+        feed = self.feed_parser(clazz)
+        result = []
+        async for chunk in read_chunks(stream, chunk_size):
+            result.extend(feed.feed(chunk))
+
+        result.extend(feed.close())
+        return result[0]
+
+    async def iterparse_async(
+        self,
+        stream: Any,
+        clazz: Type,
+        path: Union[str, QName, Sequence],
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[Any]:
+        """
+        Parse the input chunks as they arrive and yield the objects of the
+        elements that match the given path, see :meth:`iterparse`.
+
+        :param stream: An asyncio stream reader or an async iterator of bytes
+        :param clazz: The root element class
+        :param path: The path of the elements to yield
+        :param chunk_size: The size of the chunks to read from stream readers
+        """
+        feed = self.feed_parser(clazz, path)
+        async for chunk in read_chunks(stream, chunk_size):
+            for obj in feed.feed(chunk):
+                yield obj
+
+        for obj in feed.close():
+            yield obj
+
     def add_namespace(self, namespace: Tuple):
         """Add the given namespace in the registry."""
         prefix, uri = namespace
         self.namespaces.add(uri, prefix)
 
-    def queue(self, element: Element, queue: XmlNodes, objects: ParsedObjects):
-        """Queue the next xml node for parsing based on the given element
-        qualified name."""
+    def queue(
+        self, element: Element, queue: XmlNodes, objects: ParsedObjects
+    ) -> XmlNode:
+        """Queue and return the next xml node for parsing based on the given
+        element qualified name."""
         item = queue[-1]
         position = len(objects)
 
         queue_item = item.next_node(element, position, self.context)
 
         queue.append(queue_item)
-        self.emit_event(EventType.START, element.tag, item=item, element=element)
+        if self.emit_events:
+            self.emit_event(EventType.START, element.tag, item=item, element=element)
+
+        return queue_item
 
     def dequeue(self, element: Element, queue: XmlNodes, objects: ParsedObjects) -> Any:
         """
@@ -105,18 +318,197 @@ class XmlParser(AbstractParser):
 
         if qname:
             objects.append((qname, obj))
-            self.emit_event(EventType.END, element.tag, obj=obj, element=element)
+            if self.emit_events:
+                self.emit_event(EventType.END, element.tag, obj=obj, element=element)
 
         element.clear()
 
         return obj
 
+    def subscribe(self, event: str, qname: Union[str, QName], callback: Callable):
+        """
+        Register a callback for the start or end events of the elements with
+        the given qualified name.
+
+        The start callbacks receive the ``element`` and the parent node
+        ``item`` keyword arguments, the end callbacks receive the ``element``
+        and the bound ``obj``.
+        """
+        name = qname.text if isinstance(qname, QName) else QName(qname).text
+        key = (event, name)
+        self.subscriptions.setdefault(key, []).append(callback)
+        self.emit_events = True
+
     def emit_event(self, event: str, name: str, **kwargs: Any):
-        """Call if exist the parser's hook for the given element and event."""
+        """Call the parser's hook method for the given element and event and
+        then the subscribed callbacks in order."""
+        method = self.hook_method(event, name)
+        if method is not None:
+            method(self, **kwargs)
+
+        for callback in self.subscriptions.get((event, name), ()):
+            callback(**kwargs)
+
+    @classmethod
+    def hook_method(cls, event: str, name: str) -> Optional[Callable]:
+        """
+        Return the parser class method for the given element and event, the
+        methods are resolved once per parser class, event and element.
+
+        The methods are named after the event and the element local name
+        in snake case, e.g. ``end_complex_type``.
+        """
+        key = (cls, event, name)
+        if key not in hook_methods:
+            method = getattr(cls, f"{event}_{text.snake_case(local_name(name))}", None)
+            hook_methods[key] = method if callable(method) else None
+
+        return hook_methods[key]
+
+    @classmethod
+    def has_hook_methods(cls) -> bool:
+        """Return whether the parser class defines any start or end event
+        methods, the result is cached per class."""
+        if cls not in hook_classes:
+            prefixes = (f"{EventType.START}_", f"{EventType.END}_")
+            hook_classes[cls] = any(
+                name.startswith(prefixes) and callable(getattr(cls, name))
+                for name in dir(cls)
+            )
+
+        return hook_classes[cls]
+
+
+hook_classes: Dict[Type, bool] = {}
+hook_methods: Dict[Tuple[Type, str, str], Optional[Callable]] = {}
+
+
+class XmlFeedParser:
+    """
+    Incremental xml parser, the input is fed in chunks and the objects of
+    the elements that match the path are returned as soon as they are
+    complete.
+
+    The returned objects are never bound to their parent objects and their
+    elements are released from the handler's document tree. Without a path
+    the root object is returned, when the document is complete.
+
+    :param parser: The xml parser
+    :param clazz: The root element class
+    :param path: The element qualified name or a sequence of the qualified
+        names of the element's closest ancestors and the element.
+    :param complete: An object has been returned
+    :param skip: The depth of the current element in a skipped subtree
+    """
+
+    def __init__(
+        self,
+        parser: XmlParser,
+        clazz: Type,
+        path: Union[None, str, QName, Sequence] = None,
+    ):
+        meta = parser.context.build(clazz)
+        parser.namespaces.clear()
+
+        self.parser = parser
+        self.clazz = clazz
+        self.push: Optional[PushParser] = None
+        self.objects: ParsedObjects = []
+        self.queue: XmlNodes = [
+            RootNode(
+                position=0,
+                meta=meta,
+                config=parser.config,
+                projection=parser.config.projection,
+            )
+        ]
+        self.tags: List[str] = []
+        self.tag_path: Optional[List[str]] = None
+        self.complete = False
+        self.skip = 0
+
+        if path is not None:
+            paths = [path] if isinstance(path, (str, QName)) else path
+            self.tag_path = [
+                x.text if isinstance(x, QName) else QName(x).text for x in paths
+            ]
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Feed the next input chunk and return the complete objects."""
+        if self.push is None:
+            self.push = self.parser.config.handler.push_parser()
+
+        return list(self.process(self.push.feed(data)))
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing and return the remaining complete objects.
+
+        :raises ParserError: When the root object is requested and the
+            document is incomplete
+        """
+        events = self.push.close() if self.push else []
+        result = list(self.process(events))
+
+        if self.tag_path is None and not self.complete:
+            raise ParserError(f"Failed to create target class `{self.clazz.__name__}`")
+
+        return result
+
+    def process(self, events: Iterable[Tuple[str, Any]]) -> Iterator[Any]:
+        """Dispatch the given events to the parser and yield the objects of
+        the elements that match the path."""
+        parser = self.parser
+        queue = self.queue
+        objects = self.objects
+        tags = self.tags
+        tag_path = self.tag_path
+        depth = -len(tag_path) if tag_path else 0
+
+        for event, element in events:
+            if event == EventType.START_NS:
+                parser.add_namespace(element)
+            if event == EventType.START:
+                if self.skip:
+                    self.skip += 1
+                    continue
+
+                tags.append(element.tag)
+                if isinstance(parser.queue(element, queue, objects), SkipNode):
+                    self.skip = 1
+            elif event == EventType.END:
+                if self.skip > 1:
+                    self.skip -= 1
+                    continue
+
+                self.skip = 0
+                position = queue[-1].position
+                obj = parser.dequeue(element, queue, objects)
+
+                if tag_path is None:
+                    matches = len(tags) == 1
+                else:
+                    matches = tags[depth:] == tag_path
+
+                if matches and len(objects) > position:
+                    self.complete = True
+                    objects.pop()
+                    parser.config.handler.release(element)
+                    yield obj
+
+                tags.pop()
+
 
-        if name not in self.event_names:
-            self.event_names[name] = text.snake_case(QName(name).localname)
+async def read_chunks(stream: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Read the given asyncio stream reader in chunks or iterate the given
+    async iterator of bytes."""
+    if hasattr(stream, "read"):
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                break
 
-        method_name = f"{event}_{self.event_names[name]}"
-        if hasattr(self, method_name):
-            getattr(self, method_name)(**kwargs)
+            yield chunk
+    else:
+        async for chunk in stream:
+            yield chunk
@@ -1,6 +1,13 @@
 from xsdata.formats.dataclass.serializers.json import DictFactory
 from xsdata.formats.dataclass.serializers.json import DictSerializer
 from xsdata.formats.dataclass.serializers.json import JsonSerializer
+from xsdata.formats.dataclass.serializers.markup import XmlStringSerializer
 from xsdata.formats.dataclass.serializers.xml import XmlSerializer
 
-__all__ = ["JsonSerializer", "DictSerializer", "DictFactory", "XmlSerializer"]
+__all__ = [
+    "JsonSerializer",
+    "DictSerializer",
+    "DictFactory",
+    "XmlSerializer",
+    "XmlStringSerializer",
+]
@@ -0,0 +1,636 @@
+import abc
+import functools
+import io
+from typing import Any
+from typing import BinaryIO
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xml.etree import ElementTree
+
+from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.utils.compat import Element
+from xsdata.utils.compat import QName
+from xsdata.utils.namespaces import split_qname
+
+
+class XmlBackend(metaclass=abc.ABCMeta):
+    """
+    Abstract element tree backend of the xml serializer.
+
+    The elements must support the ``tag``, ``text``, ``tail`` properties and
+    the ``set`` and ``__len__`` methods.
+    """
+
+    @abc.abstractmethod
+    def create_element(self, qname: QName, namespaces: Namespaces) -> Any:
+        """Create the root element with the given qualified name."""
+
+    @abc.abstractmethod
+    def create_sub_element(self, parent: Any, qname: QName) -> Any:
+        """Create and append a new child element to the given parent."""
+
+    @abc.abstractmethod
+    def finalize(self, root: Any, namespaces: Namespaces):
+        """Post process the complete element tree."""
+
+    @abc.abstractmethod
+    def tostring(
+        self,
+        root: Any,
+        namespaces: Namespaces,
+        xml_declaration: bool,
+        encoding: str,
+        pretty_print: bool,
+    ) -> bytes:
+        """Convert the given element tree to encoded xml bytes."""
+
+    def render_children(self, element: Any, render: Callable, *args: Any):
+        """Render the content of the given new child element, right away by
+        default."""
+        render(element, *args)
+
+    def render_values(
+        self, parent: Any, values: Iterable, render: Callable, *args: Any
+    ):
+        """Render the child element values of a list or an iterable, right
+        away by default."""
+        for value in values:
+            render(parent, value, *args)
+
+
+class LxmlBackend(XmlBackend):
+    """
+    Xml serializer backend based on the lxml element tree.
+
+    lxml is imported when the backend is created, the sub element factory
+    is resolved once, it's called for every element.
+    """
+
+    def __init__(self):
+        from lxml.etree import SubElement
+
+        self.sub_element = SubElement
+
+    def create_element(self, qname: QName, namespaces: Namespaces) -> Element:
+        """Register the namespaces prefixes to the lxml registry and create
+        the root element."""
+        from lxml.etree import Element
+
+        namespaces.register()
+        return Element(qname, nsmap=namespaces.ns_map)
+
+    def create_sub_element(self, parent: Element, qname: QName) -> Element:
+        return self.sub_element(parent, qname)
+
+    def finalize(self, root: Element, namespaces: Namespaces):
+        """Move all the namespace declarations to the root element."""
+        from lxml.etree import cleanup_namespaces
+
+        cleanup_namespaces(
+            root, top_nsmap=namespaces.ns_map, keep_ns_prefixes=namespaces.prefixes
+        )
+
+    def tostring(
+        self,
+        root: Element,
+        namespaces: Namespaces,
+        xml_declaration: bool,
+        encoding: str,
+        pretty_print: bool,
+    ) -> bytes:
+        from lxml.etree import tostring
+
+        return cast(
+            bytes,
+            tostring(
+                root,
+                xml_declaration=xml_declaration,
+                encoding=encoding,
+                pretty_print=pretty_print,
+            ),
+        )
+
+
+class EtreeBackend(XmlBackend):
+    """
+    Xml serializer backend based on the python standard library element tree.
+
+    The stdlib serializer can't be instructed to use the namespace prefixes
+    of the given namespaces, the backend writes the tree itself following the
+    lxml conventions, all the namespaces are declared on the root element and
+    indentation is skipped for mixed content.
+    """
+
+    def create_element(
+        self, qname: QName, namespaces: Namespaces
+    ) -> ElementTree.Element:
+        return ElementTree.Element(qname.text)
+
+    def create_sub_element(
+        self, parent: ElementTree.Element, qname: QName
+    ) -> ElementTree.Element:
+        return ElementTree.SubElement(parent, str(qname))
+
+    def finalize(self, root: ElementTree.Element, namespaces: Namespaces):
+        pass
+
+    def tostring(
+        self,
+        root: ElementTree.Element,
+        namespaces: Namespaces,
+        xml_declaration: bool,
+        encoding: str,
+        pretty_print: bool,
+    ) -> bytes:
+        writer = EtreeWriter(namespaces.ns_map, pretty_print)
+        if xml_declaration:
+            writer.write(f"<?xml version='1.0' encoding='{encoding}'?>\n")
+
+        writer.write_root(root)
+        if pretty_print:
+            writer.write("\n")
+
+        return "".join(writer.output).encode(encoding, "xmlcharrefreplace")
+
+
+class EtreeWriter:
+    """
+    Serialize a stdlib element tree to a list of strings.
+
+    :param ns_map: prefix to namespace map
+    :param pretty_print: enable indentation
+    :param output: list of the generated strings
+    :param prefixes: namespace to prefix map
+    :param auto_ns: auto increment id for undeclared namespace prefixes
+    """
+
+    def __init__(self, ns_map: Dict, pretty_print: bool):
+        self.ns_map = ns_map
+        self.pretty_print = pretty_print
+        self.output: List[str] = []
+        self.prefixes: Dict[str, Optional[str]] = {}
+        self.auto_ns = 0
+
+        for prefix, uri in ns_map.items():
+            self.prefixes.setdefault(uri, prefix)
+
+    def write(self, value: str):
+        self.output.append(value)
+
+    def write_root(self, root: ElementTree.Element):
+        """Write the root element and declare the namespaces in use, prefixed
+        namespaces are always declared."""
+        declarations = {
+            prefix: uri
+            for prefix, uri in self.ns_map.items()
+            if prefix or self.default_namespace_in_use(root, uri)
+        }
+        self.write_element(root, declarations, {}, 0, self.pretty_print)
+
+    def write_element(
+        self,
+        element: ElementTree.Element,
+        declarations: Dict,
+        scope: Dict,
+        level: int,
+        indent: bool,
+    ):
+        """Recursively write the given element, its children and tail
+        content."""
+        scope = dict(scope)
+        tag = self.write_start(element, declarations, scope)
+
+        children = list(element)
+        if element.text is None and not children:
+            self.write("/>")
+        else:
+            self.write(">")
+            if element.text:
+                self.write(escape_text(element.text))
+
+            indent = (
+                indent
+                and not element.text
+                and all(child.tail is None for child in children)
+            )
+            for child in children:
+                if indent:
+                    self.write("\n" + "  " * (level + 1))
+                self.write_element(child, {}, scope, level + 1, indent)
+
+            if indent and children:
+                self.write("\n" + "  " * level)
+
+            self.write(f"</{tag}>")
+
+        if element.tail:
+            self.write(escape_text(element.tail))
+
+    def write_start(self, element: Any, declarations: Dict, scope: Dict) -> str:
+        """Write the start tag of the given element without the closing
+        bracket and return the prefixed tag, the local namespace declarations
+        are added to the given scope."""
+        local: Dict = {}
+        tag = self.qualify(element.tag, scope, local, False)
+        attrs = [
+            (self.qualify(key, scope, local, True), value)
+            for key, value in element.attrib.items()
+        ]
+
+        self.write(f"<{tag}")
+        for prefix, uri in declarations.items():
+            name = f"xmlns:{prefix}" if prefix else "xmlns"
+            self.write(f' {name}="{escape_attribute(uri)}"')
+        for prefix, uri in local.items():
+            self.write(f' xmlns:{prefix}="{escape_attribute(uri)}"')
+        for key, value in attrs:
+            self.write(f' {key}="{escape_attribute(value)}"')
+
+        return tag
+
+    def qualify(self, name: str, scope: Dict, local: Dict, attribute: bool) -> str:
+        """Return the prefixed name, namespaces missing from the root
+        declarations are declared locally."""
+        uri, localname = split_qname(str(name))
+        if not uri:
+            return localname
+
+        if uri in self.prefixes and (self.prefixes[uri] or not attribute):
+            prefix = self.prefixes[uri]
+        elif uri in scope:
+            prefix = scope[uri]
+        else:
+            prefix = self.new_prefix(uri)
+            scope[uri] = prefix
+            local[prefix] = uri
+
+        return f"{prefix}:{localname}" if prefix else localname
+
+    def new_prefix(self, uri: str) -> str:
+        """Return the prefix to declare locally for the given namespace."""
+        return self.next_prefix()
+
+    def next_prefix(self) -> str:
+        """Return the next auto increment prefix that is not already
+        declared."""
+        prefix = f"ns{self.auto_ns}"
+        self.auto_ns += 1
+        return self.next_prefix() if prefix in self.ns_map else prefix
+
+    @classmethod
+    def default_namespace_in_use(cls, root: ElementTree.Element, uri: str) -> bool:
+        """Return whether any element in the tree belongs to the given
+        namespace."""
+        prefix = f"{{{uri}}}"
+        return any(element.tag.startswith(prefix) for element in root.iter())
+
+
+class StreamElement:
+    """
+    Element of the streaming xml writer, the content is rendered right before
+    the element is written.
+
+    :param tag: qualified name in clark notation
+    :param text: text content
+    :param tail: tail content
+    :param attrib: attribute name to value map
+    :param children: child elements and deferred child values
+    :param content: the deferred content renderer
+    :param declarations: prefix to namespace map of the namespaces first seen
+        while rendering the content
+    """
+
+    __slots__ = ("tag", "text", "tail", "attrib", "children", "content", "declarations")
+
+    def __init__(self, tag: str, content: Optional[Callable] = None):
+        self.tag = tag
+        self.text: Optional[str] = None
+        self.tail: Optional[str] = None
+        self.attrib: Dict[str, str] = {}
+        self.children: List[Any] = []
+        self.content = content
+        self.declarations: Dict = {}
+
+    def set(self, key: Any, value: str):
+        self.attrib[str(key)] = value
+
+    def __len__(self) -> int:
+        return len(self.children)
+
+    def render(self):
+        """Render the deferred content once."""
+        if self.content:
+            content, self.content = self.content, None
+            content()
+
+
+class StreamValues:
+    """
+    Deferred child values of a list or an iterable, they are rendered one by
+    one while they are written.
+
+    :param tag: the parent element qualified name in clark notation
+    :param values: the child values iterator
+    :param render: the child value renderer
+    :param args: the renderer extra arguments
+    :param head: the rendered holder of the first value, if it was
+        rendered ahead
+    """
+
+    __slots__ = ("tag", "values", "render", "args", "head")
+
+    def __init__(self, tag: str, values: Iterable, render: Callable, args: Tuple):
+        self.tag = tag
+        self.values = iter(values)
+        self.render = render
+        self.args = args
+        self.head: Optional[StreamElement] = None
+
+    def first(self) -> Optional[StreamElement]:
+        """Render ahead and return the holder of the first value, or None if
+        there are no values."""
+        if self.head is None:
+            for value in self.values:
+                self.head = self.create(value)
+                break
+
+        return self.head
+
+    def create(self, value: Any) -> StreamElement:
+        """Render the given value in a new holder element of the parent
+        tag."""
+        holder = StreamElement(self.tag)
+        self.render(holder, value, *self.args)
+        return holder
+
+    def __iter__(self) -> Iterator[StreamElement]:
+        """Yield the rendered holder of every value."""
+        if self.head is not None:
+            head, self.head = self.head, None
+            yield head
+
+        for value in self.values:
+            yield self.create(value)
+
+
+class StreamBackend(XmlBackend):
+    """
+    Xml serializer backend of the streaming writer.
+
+    The content of the child elements and the child values of lists and
+    iterables are rendered on demand, while the elements are written.
+    """
+
+    def create_element(self, qname: QName, namespaces: Namespaces) -> StreamElement:
+        return StreamElement(str(qname))
+
+    def create_sub_element(self, parent: StreamElement, qname: QName) -> StreamElement:
+        element = StreamElement(str(qname))
+        parent.children.append(element)
+        return element
+
+    def finalize(self, root: StreamElement, namespaces: Namespaces):
+        pass
+
+    def tostring(
+        self,
+        root: StreamElement,
+        namespaces: Namespaces,
+        xml_declaration: bool,
+        encoding: str,
+        pretty_print: bool,
+    ) -> bytes:
+        target = io.BytesIO()
+        writer = XmlStreamWriter(target, namespaces, encoding, pretty_print)
+        writer.write_document(root, xml_declaration)
+        return target.getvalue()
+
+    def render_children(self, element: StreamElement, render: Callable, *args: Any):
+        """Defer the content of the given element until it's written."""
+        element.content = functools.partial(render, element, *args)
+
+    def render_values(
+        self, parent: StreamElement, values: Iterable, render: Callable, *args: Any
+    ):
+        """Defer the given child values until the parent content is
+        written."""
+        if not isinstance(values, list) or values:
+            parent.children.append(StreamValues(parent.tag, values, render, args))
+
+
+class XmlStreamWriter(EtreeWriter):
+    """
+    Incremental writer of stream element trees to a binary stream.
+
+    The elements are rendered right before they are written and released
+    right after, the output is encoded and written to the target in
+    chunks.
+
+    The child elements and the first of the deferred child values are
+    rendered ahead, the namespaces known by then are declared on the root
+    element, the rest on the element that introduces them.
+
+    :param target: the binary target stream
+    :param namespaces: the namespaces of the rendering
+    :param encoding: the output encoding
+    :param pretty_print: enable indentation
+    :param buffer_size: the number of strings to buffer before writing
+    """
+
+    def __init__(
+        self,
+        target: BinaryIO,
+        namespaces: Namespaces,
+        encoding: str,
+        pretty_print: bool,
+        buffer_size: int = 4096,
+    ):
+        super().__init__({}, pretty_print)
+        self.target = target
+        self.namespaces = namespaces
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+
+    def flush(self):
+        """Encode and write the buffered output to the target stream."""
+        if self.output:
+            data = "".join(self.output)
+            self.target.write(data.encode(self.encoding, "xmlcharrefreplace"))
+            self.output.clear()
+
+    def write_document(self, root: StreamElement, xml_declaration: bool):
+        """
+        Write the xml declaration, the root element and flush the output.
+
+        The root declares the prefixed namespaces known after rendering
+        ahead and the default namespace if the root belongs to it.
+        """
+        if xml_declaration:
+            self.write(f"<?xml version='1.0' encoding='{self.encoding}'?>\n")
+
+        self.render(root)
+        self.render_ahead(root.children)
+        root.declarations = {}
+        self.ns_map = self.namespaces.ns_map
+        uri = split_qname(root.tag)[0]
+        declarations = {
+            prefix: value
+            for prefix, value in self.ns_map.items()
+            if prefix or value == uri
+        }
+        for prefix, value in declarations.items():
+            self.prefixes.setdefault(value, prefix)
+
+        self.write_element(root, declarations, {}, 0, self.pretty_print)
+        if self.pretty_print:
+            self.write("\n")
+
+        self.flush()
+
+    def write_element(
+        self, element: Any, declarations: Dict, scope: Dict, level: int, indent: bool,
+    ):
+        """Render and write the given element, its children and tail content,
+        the children are released after they are written."""
+        self.render(element)
+        scope = dict(scope)
+        for prefix, uri in element.declarations.items():
+            if self.prefixes.get(uri) != prefix and scope.get(uri) != prefix:
+                declarations[prefix] = uri
+                scope[uri] = prefix
+
+        tag = self.write_start(element, declarations, scope)
+        children = element.children
+        if element.text is None and self.is_empty(children):
+            self.write("/>")
+        else:
+            self.write(">")
+            if element.text:
+                self.write(escape_text(element.text))
+
+            indent = indent and not element.text and self.is_element_only(children)
+            for index, child in enumerate(children):
+                children[index] = None
+                self.write_child(child, scope, level, indent)
+
+            if indent and children:
+                self.write("\n" + "  " * level)
+
+            self.write(f"</{tag}>")
+
+        if element.tail:
+            self.write(escape_text(element.tail))
+
+    def write_child(self, child: Any, scope: Dict, level: int, indent: bool):
+        """Write the given child element or the deferred child values and
+        flush the output if the buffer is full."""
+        if isinstance(child, StreamValues):
+            self.write_values(child, scope, level, indent)
+        else:
+            if indent:
+                self.write("\n" + "  " * (level + 1))
+            self.write_element(child, {}, scope, level + 1, indent)
+
+        if len(self.output) >= self.buffer_size:
+            self.flush()
+
+    def write_values(self, values: StreamValues, scope: Dict, level: int, indent: bool):
+        """Render and write the given deferred child values one by one, their
+        text content is written in place."""
+        for holder in values:
+            if holder.text:
+                self.write(escape_text(holder.text))
+
+            for child in holder.children:
+                self.write_child(child, scope, level, indent)
+
+            if holder.tail:
+                self.write(escape_text(holder.tail))
+
+    def render(self, element: StreamElement):
+        """Render the content of the given element and keep the prefixed
+        namespaces it introduced."""
+        ns_map = self.namespaces.ns_map
+        element.render()
+        if self.namespaces.ns_map is not ns_map:
+            element.declarations = {
+                prefix: uri
+                for prefix, uri in self.namespaces.ns_map.items()
+                if prefix and ns_map.get(prefix) != uri
+            }
+
+    def render_ahead(self, children: List):
+        """Render the given child elements and the first of the deferred
+        child values, recursively."""
+        for child in children:
+            if isinstance(child, StreamValues):
+                holder = child.first()
+                if holder is not None:
+                    self.render_ahead(holder.children)
+            else:
+                self.render(child)
+                self.render_ahead(child.children)
+
+    @classmethod
+    def is_empty(cls, children: List) -> bool:
+        """Return whether the given children are only deferred values
+        without any value."""
+        return all(
+            isinstance(child, StreamValues) and child.first() is None
+            for child in children
+        )
+
+    def is_element_only(self, children: List) -> bool:
+        """
+        Render the first child element and return whether it has no tail
+        content.
+
+        The rest of the children are assumed alike, they are rendered
+        right before they are written. Deferred values are rendered ahead
+        only for the first value.
+        """
+        for child in children:
+            if isinstance(child, StreamValues):
+                holder = child.first()
+                if holder is None:
+                    continue
+
+                if holder.text or holder.tail:
+                    return False
+
+                return self.is_element_only(holder.children)
+
+            self.render(child)
+            return child.tail is None
+
+        return True
+
+    def new_prefix(self, uri: str) -> str:
+        """Override parent to reuse the prefix of the rendering namespaces."""
+        return self.namespaces.prefix(uri) or self.next_prefix()
+
+
+def escape_text(value: str) -> str:
+    """Escape the special characters of text content."""
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\r", "&#13;")
+    )
+
+
+def escape_attribute(value: str) -> str:
+    """Escape the special characters and whitespace of attribute values."""
+    return (
+        escape_text(value)
+        .replace('"', "&quot;")
+        .replace("\n", "&#10;")
+        .replace("\t", "&#9;")
+    )
@@ -1,17 +1,25 @@
 import json
-from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import is_dataclass
 from decimal import Decimal
 from enum import Enum
+from operator import attrgetter
 from typing import Any
+from typing import BinaryIO
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
 
 from xsdata.formats.bindings import AbstractSerializer
+from xsdata.formats.bindings import BinarySerializer
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.utils.compat import QName
 
 
 def filter_none(x: Tuple) -> Dict:
@@ -39,40 +47,282 @@ class JsonEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+
+
+def compile_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """Return a callable that fetches the given attributes of an object as a
+    tuple."""
+    if len(names) > 1:
+        return attrgetter(*names)
+
+    if names:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+
+    return lambda obj: ()
+
+
+def encode_scalar(value: Any, encoder: json.JSONEncoder) -> Optional[str]:
+    """Return the json text of the given string, number, boolean or null
+    value or None for the rest of the values."""
+    if value is None:
+        return "null"
+
+    clazz = type(value)
+    if clazz is str or clazz is float:
+        return encoder.encode(value)
+    if clazz is int:
+        return int.__repr__(value)
+    if clazz is bool:
+        return "true" if value else "false"
+
+    return None
+
+
 @dataclass
-class DictSerializer(AbstractSerializer):
+class DictEncoder:
     """
-    Simple dictionary serializer with access to the dict factory.
+    Dataclass to primitive values encoder driven by the fields metadata.
 
     :param dict_factory: Override default dict factory to add further logic.
+    :param local_names: Use the fields xml local names as keys instead of
+        the fields names.
+    :param context: XmlContext instance.
+    :param accessors: Class to keys and compiled fields getter cache.
     """
 
     dict_factory: Callable = field(default=dict)
+    local_names: bool = field(default=False)
+    context: XmlContext = field(default_factory=XmlContext)
+    accessors: Dict[Type, Tuple[Tuple[str, ...], Callable]] = field(
+        init=False, default_factory=dict
+    )
+
+    def __getstate__(self) -> Dict:
+        """Exclude the compiled accessors from the pickled state."""
+        state = self.__dict__.copy()
+        state["accessors"] = {}
+        return state
+
+    def encode(self, obj: Any) -> Any:
+        """
+        Convert the given value to primitive values without copying them.
+
+        The dataclasses are converted to dictionaries with the dict
+        factory, lists and tuples to lists, enumerations to their values,
+        decimals to strings and qualified names to their text.
+        """
+        clazz = type(obj)
+        if clazz in PRIMITIVE_TYPES or obj is None:
+            return obj
+
+        accessor = self.accessors.get(clazz)
+        if accessor is None and is_dataclass(clazz):
+            accessor = self.accessor(clazz)
+
+        if accessor:
+            keys, getter = accessor
+            values = map(self.encode, getter(obj))
+            return self.dict_factory(list(zip(keys, values)))
+
+        if isinstance(obj, (list, tuple)):
+            return [self.encode(value) for value in obj]
+
+        if isinstance(obj, dict):
+            return {self.encode(key): self.encode(value) for key, value in obj.items()}
+
+        if isinstance(obj, Enum):
+            return self.encode(obj.value)
+
+        if isinstance(obj, Decimal):
+            return str(obj)
+
+        if isinstance(obj, QName):
+            return obj.text
+
+        return obj
+
+    def accessor(self, clazz: Type) -> Tuple[Tuple[str, ...], Callable]:
+        """Return the keys and the compiled fields getter of the given class,
+        the accessor is built once per class."""
+        if clazz not in self.accessors:
+            meta_vars = self.context.build(clazz).vars
+            keys = tuple(
+                var.qname.localname if self.local_names else var.name
+                for var in meta_vars
+            )
+            getter = compile_getter(tuple(var.name for var in meta_vars))
+            self.accessors[clazz] = (keys, getter)
+
+        return self.accessors[clazz]
+
+
+@dataclass
+class DictSerializer(AbstractSerializer, DictEncoder):
+    """
+    Simple dictionary serializer with access to the dict factory.
+
+    :param dict_factory: Override default dict factory to add further logic.
+    :param local_names: Use the fields xml local names as keys instead of
+        the fields names.
+    :param context: XmlContext instance.
+    """
 
     def render(self, obj: object) -> Dict:
         """Convert the given object tree to dictionary with primitive
         values."""
-        return asdict(obj, dict_factory=self.dict_factory)
+        return self.encode(obj)
 
 
 @dataclass
-class JsonSerializer(AbstractSerializer):
+class JsonSerializer(AbstractSerializer, BinarySerializer, DictEncoder):
     """
     Simple json.dumps wrapper.
 
     :param dict_factory: Callable to generate dictionary.
+    :param local_names: Use the fields xml local names as keys instead of
+        the fields names.
+    :param context: XmlContext instance.
     :param encoder: Value encoder.
     :param indent: output indentation.
     """
 
-    dict_factory: Callable = field(default=dict)
     encoder: Type[json.JSONEncoder] = field(default=JsonEncoder)
     indent: Optional[int] = field(default=None)
 
     def render(self, obj: object) -> str:
         """Convert the given object tree to json string."""
-        return json.dumps(
-            asdict(obj, dict_factory=self.dict_factory),
-            cls=self.encoder,
-            indent=self.indent,
-        )
+        return json.dumps(self.encode(obj), cls=self.encoder, indent=self.indent)
+
+    def write(self, obj: object, target: BinaryIO):
+        """
+        Convert the given object tree to json and write it to the binary
+        target stream incrementally.
+
+        The json text is encoded while the objects are walked, neither the
+        dictionary tree nor the json string is built in memory. The dict
+        factory receives the unencoded values of every object.
+        """
+        self.write_chunks(self.iterencode(obj), target)
+
+    def write_lines(self, objects: Iterable, target: BinaryIO):
+        """
+        Convert the given objects to json lines, one compact json document
+        per line, and write them to the binary target stream.
+
+        The objects are consumed lazily, only the output buffer is kept
+        in memory, the indentation doesn't apply.
+        """
+        encoder = self.encoder()
+        lines = (encoder.encode(self.encode(obj)) + "\n" for obj in objects)
+        self.write_chunks(lines, target)
+
+    def iterencode(self, obj: object) -> Iterator[str]:
+        """Encode the given object tree to json text chunks while walking it,
+        the joined chunks are equal to the :meth:`render` output."""
+        return self.iterencode_value(obj, self.encoder(), 0)
+
+    def iterencode_value(
+        self, obj: Any, encoder: json.JSONEncoder, level: int
+    ) -> Iterator[str]:
+        """Encode the given value to json text chunks, dataclasses, lists and
+        dictionaries are walked and the rest of the values are encoded as a
+        whole."""
+        clazz = type(obj)
+        accessor = self.accessors.get(clazz)
+        if accessor is None and is_dataclass(clazz):
+            accessor = self.accessor(clazz)
+
+        if accessor:
+            keys, getter = accessor
+            data = self.dict_factory(list(zip(keys, getter(obj))))
+            yield from self.iterencode_items(data.items(), encoder, level)
+        elif isinstance(obj, (list, tuple)):
+            yield from self.iterencode_list(obj, encoder, level)
+        elif isinstance(obj, dict):
+            items = ((self.encode(key), value) for key, value in obj.items())
+            yield from self.iterencode_items(items, encoder, level)
+        else:
+            yield encoder.encode(self.encode(obj))
+
+    def iterencode_items(
+        self, items: Iterable[Tuple[Any, Any]], encoder: json.JSONEncoder, level: int
+    ) -> Iterator[str]:
+        """Encode the given key-value pairs to json object text chunks, the
+        scalar values are joined with their keys in the same chunk."""
+        separator, newline, closing = self.separators(level)
+        parts = ["{", newline]
+        empty = True
+        for key, value in items:
+            if empty:
+                empty = False
+            else:
+                parts.append(separator)
+
+            if not isinstance(key, str):
+                key = json.dumps(key)
+
+            parts.append(encoder.encode(key))
+            parts.append(": ")
+            text = encode_scalar(value, encoder)
+            if text is None:
+                yield "".join(parts)
+                parts.clear()
+                yield from self.iterencode_value(value, encoder, level + 1)
+            else:
+                parts.append(text)
+
+        yield "{}" if empty else "".join(parts) + closing + "}"
+
+    def iterencode_list(
+        self, values: Iterable, encoder: json.JSONEncoder, level: int
+    ) -> Iterator[str]:
+        """Encode the given values to json array text chunks, consecutive
+        scalar values are joined in the same chunk."""
+        separator, newline, closing = self.separators(level)
+        parts = ["[", newline]
+        empty = True
+        for value in values:
+            if empty:
+                empty = False
+            else:
+                parts.append(separator)
+
+            text = encode_scalar(value, encoder)
+            if text is None:
+                yield "".join(parts)
+                parts.clear()
+                yield from self.iterencode_value(value, encoder, level + 1)
+            else:
+                parts.append(text)
+
+        yield "[]" if empty else "".join(parts) + closing + "]"
+
+    def separators(self, level: int) -> Tuple[str, str, str]:
+        """Return the items separator, the opening newline and the closing
+        newline of the given nesting level according to the indentation."""
+        if self.indent is None:
+            return ", ", "", ""
+
+        newline = "\n" + " " * (self.indent * (level + 1))
+        return "," + newline, newline, "\n" + " " * (self.indent * level)
+
+    @staticmethod
+    def write_chunks(
+        chunks: Iterable[str], target: BinaryIO, buffer_size: int = 64 * 1024
+    ):
+        """Write the text chunks utf-8 encoded to the binary target stream,
+        the chunks are joined up to the buffer size before writing."""
+        buffer: List[str] = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                target.write("".join(buffer).encode())
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            target.write("".join(buffer).encode())
@@ -0,0 +1,570 @@
+import functools
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import is_dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from xsdata.exceptions import SerializerError
+from xsdata.formats.converters import to_xml
+from xsdata.formats.dataclass.models.elements import XmlMeta
+from xsdata.formats.dataclass.models.elements import XmlVar
+from xsdata.formats.dataclass.models.generics import AnyElement
+from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.serializers.backends import escape_attribute
+from xsdata.formats.dataclass.serializers.backends import escape_text
+from xsdata.formats.dataclass.serializers.json import compile_getter
+from xsdata.formats.dataclass.serializers.xml import DEFAULT_NS_PREFIX
+from xsdata.formats.dataclass.serializers.xml import XmlSerializer
+from xsdata.models.enums import FormType
+from xsdata.models.enums import Namespace
+from xsdata.models.enums import QNames
+from xsdata.utils.compat import QName
+from xsdata.utils.namespaces import split_qname
+
+LEAF_TYPES = frozenset((str, int, float, bool, Decimal, QName))
+MISSING = object()
+
+
+def to_text(value: Any, namespaces: Namespaces) -> str:
+    """Convert the given value to xml text, integers are converted
+    directly."""
+    return str(value) if value.__class__ is int else to_xml(value, namespaces)
+
+
+class Indentation(str):
+    """Indentation of the pretty printed markup."""
+
+
+@functools.lru_cache(maxsize=1024)
+def indentation(level: int) -> Indentation:
+    """Return the indentation of the given element depth."""
+    return Indentation("\n" + "  " * level)
+
+
+@functools.lru_cache(maxsize=1024)
+def is_iterator(clazz: Type) -> bool:
+    """Return whether the given class is an iterator, the check is cached
+    per class."""
+    return issubclass(clazz, Iterator)
+
+
+@dataclass(frozen=True)
+class MarkupPlan:
+    """
+    Markup rendering plan of a dataclass.
+
+    :param vars: the fields metadata in definition order
+    :param handlers: the markup builder renderers of the fields
+    :param getter: the compiled fields getter, None if the fields need to be
+        rendered in sequential order
+    :param nillable: the class is nillable
+    """
+
+    vars: Tuple[XmlVar, ...]
+    handlers: Tuple[Callable, ...]
+    getter: Optional[Callable[[Any], Tuple]]
+    nillable: bool
+
+    @classmethod
+    def create(cls, meta: XmlMeta) -> "MarkupPlan":
+        """Create the rendering plan of the given class metadata."""
+        handlers = tuple(map(MarkupBuilder.handler, meta.vars))
+        sequential = any(var.sequential for var in meta.vars)
+        getter = compile_getter(tuple(var.name for var in meta.vars))
+        return cls(
+            vars=tuple(meta.vars),
+            handlers=handlers,
+            getter=None if sequential else getter,
+            nillable=meta.nillable,
+        )
+
+
+class MarkupElement:
+    """
+    Open element of the markup builder.
+
+    :param qname: the element qualified name
+    :param uri: the element namespace
+    :param index: the position of the start tag in the output
+    :param level: the element depth
+    :param attrib: qualified attribute name to value map
+    :param text: text content
+    :param tail: tail content
+    :param children: the number of child elements
+    :param mixed: any of the child elements has tail content
+    """
+
+    __slots__ = (
+        "qname",
+        "uri",
+        "index",
+        "level",
+        "attrib",
+        "text",
+        "tail",
+        "children",
+        "mixed",
+    )
+
+    def __init__(self, qname: Any, uri: Optional[str], index: int, level: int):
+        self.qname = qname
+        self.uri = uri
+        self.index = index
+        self.level = level
+        self.attrib: Dict[Any, str] = {}
+        self.text: Optional[str] = None
+        self.tail: Optional[str] = None
+        self.children = 0
+        self.mixed = False
+
+
+class MarkupBuilder:
+    """
+    Build the xml markup of a single object tree straight into a list of
+    strings, following the element tree semantics of the xml serializer.
+
+    The prefixed names are resolved when their elements are closed and the
+    root start tag is written last with the namespace declarations. If a
+    prefix changes afterwards or a namespace is still unknown the markup is
+    discarded.
+
+    :param serializer: the serializer of the rendering plans
+    :param namespaces: the namespaces of the rendering
+    :param pretty_print: enable indentation
+    :param output: the start tags, the content, the end tags and the
+        indentation of the elements
+    :param tags: qualified name to prefixed tag cache
+    :param names: qualified name to prefixed attribute name cache
+    :param used: namespace to prefix map of the prefixed names
+    :param elements: the namespaces of the elements
+    :param prefixes: namespace to prefix map of the final namespaces
+    :param consistent: all the prefixed names are resolved
+    """
+
+    def __init__(self, serializer: "XmlStringSerializer", namespaces: Namespaces):
+        self.serializer = serializer
+        self.namespaces = namespaces
+        self.pretty_print = serializer.pretty_print
+        self.output: List[Any] = []
+        self.tags: Dict[Any, str] = {}
+        self.names: Dict[Any, str] = {}
+        self.used: Dict[str, Optional[str]] = {}
+        self.elements: Set[str] = set()
+        self.prefixes: Dict[str, Optional[str]] = {}
+        self.consistent = True
+
+    def build(self, obj: Any, meta: XmlMeta) -> Optional[str]:
+        """
+        Render the given root object and return the markup or None if the
+        prefixes are inconsistent.
+
+        The root element declares the namespaces known before rendering
+        and then the rest, like the lxml backend after the namespaces
+        cleanup, the default namespace is declared only if it's in use.
+        """
+        initial = dict(self.namespaces.ns_map)
+        root = self.start(None, meta.qname, meta.qname.namespace)
+        self.render_node(root, obj)
+
+        ns_map = self.namespaces.ns_map
+        if any(ns_map[prefix] != uri for prefix, uri in initial.items()):
+            return None
+
+        if meta.qname not in self.tags:
+            self.tag(meta.qname)
+
+        items = list(initial.items())
+        items.extend(item for item in ns_map.items() if item[0] not in initial)
+        declarations = "".join(
+            f' xmlns:{prefix}="{escape_attribute(uri)}"'
+            if prefix
+            else f' xmlns="{escape_attribute(uri)}"'
+            for prefix, uri in items
+            if (prefix or uri in self.elements) and prefix != Namespace.XML.prefix
+        )
+        self.end(root, None, declarations)
+
+        for prefix, uri in ns_map.items():
+            self.prefixes.setdefault(uri, prefix)
+
+        if not self.consistent or any(
+            self.prefixes.get(uri, MISSING) != prefix
+            for uri, prefix in self.used.items()
+        ):
+            return None
+
+        return "".join(self.output)
+
+    def start(
+        self, parent: Optional[MarkupElement], qname: Any, uri: Optional[str]
+    ) -> MarkupElement:
+        """Open a new child element of the given parent, the start tag is
+        written when the element is closed."""
+        output = self.output
+        if parent is None:
+            level = 0
+        else:
+            parent.children += 1
+            level = parent.level + 1
+            if self.pretty_print:
+                output.append(indentation(level))
+
+        element = MarkupElement(qname, uri, len(output), level)
+        output.append("")
+        return element
+
+    def end(
+        self,
+        element: MarkupElement,
+        parent: Optional[MarkupElement],
+        declarations: str = "",
+    ):
+        """Close the given element and write its start tag, the indentation
+        of mixed content elements is removed."""
+        output = self.output
+        qname = element.qname
+        tag = self.tags.get(qname) or self.tag(qname)
+        if element.attrib:
+            names = self.names
+            for key, value in element.attrib.items():
+                name = names.get(key) or self.attribute_name(key)
+                declarations += f' {name}="{escape_attribute(value)}"'
+
+        text = element.text
+        if text is None and not element.children:
+            output[element.index] = f"<{tag}{declarations}/>"
+        else:
+            if text:
+                output[element.index] = f"<{tag}{declarations}>{escape_text(text)}"
+            else:
+                output[element.index] = f"<{tag}{declarations}>"
+
+            if self.pretty_print and element.children:
+                if text or element.mixed:
+                    self.flatten(element.index)
+                else:
+                    output.append(indentation(element.level))
+
+            output.append(f"</{tag}>")
+
+        if element.tail is not None:
+            output.append(escape_text(element.tail))
+            if parent is not None:
+                parent.mixed = True
+
+    def flatten(self, index: int):
+        """Remove the indentation after the given output position."""
+        output = self.output
+        for i in range(index, len(output)):
+            if output[i].__class__ is Indentation:
+                output[i] = ""
+
+    def tag(self, qname: Any) -> str:
+        """Qualify and cache the given element name."""
+        uri, tag = self.qualify(qname, False)
+        if uri:
+            self.elements.add(uri)
+
+        self.tags[qname] = tag
+        return tag
+
+    def attribute_name(self, qname: Any) -> str:
+        """Qualify and cache the given attribute name."""
+        name = self.names[qname] = self.qualify(qname, True)[1]
+        return name
+
+    def qualify(self, qname: Any, attribute: bool) -> Tuple[Optional[str], str]:
+        """Return the namespace and the prefixed name of the given qualified
+        name, the namespace must be already known and attributes can't use
+        the default namespace.
+
+        The prefix is the first one of the namespace in sorted order, it's
+        checked against the final namespaces map after rendering.
+        """
+        uri, localname = split_qname(qname if qname.__class__ is str else qname.text)
+        if not uri:
+            return None, localname
+
+        prefixes = self.namespaces.data.get(uri)
+        prefix = min(prefixes) or None if prefixes else None
+        if not prefixes or (attribute and not prefix):
+            self.consistent = False
+            prefix = None
+        elif self.used.setdefault(uri, prefix) != prefix:
+            self.consistent = False
+
+        return uri, f"{prefix}:{localname}" if prefix else localname
+
+    def render_node(self, element: MarkupElement, obj: Any):
+        """Render the given object content to the given element."""
+        clazz: Type = obj.__class__
+        plan = self.serializer.plans.get(clazz)
+        if plan is None and is_dataclass(clazz):
+            plan = self.serializer.plan(clazz, element.uri)
+
+        if plan is None:
+            self.set_text(element, obj)
+        elif plan.getter is not None:
+            for var, handler, value in zip(plan.vars, plan.handlers, plan.getter(obj)):
+                if value is not None:
+                    handler(self, element, value, var)
+
+            self.set_nil_attribute(element, plan.nillable)
+        else:
+            handlers = {var.name: h for var, h in zip(plan.vars, plan.handlers)}
+            meta = self.serializer.context.build(obj.__class__)
+            for var, value in self.serializer.next_value(meta, obj):
+                if value is not None:
+                    handlers[var.name](self, element, value, var)
+
+            self.set_nil_attribute(element, plan.nillable)
+
+    def render_attribute(self, element: MarkupElement, value: Any, var: XmlVar):
+        self.set_attribute(element, var.qname, value)
+
+    def render_attributes(self, element: MarkupElement, value: Any, var: XmlVar):
+        for key, val in value.items():
+            self.set_attribute(element, key, val)
+
+    def render_text(self, element: MarkupElement, value: Any, var: XmlVar):
+        self.namespaces.add(var.qname.namespace)
+        self.set_text(element, value)
+
+    def render_value(self, element: MarkupElement, value: Any, var: XmlVar):
+        if isinstance(value, list) or is_iterator(value.__class__):
+            for val in value:
+                self.render_sub_node(element, val, var)
+        else:
+            self.render_sub_node(element, value, var)
+
+    def render_leaf_value(self, element: MarkupElement, value: Any, var: XmlVar):
+        if isinstance(value, list) or is_iterator(value.__class__):
+            for val in value:
+                self.render_leaf(element, val, var)
+        else:
+            self.render_leaf(element, value, var)
+
+    def render_leaf(self, parent: MarkupElement, value: Any, var: XmlVar) -> None:
+        """Write a child element with simple content for the given parent in
+        one go, the rest of the values are rendered as usual."""
+        if value.__class__ not in LEAF_TYPES and not isinstance(value, Enum):
+            self.render_sub_node(parent, value, var)
+            return
+
+        qname = var.qname
+        tag = self.tags.get(qname)
+        if tag is None:
+            self.namespaces.add(qname.namespace)
+            tag = self.tag(qname)
+
+        parent.children += 1
+        output = self.output
+        if self.pretty_print:
+            output.append(indentation(parent.level + 1))
+
+        if value.__class__ is not str:
+            value = to_text(value, self.namespaces)
+
+        if value:
+            output.append(f"<{tag}>{escape_text(value)}</{tag}>")
+        elif var.nillable:
+            self.namespaces.add(Namespace.XSI.uri, Namespace.XSI.prefix)
+            name = self.names.get(QNames.XSI_NIL) or self.attribute_name(QNames.XSI_NIL)
+            output.append(f'<{tag} {name}="true"/>')
+        else:
+            output.append(f"<{tag}/>")
+
+    def render_sub_node(self, parent: MarkupElement, value: Any, var: XmlVar):
+        """Render a child element or text content for the given parent."""
+        if isinstance(value, AnyElement):
+            self.render_wildcard_node(parent, value, var)
+        elif var.is_element or is_dataclass(value):
+            self.render_element_node(parent, value, var)
+        elif not parent.text:
+            self.set_text(parent, value)
+        else:
+            self.set_tail(parent, value)
+
+    def render_element_node(self, parent: MarkupElement, value: Any, var: XmlVar):
+        """Render a child element for the given parent according to the field
+        xml metadata."""
+        if hasattr(value, "qname"):
+            qname = value.qname
+        elif var.is_wildcard:
+            meta = self.serializer.context.fetch(value.__class__, parent.uri)
+            qname = meta.qname
+        else:
+            qname = var.qname
+
+        if qname not in self.tags:
+            self.namespaces.add(qname.namespace)
+
+        element = self.start(parent, qname, qname.namespace)
+        self.render_node(element, value)
+        self.set_xsi_type(element, value, var)
+        self.set_nil_attribute(element, var.nillable)
+        self.end(element, parent)
+
+    def render_wildcard_node(
+        self, parent: MarkupElement, value: AnyElement, var: XmlVar
+    ):
+        """Render a generic element for the given parent, generic elements
+        without a qualified name are rendered in the parent."""
+        if value.qname:
+            uri = split_qname(str(value.qname))[0]
+            element = self.start(parent, value.qname, uri)
+            self.render_wildcard(element, value, var)
+            self.end(element, parent)
+        else:
+            self.render_wildcard(parent, value, var)
+
+    def render_wildcard(self, element: MarkupElement, value: AnyElement, var: XmlVar):
+        """Render the content of a generic element."""
+        self.namespaces.add_all(value.ns_map)
+        self.set_text(element, value.text)
+        self.set_tail(element, value.tail)
+        for key, val in value.attributes.items():
+            self.set_attribute(element, key, val)
+        for child in value.children:
+            self.render_sub_node(element, child, var)
+
+        self.set_nil_attribute(element, var.nillable)
+
+    def set_xsi_type(self, element: MarkupElement, value: Any, var: XmlVar):
+        """Set the element's xsi:type if the given value is a derived
+        instance."""
+        clazz = var.clazz
+        if not clazz or value.__class__ is clazz:
+            return
+
+        context = self.serializer.context
+        if context.is_derived(value, clazz):
+            meta = context.fetch(value.__class__, element.uri)
+            self.set_attribute(element, QNames.XSI_TYPE, meta.source_qname)
+        else:
+            raise SerializerError(
+                f"{value.__class__.__name__} is not derived from {clazz.__name__}"
+            )
+
+    def set_attribute(self, element: MarkupElement, key: Any, value: Any):
+        """Set the element attribute from the given key and value, empty
+        values are skipped."""
+        if key == QNames.XSI_NIL and (element.text or element.children):
+            return
+
+        if isinstance(key, QName):
+            self.namespaces.add(key.namespace)
+
+        if value.__class__ is not str:
+            value = to_text(value, self.namespaces)
+
+        if value:
+            element.attrib[key] = value
+
+    def set_nil_attribute(self, element: MarkupElement, nillable: bool):
+        """Set the element xsi:nil attribute if necessary."""
+        if nillable and element.text is None and not element.children:
+            self.namespaces.add(Namespace.XSI.uri, Namespace.XSI.prefix)
+            element.attrib[QNames.XSI_NIL] = "true"
+
+    def set_text(self, element: MarkupElement, value: Any):
+        """Set the element text content, empty values are skipped."""
+        if value.__class__ is not str:
+            value = to_text(value, self.namespaces)
+
+        element.text = value or None
+
+    def set_tail(self, element: MarkupElement, value: Any):
+        """Set the element tail content, empty values are skipped."""
+        if value.__class__ is not str:
+            value = to_text(value, self.namespaces)
+
+        element.tail = value or None
+
+    @classmethod
+    def handler(cls, var: XmlVar) -> Callable:
+        """Return the renderer of the given field values."""
+        if var.is_attribute:
+            return cls.render_attribute
+        if var.is_attributes:
+            return cls.render_attributes
+        if var.is_text:
+            return cls.render_text
+        if var.is_element and not var.dataclass:
+            return cls.render_leaf_value
+
+        return cls.render_value
+
+
+@dataclass
+class XmlStringSerializer(XmlSerializer):
+    """
+    Xml serializer for dataclasses that builds the markup as strings,
+    without an intermediate element tree.
+
+    The output is identical to the xml serializer, documents with prefixes
+    that change while rendering or with namespaces that need local
+    declarations are rendered by the element tree backend instead.
+
+    :param xml_declaration: Add xml declaration.
+    :param encoding: Result text encoding.
+    :param pretty_print: Enable pretty output.
+    :param context: XmlContext instance.
+    :param backend: The element tree backend of the fallback rendering.
+    :param plans: Class to markup rendering plan cache.
+    """
+
+    plans: Dict[Type, MarkupPlan] = field(init=False, default_factory=dict)
+
+    def __getstate__(self) -> Dict:
+        """Exclude the rendering plans from the pickled state."""
+        state = self.__dict__.copy()
+        state["plans"] = {}
+        return state
+
+    def render(self, obj: Any, namespaces: Optional[Namespaces] = None) -> str:
+        """
+        Convert the given object tree to xml string.
+
+        Optionally provide a namespaces instance with a predefined list
+        of namespace uris and prefixes.
+        """
+        namespaces = namespaces or Namespaces()
+        data = {uri: set(prefixes) for uri, prefixes in namespaces.data.items()}
+        auto_ns = namespaces.auto_ns
+
+        meta = self.context.build(obj.__class__)
+        prefix = DEFAULT_NS_PREFIX if meta.element_form == FormType.QUALIFIED else None
+        namespaces.add(meta.qname.namespace, prefix=prefix)
+        markup = MarkupBuilder(self, namespaces).build(obj, meta)
+        if markup is None:
+            namespaces.clear()
+            namespaces.data.update(data)
+            namespaces.auto_ns = auto_ns
+            return super().render(obj, namespaces)
+
+        if self.xml_declaration:
+            markup = f"<?xml version='1.0' encoding='{self.encoding}'?>\n{markup}"
+        if self.pretty_print:
+            markup += "\n"
+
+        return markup.encode(self.encoding, "xmlcharrefreplace").decode()
+
+    def plan(self, clazz: Type, parent_ns: Optional[str] = None) -> MarkupPlan:
+        """Return the rendering plan of the given class, the plan is built
+        once per class."""
+        if clazz not in self.plans:
+            meta = self.context.build(clazz, parent_ns)
+            self.plans[clazz] = MarkupPlan.create(meta)
+
+        return self.plans[clazz]
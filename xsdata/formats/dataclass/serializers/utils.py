@@ -1,12 +1,11 @@
 from typing import Any
 
-from lxml.etree import Element
-from lxml.etree import QName
-
 from xsdata.formats.converters import to_xml
 from xsdata.formats.dataclass.models.generics import Namespaces
 from xsdata.models.enums import Namespace
 from xsdata.models.enums import QNames
+from xsdata.utils.compat import Element
+from xsdata.utils.compat import QName
 
 
 class SerializeUtils:
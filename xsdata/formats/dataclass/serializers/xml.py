@@ -1,34 +1,37 @@
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import is_dataclass
+from dataclasses import replace
 from typing import Any
+from typing import BinaryIO
 from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 
-from lxml.etree import cleanup_namespaces
-from lxml.etree import Element
-from lxml.etree import QName
-from lxml.etree import SubElement
-from lxml.etree import tostring
-
 from xsdata.exceptions import SerializerError
 from xsdata.formats.bindings import AbstractSerializer
+from xsdata.formats.bindings import BinarySerializer
 from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.models.elements import XmlMeta
 from xsdata.formats.dataclass.models.elements import XmlVar
 from xsdata.formats.dataclass.models.generics import AnyElement
 from xsdata.formats.dataclass.models.generics import Namespaces
+from xsdata.formats.dataclass.serializers.backends import LxmlBackend
+from xsdata.formats.dataclass.serializers.backends import StreamBackend
+from xsdata.formats.dataclass.serializers.backends import XmlBackend
+from xsdata.formats.dataclass.serializers.backends import XmlStreamWriter
 from xsdata.formats.dataclass.serializers.utils import SerializeUtils
 from xsdata.models.enums import FormType
 from xsdata.models.enums import QNames
+from xsdata.utils.compat import Element
+from xsdata.utils.namespaces import target_uri
 
 DEFAULT_NS_PREFIX = ""
 
 
 @dataclass
-class XmlSerializer(AbstractSerializer):
+class XmlSerializer(AbstractSerializer, BinarySerializer):
     """
     Xml serialize for dataclasses.
 
@@ -36,12 +39,14 @@ class XmlSerializer(AbstractSerializer):
     :param encoding: Result text encoding.
     :param pretty_print: Enable pretty output.
     :param context: XmlContext instance.
+    :param backend: The element tree backend.
     """
 
     xml_declaration: bool = field(default=True)
     encoding: str = field(default="UTF-8")
     pretty_print: bool = field(default=False)
     context: XmlContext = field(default_factory=XmlContext)
+    backend: XmlBackend = field(default_factory=LxmlBackend)
 
     def render(self, obj: Any, namespaces: Optional[Namespaces] = None) -> str:
         """
@@ -50,14 +55,42 @@ class XmlSerializer(AbstractSerializer):
         Optionally provide a namespaces instance with a predefined list
         of namespace uris and prefixes.
         """
+        namespaces = namespaces or Namespaces()
         tree = self.render_tree(obj, namespaces)
-        return tostring(
+        return self.backend.tostring(
             tree,
+            namespaces,
             xml_declaration=self.xml_declaration,
             encoding=self.encoding,
             pretty_print=self.pretty_print,
         ).decode()
 
+    def write(
+        self, obj: Any, target: BinaryIO, namespaces: Optional[Namespaces] = None
+    ):
+        """
+        Convert the given object tree to xml and write it incrementally to
+        the binary target stream.
+
+        The elements are rendered right before they are written and the
+        output is encoded and written in chunks, no element tree or string
+        of the whole document is built, the backend doesn't apply. List
+        fields may also hold iterators of child values, e.g. generators of
+        records, which are consumed while they are written.
+
+        The child elements and the first value of every list or iterator
+        are rendered ahead, the namespaces found so far are declared on the
+        root element. The namespaces first seen in later values are declared
+        on every element that introduces them.
+
+        Optionally provide a namespaces instance with a predefined list
+        of namespace uris and prefixes.
+        """
+        namespaces = namespaces or Namespaces()
+        root = replace(self, backend=StreamBackend()).render_tree(obj, namespaces)
+        writer = XmlStreamWriter(target, namespaces, self.encoding, self.pretty_print)
+        writer.write_document(root, self.xml_declaration)
+
     def render_tree(self, obj: Any, namespaces: Optional[Namespaces] = None) -> Element:
         """
         Convert a dataclass instance to a nested Element structure.
@@ -67,15 +100,12 @@ class XmlSerializer(AbstractSerializer):
         """
         meta = self.context.build(obj.__class__)
         namespaces = namespaces or Namespaces()
-        namespaces.register()
         prefix = DEFAULT_NS_PREFIX if meta.element_form == FormType.QUALIFIED else None
         namespaces.add(meta.qname.namespace, prefix=prefix)
 
-        root = Element(meta.qname, nsmap=namespaces.ns_map)
+        root = self.backend.create_element(meta.qname, namespaces)
         self.render_node(root, obj, namespaces)
-        cleanup_namespaces(
-            root, top_nsmap=namespaces.ns_map, keep_ns_prefixes=namespaces.prefixes
-        )
+        self.backend.finalize(root, namespaces)
         return root
 
     def render_node(self, parent: Element, obj: Any, namespaces: Namespaces):
@@ -88,7 +118,7 @@ class XmlSerializer(AbstractSerializer):
     def render_complex_node(self, parent: Element, obj: Any, namespaces: Namespaces):
         """Iterate over the dataclass fields and values and create the element
         tree."""
-        meta = self.context.build(obj.__class__, QName(parent).namespace)
+        meta = self.context.build(obj.__class__, target_uri(parent.tag))
         for var, value in self.next_value(meta, obj):
             if value is None:
                 continue
@@ -101,6 +131,10 @@ class XmlSerializer(AbstractSerializer):
                 SerializeUtils.set_text(parent, value, namespaces)
             elif isinstance(value, list):
                 self.render_sub_nodes(parent, value, var, namespaces)
+            elif isinstance(value, Iterator):
+                self.backend.render_values(
+                    parent, value, self.render_sub_node, var, namespaces
+                )
             else:
                 self.render_sub_node(parent, value, var, namespaces)
 
@@ -110,9 +144,14 @@ class XmlSerializer(AbstractSerializer):
         self, parent: Element, values: List, var: XmlVar, namespaces: Namespaces
     ):
         """Iterate of a list of values to render the children of the given
-        parent element."""
-        for value in values:
-            self.render_sub_node(parent, value, var, namespaces)
+        parent element, the element values through the backend."""
+        if var.is_element:
+            self.backend.render_values(
+                parent, values, self.render_sub_node, var, namespaces
+            )
+        else:
+            for value in values:
+                self.render_sub_node(parent, value, var, namespaces)
 
     def render_sub_node(
         self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
@@ -135,27 +174,44 @@ class XmlSerializer(AbstractSerializer):
         if hasattr(value, "qname"):
             qname = value.qname
         elif var.is_wildcard:
-            meta = self.context.fetch(value.__class__, QName(parent).namespace)
+            meta = self.context.fetch(value.__class__, target_uri(parent.tag))
             qname = meta.qname
         else:
             qname = var.qname
 
         namespaces.add(qname.namespace)
-        sub_element = SubElement(parent, qname)
-        self.render_node(sub_element, value, namespaces)
-        self.set_xsi_type(sub_element, value, var, namespaces)
-        SerializeUtils.set_nil_attribute(sub_element, var.nillable, namespaces)
+        sub_element = self.backend.create_sub_element(parent, qname)
+        self.backend.render_children(
+            sub_element, self.render_element, value, var, namespaces
+        )
+
+    def render_element(
+        self, element: Element, value: Any, var: XmlVar, namespaces: Namespaces
+    ):
+        """Render the content of a child element according to the field xml
+        metadata."""
+        self.render_node(element, value, namespaces)
+        self.set_xsi_type(element, value, var, namespaces)
+        SerializeUtils.set_nil_attribute(element, var.nillable, namespaces)
 
     def render_wildcard_node(
         self, parent: Element, value: Any, var: XmlVar, namespaces: Namespaces
     ):
         """Render a child element for the given parent according to the
-        wildcard field metadata."""
+        wildcard field metadata, generic elements without a qualified name
+        are rendered in the parent."""
         if value.qname:
-            sub_element = SubElement(parent, value.qname)
+            sub_element = self.backend.create_sub_element(parent, value.qname)
+            self.backend.render_children(
+                sub_element, self.render_wildcard, value, var, namespaces
+            )
         else:
-            sub_element = parent
+            self.render_wildcard(parent, value, var, namespaces)
 
+    def render_wildcard(
+        self, sub_element: Element, value: Any, var: XmlVar, namespaces: Namespaces
+    ):
+        """Render the content of a generic element."""
         namespaces.add_all(value.ns_map)
         SerializeUtils.set_text(sub_element, value.text, namespaces)
         SerializeUtils.set_tail(sub_element, value.tail, namespaces)
@@ -174,7 +230,7 @@ class XmlSerializer(AbstractSerializer):
             return
 
         if self.context.is_derived(value, var.clazz):
-            meta = self.context.fetch(value.__class__, QName(parent.tag).namespace)
+            meta = self.context.fetch(value.__class__, target_uri(parent.tag))
             SerializeUtils.set_attribute(
                 parent, QNames.XSI_TYPE, meta.source_qname, namespaces
             )
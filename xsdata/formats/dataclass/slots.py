@@ -0,0 +1,85 @@
+import functools
+from dataclasses import fields
+from dataclasses import is_dataclass
+from dataclasses import MISSING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Set
+from typing import Type
+
+
+def slotted(clazz: Type) -> Type:
+    """
+    Recreate the given dataclass with slots for its own fields.
+
+    The instances don't carry a ``__dict__``, which considerably lowers
+    the memory footprint of large object trees. The fields defined in
+    the base classes are stored in the base classes slots, the field
+    defaults are kept in the dataclass fields metadata.
+
+    The dataclass constructor reads the defaults of the fields that are
+    excluded from the constructor arguments from the class attributes,
+    the constructor is wrapped to assign them to the instance slots.
+
+    The instances also get a ``qname`` slot, unless a base class has one,
+    the parsers keep there the element name of objects bound to wildcard
+    fields like they do for plain dataclasses.
+
+    It's the equivalent of ``dataclass(slots=True)`` for python < 3.10,
+    apply it above the dataclass decorator.
+    """
+    if not is_dataclass(clazz):
+        raise TypeError(f"Object {clazz} is not a dataclass.")
+
+    inherited = base_slots(clazz)
+    names = [var.name for var in fields(clazz)]
+
+    attrs = dict(clazz.__dict__)
+    slots = [name for name in names if name not in inherited]
+    if "qname" not in inherited and "qname" not in names:
+        slots.append("qname")
+
+    attrs["__slots__"] = tuple(slots)
+    for name in names:
+        attrs.pop(name, None)
+
+    attrs.pop("__dict__", None)
+    attrs.pop("__weakref__", None)
+
+    defaults = {
+        var.name: var.default
+        for var in fields(clazz)
+        if not var.init and var.default is not MISSING
+    }
+    if defaults:
+        attrs["__init__"] = init_defaults(clazz.__init__, defaults)
+
+    metaclass: Callable[..., Type] = type(clazz)
+    result = metaclass(clazz.__name__, clazz.__bases__, attrs)
+    result.__qualname__ = clazz.__qualname__
+    return result
+
+
+def init_defaults(init: Callable, defaults: Dict[str, Any]) -> Callable:
+    """Wrap the given constructor to assign the given field defaults before
+    the constructor is called."""
+
+    @functools.wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any):
+        for name, value in defaults.items():
+            object.__setattr__(self, name, value)
+
+        init(self, *args, **kwargs)
+
+    return __init__
+
+
+def base_slots(clazz: Type) -> Set[str]:
+    """Return the slot names of all the base classes of the given class."""
+    result: Set[str] = set()
+    for base in clazz.__mro__[1:]:
+        slots = base.__dict__.get("__slots__", ())
+        result.update((slots,) if isinstance(slots, str) else slots)
+
+    return result
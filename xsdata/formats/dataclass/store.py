@@ -0,0 +1,146 @@
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import is_dataclass
+from enum import Enum
+from importlib.util import source_hash
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from xsdata.logger import logger
+
+StoreKey = Tuple[str, str, Optional[str]]
+StoreDependencies = Tuple[Tuple[str, Optional[str]], ...]
+
+
+@dataclass
+class MetaStore:
+    """
+    Persistent storage of the xml context bind metadata.
+
+    The entries are keyed by the class module, qualified name and parent
+    namespace and they are invalidated automatically when the source of any
+    of the modules they depend on changes.
+
+    The storage is a pickle file, load only trusted files. The entries are
+    not aware of the context name generator, use a different storage for
+    each name generator.
+
+    :param path: The storage file path
+    :param entries: Entry key to dependencies and metadata map, the
+        dependencies are module name and source hash pairs
+    :param hashes: Module name to source hash cache of the current process
+    :param loaded: The storage file has been loaded
+    """
+
+    path: Path
+    entries: Dict[StoreKey, Tuple[StoreDependencies, Tuple]] = field(
+        init=False, default_factory=dict
+    )
+    hashes: Dict[str, Optional[str]] = field(init=False, default_factory=dict)
+    loaded: bool = field(init=False, default=False)
+
+    def get(self, clazz: Type, parent_ns: Optional[str]) -> Optional[Tuple]:
+        """Return the stored metadata of the given class and parent namespace
+        if it's still valid."""
+        self.load()
+
+        entry = self.entries.get(self.key(clazz, parent_ns))
+        if entry is None:
+            return None
+
+        dependencies, data = entry
+        return data if self.is_valid(dependencies) else None
+
+    def add(
+        self,
+        clazz: Type,
+        parent_ns: Optional[str],
+        dependencies: Iterable[str],
+        data: Tuple,
+    ):
+        """Add or replace the metadata of the given class and parent
+        namespace."""
+        modules = tuple(
+            (module, self.module_hash(module)) for module in sorted(set(dependencies))
+        )
+        self.entries[self.key(clazz, parent_ns)] = (modules, data)
+
+    def load(self):
+        """Load once the storage file if it exists."""
+        if self.loaded:
+            return
+
+        self.loaded = True
+        if not self.path.exists():
+            return
+
+        try:
+            with self.path.open("rb") as fp:
+                entries = dict(pickle.load(fp))
+        except Exception as e:
+            logger.warning("Failed to load metadata storage %s: %s", self.path, e)
+            return
+
+        for key, value in entries.items():
+            self.entries.setdefault(key, value)
+
+    def save(self):
+        """Write the valid entries to the storage file."""
+        self.load()
+        entries = {
+            key: entry for key, entry in self.entries.items() if self.is_valid(entry[0])
+        }
+
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as fp:
+            pickle.dump(entries, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+        tmp.replace(self.path)
+
+    def is_valid(self, dependencies: StoreDependencies) -> bool:
+        """Return whether the source hashes of the given module dependencies
+        are still the current ones."""
+        for module, value in dependencies:
+            if value is None or value != self.module_hash(module):
+                return False
+
+        return True
+
+    def module_hash(self, name: str) -> Optional[str]:
+        """Return the source hash of the given module or None if the module is
+        not loaded from a file."""
+        if name not in self.hashes:
+            module = sys.modules.get(name)
+            path = getattr(module, "__file__", None)
+            self.hashes[name] = (
+                source_hash(Path(path).read_bytes()).hex()
+                if path and os.path.isfile(path)
+                else None
+            )
+
+        return self.hashes[name]
+
+    @staticmethod
+    def key(clazz: Type, parent_ns: Optional[str]) -> StoreKey:
+        return clazz.__module__, clazz.__qualname__, parent_ns
+
+    @staticmethod
+    def dependencies(clazz: Type, types: Iterable[Any]) -> Iterable[str]:
+        """Return the modules the metadata of the given class depend on, the
+        class and base classes modules and the modules of the dataclass and
+        enumeration field types."""
+        for base in clazz.__mro__:
+            if base.__module__ != "builtins":
+                yield base.__module__
+
+        for tp in types:
+            if is_dataclass(tp) or (isinstance(tp, type) and issubclass(tp, Enum)):
+                yield tp.__module__
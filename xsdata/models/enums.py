@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Iterable
 from typing import Optional
 
-from lxml.etree import QName
+from xsdata.utils.compat import QName
 
 COMMON_SCHEMA_DIR = Path(__file__).absolute().parent.parent.joinpath("schemas/")
 
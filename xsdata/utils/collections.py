@@ -2,6 +2,8 @@ from collections import defaultdict
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -50,3 +52,17 @@ def find(items: Sequence, value: Any) -> int:
         return items.index(value)
     except ValueError:
         return -1
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Split the items of an iterable to lists of the given size, the last
+    list may be shorter."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
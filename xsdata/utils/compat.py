@@ -0,0 +1,73 @@
+import functools
+from typing import Any
+from typing import Optional
+
+from xsdata.utils.namespaces import split_qname
+
+try:
+    from lxml.etree import Element
+    from lxml.etree import QName
+except ImportError:
+    Element = Any  # type: ignore
+
+    @functools.total_ordering
+    class QName:  # type: ignore
+        """
+        Pure python equivalent of the lxml qualified name, used when lxml is
+        not installed.
+
+        :param text_or_uri_or_element: The qualified name in clark notation,
+            the namespace if the tag is given or an element
+        :param tag: The local name
+        """
+
+        __slots__ = ("text", "namespace", "localname")
+
+        def __init__(self, text_or_uri_or_element: Any, tag: Optional[str] = None):
+            value = text_or_uri_or_element
+            if isinstance(value, QName):
+                value = value.text
+            elif value is not None and not isinstance(value, str):
+                value = value.tag
+
+            if tag is not None:
+                namespace, localname = value or None, tag
+            elif value:
+                namespace, localname = split_qname(value)
+            else:
+                namespace, localname = None, ""
+
+            if not localname:
+                raise ValueError("Empty tag name")
+
+            self.namespace = namespace
+            self.localname = localname
+            self.text = f"{{{namespace}}}{localname}" if namespace else localname
+
+        def __str__(self) -> str:
+            return self.text
+
+        def __repr__(self) -> str:
+            return f"QName({self.text!r})"
+
+        def __hash__(self) -> int:
+            return hash(self.text)
+
+        def __eq__(self, other: Any) -> bool:
+            if isinstance(other, QName):
+                return self.text == other.text
+            if isinstance(other, str):
+                return self.text == other
+
+            return NotImplemented
+
+        def __lt__(self, other: Any) -> bool:
+            if isinstance(other, QName):
+                return self.text < other.text
+            if isinstance(other, str):
+                return self.text < other
+
+            return NotImplemented
+
+        def __reduce__(self) -> Any:
+            return QName, (self.text,)
@@ -0,0 +1,55 @@
+import bz2
+import functools
+import gzip
+import lzma
+import pathlib
+from typing import BinaryIO
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+SUFFIXES: Dict[str, Callable] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+# The legacy lzma container is detected automatically by the readers
+WRITERS: Dict[str, Callable] = {
+    **SUFFIXES,
+    ".lzma": functools.partial(lzma.open, format=lzma.FORMAT_ALONE),
+}
+
+SIGNATURES: Tuple[Tuple[bytes, Callable], ...] = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def open_path(path: pathlib.Path, mode: str = "rb") -> BinaryIO:
+    """
+    Open the given file path in binary mode, compressed files are
+    decompressed or compressed on the fly.
+
+    The reading codec is detected by the file signature or the path
+    suffix, the writing codec by the path suffix.
+    """
+    if "r" in mode:
+        codec = find_codec(path) or SUFFIXES.get(path.suffix.lower())
+    else:
+        codec = WRITERS.get(path.suffix.lower())
+
+    return codec(path, mode) if codec else cast(BinaryIO, path.open(mode))
+
+
+def find_codec(path: pathlib.Path) -> Optional[Callable]:
+    """Return the opener of the compression format of the given file by its
+    signature."""
+    with path.open("rb") as source:
+        head = source.read(6)
+
+    return next((codec for sign, codec in SIGNATURES if head.startswith(sign)), None)
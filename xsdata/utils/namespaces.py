@@ -0,0 +1,31 @@
+import functools
+from typing import Optional
+from typing import Tuple
+
+
+@functools.lru_cache(maxsize=4096)
+def split_qname(tag: str) -> Tuple[Optional[str], str]:
+    """
+    Split the given qualified name in clark notation to the namespace and
+    local name.
+
+    The runtime binding path sees the same element and attribute tags
+    over and over, the results are cached to avoid parsing them as lxml
+    qualified names.
+    """
+    if tag[0] == "{":
+        namespace, name = tag[1:].split("}", 1)
+        return namespace or None, name
+
+    return None, tag
+
+
+def target_uri(tag: str) -> Optional[str]:
+    """Return the namespace of the given qualified name in clark notation."""
+    return split_qname(tag)[0]
+
+
+def local_name(tag: str) -> str:
+    """Return the local name of the given qualified name in clark
+    notation."""
+    return split_qname(tag)[1]